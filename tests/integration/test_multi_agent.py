@@ -114,6 +114,159 @@ class TestMultiAgentCoordinator:
         # Should have link analysis task (for broken_link issue)
         assert any(t.assigned_to == AgentRole.LINK_ANALYSIS for t in tasks)
 
+    @pytest.mark.asyncio
+    async def test_orchestrator_context_without_audit_view(self, sample_audit_result):
+        """Test contexts that only implement the required protocol methods still work."""
+        # Arrange
+        from tinyseoai.agents.models import AgentTask, TaskPriority
+        from tinyseoai.agents.orchestrator import OrchestratorAgent
+
+        audit_data = sample_audit_result.model_dump()
+
+        class MinimalContext:
+            def get_audit_data(self):
+                return audit_data
+
+            def get_session_id(self):
+                return "session"
+
+            def send_message(self, from_role, to_role, content):
+                pass
+
+        orchestrator = OrchestratorAgent(context=MinimalContext(), api_key="test-key")
+        orchestrator.reason_with_chain_of_thought = AsyncMock(return_value={"plan": []})
+        task = AgentTask(
+            assigned_to=AgentRole.ORCHESTRATOR,
+            priority=TaskPriority.HIGH,
+            title="plan",
+            description="plan",
+        )
+
+        # Act
+        result = await orchestrator.execute_task(task)
+        tasks = orchestrator.create_task_distribution_plan(audit_data)
+
+        # Assert
+        assert result.success
+        assert any(t.assigned_to == AgentRole.TECHNICAL_SEO for t in tasks)
+        assert orchestrator._audit_view(audit_data) is orchestrator._audit_view(audit_data)
+
+    def test_scan_issues_aggregates(self, sample_audit_result):
+        """Test the single-pass issue scan used by the orchestrator."""
+        # Arrange
+        from tinyseoai.agents._scan import scan_issues
+        from tinyseoai.agents.models import AuditView
+
+        issues = [issue.model_dump() for issue in sample_audit_result.issues]
+        view = AuditView.from_audit_data({"issues": issues})
+
+        # Act
+        scan = scan_issues(issues)
+
+        # Assert
+        assert view.issue_scan() is view.issue_scan()
+        assert view.issue_scan().severity_counts == scan.severity_counts
+        assert scan.total == 5
+        assert scan.severity_counts["medium"] == 2
+        assert scan.high_severity_count == 1
+        assert scan.security_count == 1
+        assert scan.by_category["content_quality"] == 2
+        assert [i["type"] for i in scan.by_agent["link_analysis"]] == ["broken_link"]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_plan_respects_dependencies(self):
+        """Test that dependent tasks start only after their dependencies finish."""
+        # Arrange
+        import asyncio
+
+        from tinyseoai.agents.models import AgentResult, AgentTask, TaskEvent, TaskPriority
+        from tinyseoai.agents.orchestrator import OrchestratorAgent
+
+        order = []
+
+        def make_agent(role):
+            async def execute_task(task):
+                order.append(role)
+                await asyncio.sleep(0)
+                return AgentResult(task_id=task.id, agent_role=role, success=True)
+
+            return Mock(execute_task=execute_task)
+
+        specialists = [
+            AgentTask(
+                id=f"task_{role.value}",
+                assigned_to=role,
+                priority=TaskPriority.MEDIUM,
+                title=role.value,
+                description=role.value,
+            )
+            for role in (AgentRole.TECHNICAL_SEO, AgentRole.PERFORMANCE)
+        ]
+        fix_task = AgentTask(
+            id="task_fix",
+            assigned_to=AgentRole.FIX_GENERATOR,
+            priority=TaskPriority.HIGH,
+            title="fix",
+            description="fix",
+            dependencies=[t.id for t in specialists],
+        )
+        agents = {t.assigned_to: make_agent(t.assigned_to) for t in [*specialists, fix_task]}
+        events = asyncio.Queue()
+        orchestrator = OrchestratorAgent(api_key="test-key")
+
+        # Act (fix task listed first to prove ordering comes from the DAG)
+        results = await orchestrator.dispatch_plan([fix_task, *specialists], agents, events)
+
+        # Assert
+        assert len(results) == 3
+        assert order[-1] == AgentRole.FIX_GENERATOR
+        published = [events.get_nowait() for _ in range(events.qsize())]
+        assert published[-1] == (TaskEvent.TASK_COMPLETED, fix_task)
+        assert sum(event == TaskEvent.TASK_STARTED for event, _ in published) == 3
+
+    @pytest.mark.asyncio
+    async def test_dispatch_plan_breaks_dependency_cycles(self):
+        """Test that a cyclic plan still runs every task instead of hanging."""
+        # Arrange
+        import asyncio
+
+        from tinyseoai.agents.models import AgentResult, AgentTask, TaskPriority
+        from tinyseoai.agents.orchestrator import OrchestratorAgent
+
+        order = []
+
+        def make_agent(role):
+            async def execute_task(task):
+                order.append(task.id)
+                return AgentResult(task_id=task.id, agent_role=role, success=True)
+
+            return Mock(execute_task=execute_task)
+
+        roles = (AgentRole.TECHNICAL_SEO, AgentRole.PERFORMANCE, AgentRole.FIX_GENERATOR)
+        ids = ["a", "b", "c"]
+        tasks = [
+            AgentTask(
+                id=task_id,
+                assigned_to=role,
+                priority=TaskPriority.MEDIUM,
+                title=task_id,
+                description=task_id,
+                dependencies=[dependency],
+            )
+            # a -> b -> a is a cycle; c waits on a
+            for task_id, role, dependency in zip(ids, roles, ["b", "a", "a"], strict=True)
+        ]
+        agents = {role: make_agent(role) for role in roles}
+        orchestrator = OrchestratorAgent(api_key="test-key")
+
+        # Act
+        results = await asyncio.wait_for(orchestrator.dispatch_plan(tasks, agents), 2)
+
+        # Assert
+        assert len(results) == 3
+        assert order.index("a") < order.index("b")
+        assert order.index("a") < order.index("c")
+
 
 @pytest.mark.integration
 @pytest.mark.ai
@@ -162,6 +315,26 @@ class TestAgentTaskExecution:
             # Skip if API key issues
             pytest.skip(f"Skipped due to API issues: {e}")
 
+    @patch("tinyseoai.agents.base.ChatOpenAI")
+    def test_link_analysis_dedupe_keeps_distinct_broken_links(self, mock_llm):
+        """Test broken links on one page are only deduped when the link repeats."""
+        # Arrange
+        from tinyseoai.agents.link_analysis import LinkAnalysisAgent
+
+        agent = LinkAnalysisAgent(api_key="test-key")
+        page = "https://example.com/page1"
+        issues = [
+            {"url": page, "type": "broken_link", "severity": "medium", "detail": "/a"},
+            {"url": page, "type": "broken_link", "severity": "medium", "detail": "/b"},
+            {"url": page, "type": "broken_link", "severity": "medium", "detail": "/a"},
+        ]
+
+        # Act
+        unique = agent._dedupe_issues(issues)
+
+        # Assert
+        assert [i["detail"] for i in unique] == ["/a", "/b"]
+
     @pytest.mark.asyncio
     @patch("tinyseoai.agents.base.ChatOpenAI")
     async def test_content_quality_agent_execution(self, mock_llm):
@@ -5,11 +5,15 @@ Unit tests for agent data models.
 import pytest
 from datetime import datetime
 
+from pydantic import ValidationError
+
 from tinyseoai.agents.models import (
     AgentMessage,
+    AgentProfile,
     AgentResult,
     AgentRole,
     AgentTask,
+    AuditView,
     ChainOfThought,
     MessageType,
     MultiAgentSession,
@@ -105,6 +109,20 @@ class TestChainOfThought:
         assert "action" in summary.lower()
         assert "Recommend fixing all 404s" in summary
 
+    def test_thought_steps_are_frozen(self):
+        """Test that recorded reasoning steps cannot be mutated."""
+        # Arrange
+        cot = ChainOfThought(
+            agent_role=AgentRole.TECHNICAL_SEO,
+            task_id="task_999",
+            goal="Check HTTPS",
+        )
+        cot.add_step("observation", "Site is served over HTTP")
+
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            cot.steps[0].content = "changed"
+
 
 @pytest.mark.unit
 class TestAgentTask:
@@ -258,6 +276,28 @@ class TestAgentResult:
         assert rec["effort"] == 3.0
 
 
+@pytest.mark.unit
+class TestAgentProfile:
+    """Test AgentProfile model."""
+
+    def test_profile_is_frozen(self):
+        """Test a profile cannot be changed after creation."""
+        # Arrange
+        profile = AgentProfile(
+            role=AgentRole.PERFORMANCE,
+            name="Performance Agent",
+            description="Speed specialist",
+            capabilities=[],
+            specialization=["performance"],
+        )
+
+        # Act & Assert
+        assert profile.specialization == ("performance",)
+        assert profile.fallback_models == ("gpt-4o", "claude-3-5-sonnet")
+        with pytest.raises(ValidationError):
+            profile.default_model = "gpt-4o"
+
+
 @pytest.mark.unit
 class TestMultiAgentSession:
     """Test MultiAgentSession model."""
@@ -394,3 +434,61 @@ class TestMultiAgentSession:
 
         # Act & Assert - Now complete
         assert session.is_complete()
+
+    def test_export_skips_unset_fields(self):
+        """Test that session export omits None values but keeps defaults."""
+        # Arrange
+        session = MultiAgentSession(site_url="https://example.com")
+        result = AgentResult(
+            task_id="task_1",
+            agent_role=AgentRole.TECHNICAL_SEO,
+            success=True,
+            chain_of_thought=ChainOfThought(
+                agent_role=AgentRole.TECHNICAL_SEO,
+                task_id="task_1",
+                goal="Check HTTPS",
+            ),
+        )
+        result.chain_of_thought.add_step("observation", "Site is served over HTTP")
+        session.record_result(result)
+
+        # Act
+        exported = session.export()
+
+        # Assert
+        assert exported["site_url"] == "https://example.com"
+        assert "completed_at" not in exported
+        assert exported["initiated_by"] == AgentRole.ORCHESTRATOR
+        assert exported["tasks"] == []
+        assert exported["results"]["task_1"]["execution_time_ms"] == 0.0
+        step = exported["results"]["task_1"]["chain_of_thought"]["steps"][0]
+        assert step["content"] == "Site is served over HTTP"
+        assert "supporting_data" not in step
+
+
+@pytest.mark.unit
+class TestAuditView:
+    """Test AuditView model."""
+
+    def test_from_audit_data_normalizes_columns(self):
+        """Test that types and severities are normalized parallel to issues."""
+        # Arrange
+        audit_data = {
+            "site": "https://example.com",
+            "pages_scanned": 3,
+            "issues": [
+                {"type": "No_HTTPS", "severity": "high"},
+                {"type": "title_missing"},
+            ],
+            "meta": {"health_score": 72},
+        }
+
+        # Act
+        view = AuditView.from_audit_data(audit_data)
+
+        # Assert
+        assert view.site == "https://example.com"
+        assert view.health_score == 72
+        assert view.issues is audit_data["issues"]
+        assert view.types_lc == ["no_https", "title_missing"]
+        assert view.severities == ["high", "info"]
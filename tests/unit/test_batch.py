@@ -0,0 +1,99 @@
+"""
+Unit tests for batch execution of the per-page checks.
+"""
+
+import pytest
+
+from tinyseoai.audit.checks import batch
+from tinyseoai.audit.checks.batch import (
+    batch_audit,
+    batch_meta_audit,
+    map_pages,
+    run_audit,
+)
+from tinyseoai.audit.checks.meta import MetaTagChecker
+
+NOINDEX_PAGE = (
+    '<html><head><meta name="robots" content="noindex"></head>'
+    "<body><p>Short page.</p></body></html>"
+)
+PLAIN_PAGE = "<html><head><title>Plain</title></head><body><p>Hello.</p></body></html>"
+
+
+def _failing_check(html, url):
+    raise RuntimeError("boom")
+
+
+@pytest.mark.unit
+class TestBatchAudit:
+    """Test batch_audit and map_pages functionality."""
+
+    def test_in_process_matches_run_audit(self):
+        """Test workers=1 returns the same issues as calling run_audit per page."""
+        # Arrange
+        pages = [(NOINDEX_PAGE, "https://example.com/a"), (PLAIN_PAGE, "https://example.com/b")]
+
+        # Act
+        results = batch_audit(pages, workers=1)
+
+        # Assert
+        expected = [run_audit(html, url) for html, url in pages]
+        assert [[i.type for i in r] for r in results] == [[i.type for i in r] for r in expected]
+
+    def test_failing_check_group_keeps_other_issues(self, monkeypatch):
+        """Test a raising content check is logged without dropping indexability issues."""
+
+        # Arrange
+        class BrokenAnalyzer:
+            def __init__(self, html, url):
+                raise ValueError("unparseable")
+
+        monkeypatch.setattr(batch, "ContentAnalyzer", BrokenAnalyzer)
+
+        # Act
+        issues = run_audit(NOINDEX_PAGE, "https://example.com/a")
+
+        # Assert
+        assert issues
+        assert all(issue.url == "https://example.com/a" for issue in issues)
+
+    def test_failing_page_does_not_abort_batch(self):
+        """Test a page whose check raises yields no issues and the rest still run."""
+        # Arrange
+        pages = [(PLAIN_PAGE, "https://example.com/a"), (PLAIN_PAGE, "https://example.com/b")]
+
+        # Act
+        results = map_pages(_failing_check, pages, workers=1)
+
+        # Assert
+        assert results == [[], []]
+
+    def test_process_pool_preserves_order(self):
+        """Test the pooled path returns results in input order."""
+        # Arrange
+        pages = [(NOINDEX_PAGE, "https://example.com/a"), (PLAIN_PAGE, "https://example.com/b")]
+
+        # Act
+        results = batch_audit(pages, workers=2)
+
+        # Assert
+        assert results[0] and {i.url for i in results[0]} == {"https://example.com/a"}
+        assert all(i.url == "https://example.com/b" for i in results[1])
+
+    def test_empty_input(self):
+        """Test an empty batch returns no results."""
+        # Act & Assert
+        assert batch_audit([], workers=4) == []
+
+    def test_meta_audit_matches_checker(self):
+        """Test batch_meta_audit returns the meta checker's issues for each page."""
+        # Arrange
+        pages = [(PLAIN_PAGE, "https://example.com/a"), (NOINDEX_PAGE, "https://example.com/b")]
+
+        # Act
+        results = batch_meta_audit(pages, workers=2)
+
+        # Assert
+        expected = [MetaTagChecker(html, url).check_all() for html, url in pages]
+        assert [[i.type for i in r] for r in results] == [[i.type for i in r] for r in expected]
+        assert results[0]
@@ -0,0 +1,53 @@
+"""
+Unit tests for application configuration loading.
+"""
+
+import json
+
+import pytest
+
+from tinyseoai import config
+from tinyseoai.config import get_config, save_config
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Point the config file at a temporary directory and reset the cache."""
+    path = tmp_path / "config.json"
+    monkeypatch.setattr(config, "_cfg_path", lambda: path)
+    get_config.cache_clear()
+    yield path
+    get_config.cache_clear()
+
+
+@pytest.mark.unit
+class TestGetConfig:
+    """Test get_config caching."""
+
+    def test_cached_for_the_process(self, config_file):
+        """Test repeated calls return the same loaded config."""
+        # Act & Assert
+        assert get_config() is get_config()
+
+    def test_cache_clear_reloads_file(self, config_file):
+        """Test edits to the file are picked up only after cache_clear."""
+        # Arrange
+        get_config()
+        config_file.write_text(json.dumps({"plan": "premium"}))
+
+        # Act & Assert
+        assert get_config().plan == "free"
+        get_config.cache_clear()
+        assert get_config().plan == "premium"
+
+    def test_save_config_reloads(self, config_file):
+        """Test a saved config is what the next get_config returns."""
+        # Arrange
+        cfg = get_config().model_copy()
+        cfg.max_output_tokens = 1200
+
+        # Act
+        save_config(cfg)
+
+        # Assert
+        assert get_config().max_output_tokens == 1200
@@ -0,0 +1,137 @@
+"""
+Unit tests for content analysis.
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+from tinyseoai.audit.checks.content import (
+    _LSH_RECALL,
+    _MINHASH_PERMS,
+    ContentAnalyzer,
+    DuplicateContentDetector,
+    _lsh_bands,
+)
+from tinyseoai.utils.html import parse_html
+
+XHTML_PAGE = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<html xmlns="http://www.w3.org/1999/xhtml"><head><title>T</title></head>'
+    "<body><h1>Café guide</h1><p>Fresh coffee every morning.</p>"
+    "<script>var x = 1;</script></body></html>"
+)
+
+# Old CMS markup: hundreds of never-closed inline tags before the real content
+FONT_SOUP_PAGE = (
+    "<h1>Catalog</h1>"
+    + "".join(f"<font size=2>item {i} " for i in range(300))
+    + "<h2>About</h2><p>"
+    + "real words " * 400
+    + "</p>"
+)
+
+
+def _seeded_corpus(seed: int = 7) -> list[tuple[str, str]]:
+    """Base documents plus variants with a spread of word-level edits."""
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(400)]
+    pages = []
+    for base in range(6):
+        words = [rng.choice(vocabulary) for _ in range(300)]
+        pages.append((f"https://example.com/{base}", " ".join(words)))
+        for variant, edit_rate in enumerate((0.005, 0.01, 0.02, 0.04, 0.08, 0.3)):
+            edited = [rng.choice(vocabulary) if rng.random() < edit_rate else w for w in words]
+            pages.append((f"https://example.com/{base}-{variant}", " ".join(edited)))
+    return pages
+
+
+@pytest.mark.unit
+class TestContentAnalyzer:
+    """Test ContentAnalyzer functionality."""
+
+    def test_xhtml_with_encoding_declaration(self):
+        """Test XHTML pages with an XML encoding declaration still yield text."""
+        # Act
+        analyzer = ContentAnalyzer(XHTML_PAGE, "https://example.com/")
+
+        # Assert
+        assert analyzer.text == "T Café guide Fresh coffee every morning."
+        assert any(issue.type == "very_thin_content" for issue in analyzer.check_all())
+
+    def test_unclosed_inline_tags_keep_later_content(self):
+        """Test nesting past libxml2's default 255 levels drops no content."""
+        # Act
+        analyzer = ContentAnalyzer(FONT_SOUP_PAGE, "https://example.com/")
+
+        # Assert
+        assert analyzer.get_content_metrics()["word_count"] == 1402
+        assert analyzer.text.endswith("About " + "real words " * 399 + "real words")
+        assert analyzer.tree.xpath("string(//h2)") == "About"
+
+    def test_nesting_deeper_than_recursion_limit(self):
+        """Test pages nested over 1000 levels deep still yield all their text."""
+        # Arrange
+        html = "<div>" * 1500 + "deep text" + "</div>" * 1500 + "<p>outro</p>"
+
+        # Act
+        analyzer = ContentAnalyzer(html, "https://example.com/")
+
+        # Assert
+        assert analyzer.text == "deep text outro"
+
+    def test_empty_document(self):
+        """Test pages without any markup produce no tree and no text."""
+        # Act & Assert
+        assert parse_html("  ") is None
+        assert parse_html("<!-- only a comment -->") is None
+        assert ContentAnalyzer("", "https://example.com/").text == ""
+
+
+@pytest.mark.unit
+class TestDuplicateContentDetector:
+    """Test DuplicateContentDetector functionality."""
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.8, 0.9])
+    def test_near_duplicates_match_all_pairs(self, threshold):
+        """Test LSH candidates find exactly the pairs an all-pairs Jaccard scan finds."""
+        # Arrange
+        detector = DuplicateContentDetector()
+        for url, text in _seeded_corpus():
+            detector.add_page(url, text)
+        fingerprints = detector.content_fingerprints
+        expected = {
+            (url1, url2)
+            for url1, url2 in combinations(fingerprints, 2)
+            if detector._jaccard_similarity(fingerprints[url1], fingerprints[url2]) >= threshold
+        }
+
+        # Act
+        issues = detector.find_near_duplicates(threshold=threshold)
+
+        # Assert
+        found = {(issue.url, issue.detail.rsplit(": ", 1)[1]) for issue in issues}
+        assert found == expected
+        assert expected  # the corpus has pairs on both sides of every threshold
+        assert len(expected) < len(fingerprints) * (len(fingerprints) - 1) // 2
+
+    @pytest.mark.parametrize("threshold", [0.3, 0.5, 0.8, 0.9, 0.95])
+    def test_lsh_bands_meet_recall(self, threshold):
+        """Test the banding reaches the recall target and is the most selective that does."""
+        # Act
+        bands, rows = _lsh_bands(threshold)
+
+        # Assert
+        assert bands == _MINHASH_PERMS // rows
+        assert 1 - (1 - threshold**rows) ** bands >= _LSH_RECALL
+        tighter_bands = _MINHASH_PERMS // (rows + 1)
+        assert 1 - (1 - threshold ** (rows + 1)) ** tighter_bands < _LSH_RECALL
+
+    def test_lsh_bands_tighten_with_threshold(self):
+        """Test higher thresholds never use fewer rows per band."""
+        # Act
+        rows = [_lsh_bands(t)[1] for t in (0.3, 0.5, 0.8, 0.9, 0.95)]
+
+        # Assert
+        assert rows == sorted(rows)
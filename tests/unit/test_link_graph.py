@@ -0,0 +1,203 @@
+"""
+Unit tests for the link graph.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from tinyseoai.audit.checks.links import LinkChecker, LinkGraph, check_redirect_chains
+
+
+@pytest.fixture
+def graph():
+    """Create a small site graph: home -> a -> b -> c, plus an unlinked page."""
+    g = LinkGraph()
+    g.add_page("https://example.com/")
+    g.add_page("https://example.com/lonely")
+    g.add_link("https://example.com/", "https://example.com/a", "A")
+    g.add_link("https://example.com/a", "https://example.com/b", "B")
+    g.add_link("https://example.com/b", "https://example.com/c", "C")
+    g.add_link("https://example.com/", "https://example.com/c", "See C")
+    return g
+
+
+@pytest.mark.unit
+class TestLinkGraph:
+    """Test LinkGraph functionality."""
+
+    def test_page_depth(self, graph):
+        """Test BFS depths follow the shortest click path."""
+        # Act
+        depths = graph.get_page_depth("https://example.com/")
+
+        # Assert
+        assert depths == {
+            "https://example.com/": 0,
+            "https://example.com/a": 1,
+            "https://example.com/c": 1,
+            "https://example.com/b": 2,
+        }
+
+    def test_page_depth_unknown_start(self, graph):
+        """Test a start URL outside the graph reaches only itself."""
+        # Act & Assert
+        assert graph.get_page_depth("https://other.com/") == {"https://other.com/": 0}
+
+    def test_orphan_pages(self, graph):
+        """Test pages without backlinks are orphans."""
+        # Act & Assert
+        assert graph.get_orphan_pages() == ["https://example.com/", "https://example.com/lonely"]
+
+    def test_iter_orphans_limit_and_exclude(self, graph):
+        """Test lazy orphan iteration honours the limit and excluded URLs."""
+        # Act & Assert
+        assert list(graph.iter_orphans(exclude={"https://example.com/"})) == [
+            "https://example.com/lonely"
+        ]
+        assert list(graph.iter_orphans(limit=1)) == ["https://example.com/"]
+
+    def test_caches_invalidate_on_new_link(self, graph):
+        """Test cached depths and orphans are recomputed after the graph changes."""
+        # Arrange
+        graph.get_page_depth("https://example.com/")
+        graph.get_orphan_pages()
+
+        # Act
+        graph.add_link("https://example.com/c", "https://example.com/lonely")
+
+        # Assert
+        assert graph.get_page_depth("https://example.com/")["https://example.com/lonely"] == 2
+        assert graph.get_orphan_pages() == ["https://example.com/"]
+
+    def test_page_metrics(self, graph):
+        """Test per-page link and anchor counts."""
+        # Act
+        metrics = graph.get_page_metrics("https://example.com/c")
+
+        # Assert
+        assert metrics == {"outbound_links": 0, "inbound_links": 2, "unique_anchor_texts": 2}
+        assert graph.get_page_metrics("https://other.com/")["inbound_links"] == 0
+
+    def test_duplicate_links_counted_once(self, graph):
+        """Test repeating a link does not add a second edge."""
+        # Act
+        graph.add_link("https://example.com/", "https://example.com/a", "A again")
+
+        # Assert
+        assert graph.get_hub_pages(1) == [("https://example.com/", 2)]
+        assert graph.edges["https://example.com/"] == {
+            "https://example.com/a",
+            "https://example.com/c",
+        }
+
+    def test_edge_views_are_live_and_read_only(self, graph):
+        """Test edges/backlinks reflect later links and reject in-place writes."""
+        # Arrange
+        edges = graph.edges
+        backlinks = graph.backlinks
+
+        # Act
+        graph.add_link("https://example.com/a", "https://example.com/new")
+
+        # Assert
+        assert edges["https://example.com/a"] >= {"https://example.com/new"}
+        assert backlinks["https://example.com/new"] == {"https://example.com/a"}
+        assert backlinks["https://example.com/"] == frozenset()
+        assert len(edges) == len(graph.nodes)
+        assert "https://unknown.example/" not in edges
+        with pytest.raises(AttributeError):
+            edges["https://example.com/a"].add("https://example.com/x")
+
+    def test_direction_optimizing_depth_matches_bfs(self):
+        """Test the direction-optimizing BFS agrees with plain BFS on a dense graph."""
+        # Arrange
+        g = LinkGraph()
+        urls = [f"https://example.com/p{i}" for i in range(200)]
+        for i, url in enumerate(urls):
+            for step in (1, 7, 31):
+                g.add_link(url, urls[(i * step + step) % len(urls)])
+
+        # Act
+        depths = g.get_page_depth_dobfs(urls[0], alpha=1000, beta=1000)
+
+        # Assert
+        assert depths == g.get_page_depth(urls[0])
+        assert g.get_page_depth_dobfs("https://other.com/") == {"https://other.com/": 0}
+
+
+@pytest.mark.unit
+class TestLinkChecker:
+    """Test LinkChecker internal linking analysis."""
+
+    def test_incremental_ingest_matches_batch(self):
+        """Test ingesting pages one at a time gives the same issues as a batch."""
+        # Arrange
+        pages = [
+            {"url": "https://example.com/", "internal_links": [{"url": "https://example.com/a"}]},
+            {"url": "https://example.com/a", "internal_links": []},
+            {"url": "https://example.com/lonely", "internal_links": []},
+        ]
+        checker = LinkChecker("https://example.com")
+
+        # Act
+        checker.ingest(pages[0])
+        first = checker.analyze()
+        for page in pages[1:]:
+            checker.ingest(page)
+        issues = checker.analyze()
+
+        # Assert
+        assert first == []
+        assert issues == LinkChecker("https://example.com").analyze_internal_linking(pages)
+        assert [i.url for i in issues if i.type == "orphan_page"] == ["https://example.com/lonely"]
+
+    def test_anchor_issues_aggregated_per_page(self):
+        """Test repeated empty and generic anchors yield one issue each with a count."""
+        # Arrange
+        links = [
+            {"url": "/a", "anchor_text": "Click here"},
+            {"url": "/b", "anchor_text": "click here"},
+            {"url": "/c", "anchor_text": ""},
+            {"url": "/d", "anchor_text": " "},
+            {"url": "/e", "anchor_text": "Pricing"},
+        ]
+
+        # Act
+        issues = LinkChecker("https://example.com").check_anchor_text(links, "https://example.com/")
+
+        # Assert
+        assert [(i.type, i.detail) for i in issues] == [
+            ("empty_anchor_text", "2 links have no anchor text (examples: /c, /d)"),
+            (
+                "generic_anchor_text",
+                "Generic anchor text 'Click here' used 2 times on page (examples: /a, /b)",
+            ),
+        ]
+
+
+@pytest.mark.unit
+class TestCheckRedirectChains:
+    """Test redirect chain detection."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("head_status", [400, 403, 405, 501])
+    async def test_falls_back_to_get_when_head_fails(self, head_status):
+        """Test a HEAD error is re-checked with GET before following the chain."""
+        # Arrange
+        client = Mock()
+        client.head = AsyncMock(return_value=Mock(status_code=head_status, headers={}))
+        client.get = AsyncMock(
+            side_effect=[
+                Mock(status_code=301, headers={"location": "/b"}),
+                Mock(status_code=301, headers={"location": "/c"}),
+                Mock(status_code=200, headers={}),
+            ]
+        )
+
+        # Act
+        issues = await check_redirect_chains("https://example.com/a", client)
+
+        # Assert
+        assert client.get.await_count == 3
+        assert [issue.type for issue in issues] == ["redirect_chain"]
@@ -0,0 +1,38 @@
+"""
+Unit tests for meta tag checks.
+"""
+
+import pytest
+
+from tinyseoai.audit.checks.meta import MetaTagChecker
+
+
+def _deeply_nested_page(depth: int) -> str:
+    """Page whose icon and x-default links come after ``depth`` unclosed tags."""
+    return (
+        '<html lang="en"><head><meta charset="utf-8">'
+        '<link rel="alternate" hreflang="en" href="https://example.com/en/">'
+        "</head><body>"
+        + "<font size=2>item " * depth
+        + '<link rel="alternate" hreflang="x-default" href="https://example.com/">'
+        + '<link rel="icon" href="/favicon.ico">'
+        + '<link rel="apple-touch-icon" href="/apple-touch-icon.png">'
+    )
+
+
+@pytest.mark.unit
+class TestMetaTagChecker:
+    """Test MetaTagChecker functionality."""
+
+    @pytest.mark.parametrize("depth", [300, 3000])
+    def test_links_after_deep_nesting_are_indexed(self, depth):
+        """Test <link> tags past libxml2's nesting limit are not reported missing."""
+        # Act
+        checker = MetaTagChecker(_deeply_nested_page(depth), "https://example.com/")
+        issue_types = {issue.type for issue in checker.check_all()}
+
+        # Assert
+        assert len(checker._links) == 4
+        assert "missing_favicon" not in issue_types
+        assert "missing_apple_touch_icon" not in issue_types
+        assert "missing_hreflang_x_default" not in issue_types
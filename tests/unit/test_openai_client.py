@@ -0,0 +1,131 @@
+"""
+Unit tests for the OpenAI client helpers.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tinyseoai.ai.openai_client import (
+    AIError,
+    _completion_kwargs,
+    _parse_completion,
+    call_ai_json,
+    clear_completion_cache,
+)
+
+
+def _response(content):
+    """Build a minimal chat completion response."""
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.mark.unit
+class TestCompletionKwargs:
+    """Test the Chat Completions arguments built for JSON-mode requests."""
+
+    def test_cache_key_sent_in_extra_body(self):
+        """Test the prompt cache key is passed through extra_body, not as a named argument."""
+        # Act
+        kwargs = _completion_kwargs("gpt-4o-mini", "system", "prompt", 0.2, 100, "tinyseoai:x")
+
+        # Assert
+        assert kwargs["extra_body"] == {"prompt_cache_key": "tinyseoai:x"}
+        assert "prompt_cache_key" not in kwargs
+        assert kwargs["messages"][0] == {"role": "system", "content": "system"}
+
+    def test_no_cache_key(self):
+        """Test requests without a cache key carry no extra_body."""
+        # Act
+        kwargs = _completion_kwargs("gpt-4o-mini", "system", "prompt", 0.2, 100)
+
+        # Assert
+        assert "extra_body" not in kwargs
+        assert kwargs["response_format"] == {"type": "json_object"}
+
+    @patch("tinyseoai.agents.base.ChatOpenAI")
+    def test_agent_llm_cache_key_in_extra_body(self, mock_llm):
+        """Test agents hand their per-role cache key to ChatOpenAI via extra_body."""
+        # Arrange
+        from tinyseoai.agents.prompts import prompt_cache_key
+        from tinyseoai.agents.technical_seo import TechnicalSEOAgent
+
+        # Act
+        agent = TechnicalSEOAgent(api_key="test-key")
+
+        # Assert
+        kwargs = mock_llm.call_args.kwargs
+        assert kwargs["extra_body"] == {
+            "prompt_cache_key": prompt_cache_key(agent.profile.role.value)
+        }
+        assert "model_kwargs" not in kwargs
+
+
+@pytest.mark.unit
+class TestParseCompletion:
+    """Test JSON extraction from chat completions."""
+
+    def test_json_object(self):
+        """Test a JSON object body is returned as a dict."""
+        # Act & Assert
+        assert _parse_completion(_response('{"summary": "ok"}')) == {"summary": "ok"}
+
+    def test_non_object_json_rejected(self):
+        """Test valid JSON that is not an object raises AIError."""
+        # Act & Assert
+        with pytest.raises(AIError, match="JSON object"):
+            _parse_completion(_response("[1, 2]"))
+
+
+@pytest.mark.unit
+class TestCompletionCache:
+    """Test the in-process completion cache in call_ai_json."""
+
+    @pytest.fixture
+    def client(self):
+        """Patch in a client that returns a fresh JSON body per request."""
+        client = Mock()
+        client.chat.completions.create.side_effect = lambda **kwargs: _response('{"ok": true}')
+        clear_completion_cache()
+        with (
+            patch("tinyseoai.ai.openai_client.get_client", return_value=client),
+            patch(
+                "tinyseoai.ai.openai_client._resolve_request",
+                return_value=("gpt-4o-mini", "system", 100),
+            ),
+        ):
+            yield client
+        clear_completion_cache()
+
+    def test_sampled_requests_not_cached_by_default(self, client):
+        """Test repeated requests at a non-zero temperature each reach the API."""
+        # Act
+        call_ai_json("prompt", temperature=0.2)
+        call_ai_json("prompt", temperature=0.2)
+
+        # Assert
+        assert client.chat.completions.create.call_count == 2
+
+    def test_deterministic_requests_cached(self, client):
+        """Test temperature-0 requests are cached and returned as independent copies."""
+        # Act
+        first = call_ai_json("prompt", temperature=0)
+        first["ok"] = False
+        second = call_ai_json("prompt", temperature=0)
+
+        # Assert
+        assert client.chat.completions.create.call_count == 1
+        assert second == {"ok": True}
+
+    def test_opt_in_and_clear(self, client):
+        """Test use_cache=True caches sampled requests until the cache is cleared."""
+        # Act
+        call_ai_json("prompt", use_cache=True)
+        call_ai_json("prompt", use_cache=True)
+        clear_completion_cache()
+        call_ai_json("prompt", use_cache=True)
+
+        # Assert
+        assert client.chat.completions.create.call_count == 2
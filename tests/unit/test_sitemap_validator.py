@@ -0,0 +1,58 @@
+"""
+Unit tests for XML sitemap validation.
+"""
+
+import pytest
+
+from tinyseoai.audit.checks.indexability import SitemapValidator
+
+SITEMAP_NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+@pytest.mark.unit
+class TestSitemapValidator:
+    """Test SitemapValidator functionality."""
+
+    def test_declared_encoding_is_honoured_for_bytes_and_text(self):
+        """Test non-ASCII URLs survive a non-UTF-8 encoding declaration."""
+        # Arrange
+        xml = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            f"<urlset {SITEMAP_NS}><url><loc>https://example.com/café page</loc></url></urlset>"
+        )
+
+        # Act
+        from_text = SitemapValidator(xml, "https://example.com/sitemap.xml").validate()
+        from_bytes = SitemapValidator(
+            xml.encode("iso-8859-1"), "https://example.com/sitemap.xml"
+        ).validate()
+
+        # Assert
+        for issues in (from_text, from_bytes):
+            assert [issue.type for issue in issues] == ["sitemap_url_has_spaces"]
+            assert "https://example.com/café page" in issues[0].detail
+
+    def test_syntax_error_keeps_url_issues(self):
+        """Test a malformed sitemap reports one syntax issue alongside per-URL issues."""
+        # Arrange
+        xml = (
+            f"<urlset {SITEMAP_NS}><url><loc>https://example.com/a</loc></url>"
+            "<url><loc>/relative</loc>"
+        )
+
+        # Act
+        issues = SitemapValidator(xml, "https://example.com/sitemap.xml").validate()
+
+        # Assert
+        types = [issue.type for issue in issues]
+        assert types.count("sitemap_syntax_error") == 1
+        assert "sitemap_relative_url" in types
+        assert "invalid_sitemap_format" not in types
+
+    def test_invalid_root(self):
+        """Test a document without a sitemap root is reported as invalid."""
+        # Act
+        issues = SitemapValidator("<html></html>", "https://example.com/sitemap.xml").validate()
+
+        # Assert
+        assert [issue.type for issue in issues] == ["invalid_sitemap_format"]
@@ -0,0 +1,84 @@
+"""
+Unit tests for the AI summary cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from tinyseoai.ai import summarizer
+from tinyseoai.config import AppConfig
+from tinyseoai.data.models import AuditResult, Issue
+
+SUMMARY = {"executive_summary": "All good.", "top_actions": []}
+
+
+@pytest.fixture
+def audit_result():
+    """Create a small audit result."""
+    return AuditResult(
+        site="https://example.com",
+        pages_scanned=1,
+        issues=[Issue(type="missing_title", severity="warning", url="https://example.com/")],
+        meta={},
+    )
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the summary cache at a temporary directory with default config."""
+    monkeypatch.setattr(summarizer, "user_cache_dir", lambda app: str(tmp_path))
+    monkeypatch.setattr(summarizer, "get_config", lambda: AppConfig())
+    monkeypatch.setattr("tinyseoai.ai.openai_client.get_config", lambda: AppConfig())
+    return tmp_path / "summaries"
+
+
+@pytest.mark.unit
+class TestSummaryCache:
+    """Test the on-disk cache around summarize_with_ai."""
+
+    @patch("tinyseoai.ai.summarizer.call_ai_json")
+    def test_miss_then_hit(self, mock_call, audit_result, cache_dir):
+        """Test the first call reaches the model and the second is served from disk."""
+        # Arrange
+        mock_call.side_effect = lambda **kwargs: dict(SUMMARY)
+
+        # Act
+        first = summarizer.summarize_with_ai(audit_result)
+        second = summarizer.summarize_with_ai(audit_result)
+
+        # Assert
+        assert mock_call.call_count == 1
+        assert first == second
+        assert [p.suffix for p in cache_dir.iterdir()] == [".json"]
+
+    @patch("tinyseoai.ai.summarizer.call_ai_json")
+    def test_corrupt_entry_is_refetched(self, mock_call, audit_result, cache_dir):
+        """Test an unreadable cache file falls back to the model and is rewritten."""
+        # Arrange
+        mock_call.side_effect = lambda **kwargs: dict(SUMMARY)
+        summarizer.summarize_with_ai(audit_result)
+        (entry,) = cache_dir.iterdir()
+        entry.write_text("{not json", encoding="utf-8")
+
+        # Act
+        data = summarizer.summarize_with_ai(audit_result)
+
+        # Assert
+        assert mock_call.call_count == 2
+        assert data["executive_summary"] == "All good."
+        assert summarizer._read_cached_summary(entry) == SUMMARY
+
+    @patch("tinyseoai.ai.summarizer.call_ai_json")
+    def test_cache_opt_out(self, mock_call, audit_result, cache_dir):
+        """Test use_cache=False neither reads nor writes the cache."""
+        # Arrange
+        mock_call.side_effect = lambda **kwargs: dict(SUMMARY)
+
+        # Act
+        summarizer.summarize_with_ai(audit_result, use_cache=False)
+        summarizer.summarize_with_ai(audit_result, use_cache=False)
+
+        # Assert
+        assert mock_call.call_count == 2
+        assert not cache_dir.exists()
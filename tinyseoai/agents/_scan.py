@@ -0,0 +1,127 @@
+"""
+Issue classification and aggregation kernel for the orchestrator.
+
+Kept free of agent/LLM imports and fully type-annotated so it can be compiled
+with mypyc (``mypyc tinyseoai/agents/_scan.py``) as a drop-in extension module;
+the pure-Python source is used when no compiled build is present.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+# Issue-type keywords owned by each specialist agent, in precedence order: an issue
+# type matching keywords from several groups is routed to the first group listed.
+AGENT_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("technical_seo", ("https", "ssl", "robots", "sitemap", "canonical", "security")),
+    ("content_quality", ("title", "meta", "heading", "content", "duplicate", "readability")),
+    ("performance", ("performance", "image", "speed", "render", "cache")),
+    ("link_analysis", ("link", "broken", "redirect", "orphan")),
+)
+
+_AGENT_RANK = {agent: rank for rank, (agent, _) in enumerate(AGENT_KEYWORDS)}
+_KEYWORD_AGENT = {keyword: agent for agent, keywords in AGENT_KEYWORDS for keyword in keywords}
+
+# One alternation over every keyword, wrapped in a lookahead so overlapping
+# keywords are all reported in a single left-to-right scan of the issue type.
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_KEYWORD_AGENT, key=len, reverse=True)) + "))"
+)
+
+# Shared with TechnicalSEOAgent, which applies the same groupings per issue
+SECURITY_RE = re.compile(r"https|ssl|security")
+INDEXABILITY_RE = re.compile(r"robots|canonical|index")
+
+
+# Issue types come from a small closed vocabulary, so each distinct type is only
+# ever scanned once; every later lookup is a cache hit.
+@lru_cache(maxsize=1024)
+def classify_issue_type(issue_type: str) -> str | None:
+    """
+    Map a lowercased issue type to the specialist agent that should handle it.
+
+    Returns:
+        Agent name from AGENT_KEYWORDS, or None if no keyword matches
+    """
+    best_rank = len(AGENT_KEYWORDS)
+    for match in _KEYWORD_RE.finditer(issue_type):
+        rank = _AGENT_RANK[_KEYWORD_AGENT[match.group(1)]]
+        if rank < best_rank:
+            best_rank = rank
+            if rank == 0:
+                break
+    return AGENT_KEYWORDS[best_rank][0] if best_rank < len(AGENT_KEYWORDS) else None
+
+
+def lowered_issue_types(issues: list[dict[str, Any]]) -> list[str]:
+    """Lowercase (and intern) every issue type once, returning a list parallel to issues."""
+    return [sys.intern(issue.get("type", "unknown").lower()) for issue in issues]
+
+
+@dataclass(slots=True)
+class IssueScan:
+    """Aggregates gathered from a single pass over an audit's issues."""
+
+    total: int = 0
+    severity_counts: dict[str, int] = field(
+        default_factory=lambda: {"high": 0, "medium": 0, "low": 0, "info": 0}
+    )
+    by_category: dict[str, int] = field(default_factory=dict)
+    by_agent: defaultdict[str, list[dict[str, Any]]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    security_count: int = 0
+    indexability_count: int = 0
+
+    @property
+    def high_severity_count(self) -> int:
+        return self.severity_counts.get("high", 0)
+
+
+def scan_issues(
+    issues: list[dict[str, Any]],
+    lowered_types: list[str] | None = None,
+    severities: list[str] | None = None,
+) -> IssueScan:
+    """
+    Aggregate audit issues into every count and bucket the orchestrator needs.
+
+    Args:
+        issues: Issue dicts from the audit report
+        lowered_types: Optional lowercased issue types, parallel to issues
+        severities: Optional issue severities, parallel to issues
+
+    Returns:
+        IssueScan with severity/category counts, per-agent buckets and flags
+    """
+    if lowered_types is None:
+        lowered_types = lowered_issue_types(issues)
+    if severities is None:
+        severities = [issue.get("severity", "info") for issue in issues]
+
+    scan = IssueScan(total=len(issues))
+    scan.severity_counts.update(Counter(severities))
+
+    # Issue types repeat heavily across pages, so keyword tests run once per
+    # distinct type and are weighted by its count rather than once per issue.
+    by_category = scan.by_category
+    for issue_type, count in Counter(lowered_types).items():
+        category = classify_issue_type(issue_type) or "general"
+        by_category[category] = by_category.get(category, 0) + count
+        if SECURITY_RE.search(issue_type):
+            scan.security_count += count
+        if INDEXABILITY_RE.search(issue_type):
+            scan.indexability_count += count
+
+    by_agent = scan.by_agent
+    for issue, issue_type in zip(issues, lowered_types, strict=True):
+        agent = classify_issue_type(issue_type)
+        if agent:
+            by_agent[agent].append(issue)
+
+    return scan
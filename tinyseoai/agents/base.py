@@ -23,12 +23,29 @@ from .models import (
     AgentTask,
     ChainOfThought,
 )
+from .prompts import AGENT_SYSTEM_PROMPTS, prompt_cache_key
 
 logger = get_logger(__name__)
 
+REASONING_INSTRUCTIONS = """
+
+Think through this step-by-step:
+1. What data do you observe?
+2. What patterns or issues do you notice?
+3. What actions should be taken?
+4. What's your confidence in this assessment?
+
+Provide structured reasoning and a clear recommendation."""
+
 
 class AgentContext(Protocol):
-    """Protocol for agent context (dependency injection)."""
+    """
+    Protocol for agent context (dependency injection).
+
+    A context may also define ``get_audit_view() -> AuditView`` to share one
+    normalized view of its audit data between agents; agents that use it fall
+    back to building their own view when it is missing.
+    """
 
     def get_audit_data(self) -> dict[str, Any]:
         """Get audit data for analysis."""
@@ -90,7 +107,7 @@ class BaseAgent(ABC):
 
         Priority: default_model -> fallback_models[0] -> fallback_models[1]
         """
-        models_to_try = [self.profile.default_model] + self.profile.fallback_models
+        models_to_try = [self.profile.default_model, *self.profile.fallback_models]
 
         for model_name in models_to_try:
             try:
@@ -99,6 +116,8 @@ class BaseAgent(ABC):
                         model=model_name,
                         temperature=0.1,
                         api_key=api_key or self.config.openai_api_key,
+                        # Route each role to the same cache so its fixed prefix hits
+                        extra_body={"prompt_cache_key": prompt_cache_key(self.profile.role.value)},
                     )
                 elif "claude" in model_name.lower():
                     return ChatAnthropic(
@@ -164,23 +183,17 @@ class BaseAgent(ABC):
 
         try:
             # Build the reasoning prompt
-            system_prompt = f"""You are {self.profile.name}, a specialized AI agent for {self.profile.description}.
-
-Your task: {task.title}
-Description: {task.description}
-
-Think through this step-by-step:
-1. What data do you observe?
-2. What patterns or issues do you notice?
-3. What actions should be taken?
-4. What's your confidence in this assessment?
-
-Provide structured reasoning and a clear recommendation."""
+            # The system message is identical for every task of this role so
+            # provider-side prompt caching can reuse it; task details follow.
+            system_prompt = AGENT_SYSTEM_PROMPTS.get(
+                self.profile.role.value,
+                f"You are {self.profile.name}, a specialized AI agent for {self.profile.description}.",
+            ) + REASONING_INSTRUCTIONS
 
             # Create messages
             messages = [
                 SystemMessage(content=system_prompt),
-                ("human", prompt),
+                ("human", f"Your task: {task.title}\nDescription: {task.description}\n\n{prompt}"),
             ]
 
             # Step 2: Invoke LLM
@@ -257,7 +270,7 @@ Provide structured reasoning and a clear recommendation."""
 
     def get_capabilities(self) -> list[AgentCapability]:
         """Get the list of capabilities this agent has."""
-        return self.profile.capabilities
+        return list(self.profile.capabilities)
 
     def get_stats(self) -> dict[str, Any]:
         """Get performance statistics for this agent."""
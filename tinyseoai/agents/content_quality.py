@@ -6,8 +6,9 @@ from __future__ import annotations
 
 import json
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from ..utils.io import dumps_compact
 from ..utils.logging import get_logger
 from .base import AgentContext, BaseAgent
 from .models import AgentProfile, AgentResult, AgentRole, AgentTask
@@ -30,18 +31,19 @@ class ContentQualityAgent(BaseAgent):
     - Keyword optimization
     """
 
+    _PROFILE: ClassVar[AgentProfile] = AgentProfile(
+        role=AgentRole.CONTENT_QUALITY,
+        name="Content Quality Agent",
+        description="Specialist in on-page SEO and content optimization",
+        capabilities=(),
+        specialization=("content", "on-page", "copywriting", "user-experience"),
+        max_concurrent_tasks=3,
+        default_model="gpt-4o-mini",
+        fallback_models=("gpt-4o", "claude-3-5-sonnet-20241022"),
+    )
+
     def __init__(self, context: AgentContext | None = None, api_key: str | None = None):
-        profile = AgentProfile(
-            role=AgentRole.CONTENT_QUALITY,
-            name="Content Quality Agent",
-            description="Specialist in on-page SEO and content optimization",
-            capabilities=[],
-            specialization=["content", "on-page", "copywriting", "user-experience"],
-            max_concurrent_tasks=3,
-            default_model="gpt-4o-mini",
-            fallback_models=["gpt-4o", "claude-3-5-sonnet-20241022"],
-        )
-        super().__init__(profile, context, api_key)
+        super().__init__(self._PROFILE, context, api_key)
 
     def _initialize_tools(self) -> list[Any]:
         """Initialize tools (simplified for LangChain 1.0)."""
@@ -67,7 +69,7 @@ class ContentQualityAgent(BaseAgent):
                 ],
             }
 
-            return json.dumps(analysis, indent=2)
+            return dumps_compact(analysis)
 
         except Exception as e:
             return f"Error analyzing title tags: {e}"
@@ -89,7 +91,7 @@ class ContentQualityAgent(BaseAgent):
                 ],
             }
 
-            return json.dumps(analysis, indent=2)
+            return dumps_compact(analysis)
 
         except Exception as e:
             return f"Error analyzing meta descriptions: {e}"
@@ -111,7 +113,7 @@ class ContentQualityAgent(BaseAgent):
                 ],
             }
 
-            return json.dumps(analysis, indent=2)
+            return dumps_compact(analysis)
 
         except Exception as e:
             return f"Error analyzing headings: {e}"
@@ -7,7 +7,6 @@ Multi-agent coordinator for running SEO analysis with specialist agents.
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from ..data.models import AuditResult
@@ -20,6 +19,7 @@ from .models import (
     AgentMessage,
     AgentRole,
     AgentTask,
+    AuditView,
     MultiAgentSession,
     TaskStatus,
 )
@@ -33,8 +33,11 @@ logger = get_logger(__name__)
 class SimpleAgentContext:
     """Simple implementation of AgentContext for dependency injection."""
 
+    __slots__ = ("_audit_data", "_audit_view", "_session_id", "_messages")
+
     def __init__(self, audit_data: dict[str, Any], session_id: str):
         self._audit_data = audit_data
+        self._audit_view: AuditView | None = None
         self._session_id = session_id
         self._messages: list[AgentMessage] = []
 
@@ -42,6 +45,12 @@ class SimpleAgentContext:
         """Get audit data for analysis."""
         return self._audit_data
 
+    def get_audit_view(self) -> AuditView:
+        """Get the normalized audit view, built on first use and shared afterwards."""
+        if self._audit_view is None:
+            self._audit_view = AuditView.from_audit_data(self._audit_data)
+        return self._audit_view
+
     def get_session_id(self) -> str:
         """Get current session ID."""
         return self._session_id
@@ -166,21 +175,18 @@ class MultiAgentCoordinator:
 
         logger.info(f"Created {len(specialist_tasks)} tasks for specialist agents")
 
-        # Phase 2: Execute specialist agent tasks in parallel
+        # Phase 2 + 3: Specialists run in parallel; fix generation waits on all of them
         logger.info("Phase 2: Executing specialist agent tasks")
-        specialist_results = await self._execute_specialist_tasks(
-            specialist_tasks, enable_fix_generation
-        )
+        plan = list(specialist_tasks)
+        if enable_fix_generation:
+            logger.info("Phase 3: Code fix generation scheduled after specialists")
+            plan.append(self._build_fix_task(audit_data, specialist_tasks))
 
-        for result in specialist_results:
-            session.record_result(result)
+        results = await orchestrator.dispatch_plan(plan, self.agents)
+        specialist_results = [r for r in results if r.agent_role != AgentRole.FIX_GENERATOR]
 
-        # Phase 3: Optional fix generation
-        if enable_fix_generation:
-            logger.info("Phase 3: Generating code fixes")
-            fix_result = await self._generate_fixes(audit_data, specialist_results)
-            if fix_result:
-                session.record_result(fix_result)
+        for result in results:
+            session.record_result(result)
 
         # Mark session complete
         session.completed_at = orchestration_result.timestamp
@@ -195,65 +201,24 @@ class MultiAgentCoordinator:
 
         return synthesis
 
-    async def _execute_specialist_tasks(
-        self, tasks: list[AgentTask], include_fix_gen: bool
-    ) -> list[Any]:
-        """Execute specialist agent tasks in parallel."""
-        # Group tasks by agent
-        agent_tasks = {}
-        for task in tasks:
-            if task.assigned_to not in agent_tasks:
-                agent_tasks[task.assigned_to] = []
-            agent_tasks[task.assigned_to].append(task)
-
-        # Execute tasks in parallel
-        coroutines = []
-        for agent_role, role_tasks in agent_tasks.items():
-            if agent_role in self.agents:
-                agent = self.agents[agent_role]
-                for task in role_tasks:
-                    coroutines.append(agent.execute_task(task))
-
-        results = await asyncio.gather(*coroutines, return_exceptions=True)
-
-        # Filter out exceptions and log them
-        valid_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Agent task failed: {result}")
-            else:
-                valid_results.append(result)
-
-        return valid_results
-
-    async def _generate_fixes(
-        self, audit_data: dict[str, Any], specialist_results: list[Any]
-    ) -> Any | None:
-        """Generate code fixes based on specialist recommendations."""
-        try:
-            fix_generator = self.agents[AgentRole.FIX_GENERATOR]
-
-            # Collect all issues from specialist results
-            all_issues = audit_data.get("issues", [])
-
-            fix_task = AgentTask(
-                assigned_to=AgentRole.FIX_GENERATOR,
-                priority="high",
-                title="Generate Code Fixes",
-                description="Create production-ready code fixes for all identified issues",
-                context={
-                    "issues": all_issues[:20],  # Limit to top 20 issues
-                    "site_url": audit_data.get("site"),
-                    "platform": "generic",
-                },
-            )
-
-            result = await fix_generator.execute_task(fix_task)
-            return result
-
-        except Exception as e:
-            logger.error(f"Fix generation failed: {e}")
-            return None
+    def _build_fix_task(
+        self, audit_data: dict[str, Any], specialist_tasks: list[AgentTask]
+    ) -> AgentTask:
+        """Create the fix generation task, dependent on every specialist task."""
+        all_issues = audit_data.get("issues", [])
+
+        return AgentTask(
+            assigned_to=AgentRole.FIX_GENERATOR,
+            priority="high",
+            title="Generate Code Fixes",
+            description="Create production-ready code fixes for all identified issues",
+            context={
+                "issues": all_issues[:20],  # Limit to top 20 issues
+                "site_url": audit_data.get("site"),
+                "platform": "generic",
+            },
+            dependencies=[task.id for task in specialist_tasks],
+        )
 
     def _synthesize_results(
         self,
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import json
 import time
-from typing import Any
+from typing import Any, ClassVar
 
 from ..utils.logging import get_logger
 from .base import AgentContext, BaseAgent
@@ -29,18 +29,19 @@ class FixGeneratorAgent(BaseAgent):
     - Security header configuration
     """
 
+    _PROFILE: ClassVar[AgentProfile] = AgentProfile(
+        role=AgentRole.FIX_GENERATOR,
+        name="Fix Generator Agent",
+        description="Specialist in creating code fixes and implementation guides",
+        capabilities=(),
+        specialization=("code-generation", "implementation", "automation"),
+        max_concurrent_tasks=5,
+        default_model="gpt-4o",  # Use stronger model for code generation
+        fallback_models=("gpt-4o-mini", "claude-3-5-sonnet-20241022"),
+    )
+
     def __init__(self, context: AgentContext | None = None, api_key: str | None = None):
-        profile = AgentProfile(
-            role=AgentRole.FIX_GENERATOR,
-            name="Fix Generator Agent",
-            description="Specialist in creating code fixes and implementation guides",
-            capabilities=[],
-            specialization=["code-generation", "implementation", "automation"],
-            max_concurrent_tasks=5,
-            default_model="gpt-4o",  # Use stronger model for code generation
-            fallback_models=["gpt-4o-mini", "claude-3-5-sonnet-20241022"],
-        )
-        super().__init__(profile, context, api_key)
+        super().__init__(self._PROFILE, context, api_key)
 
     def _initialize_tools(self) -> list[Any]:
         """Initialize tools (simplified for LangChain 1.0)."""
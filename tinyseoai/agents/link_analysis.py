@@ -4,9 +4,8 @@ Link Analysis Agent - Specialist in internal link structure and link graph optim
 
 from __future__ import annotations
 
-import json
 import time
-from typing import Any
+from typing import Any, ClassVar
 
 from ..utils.logging import get_logger
 from .base import AgentContext, BaseAgent
@@ -29,89 +28,67 @@ class LinkAnalysisAgent(BaseAgent):
     - Site architecture
     """
 
+    _PROFILE: ClassVar[AgentProfile] = AgentProfile(
+        role=AgentRole.LINK_ANALYSIS,
+        name="Link Analysis Agent",
+        description="Specialist in internal link structure and link graph optimization",
+        capabilities=(),
+        specialization=("links", "site-architecture", "crawlability", "link-equity"),
+        max_concurrent_tasks=3,
+        default_model="gpt-4o-mini",
+        fallback_models=("gpt-4o",),
+    )
+
     def __init__(self, context: AgentContext | None = None, api_key: str | None = None):
-        profile = AgentProfile(
-            role=AgentRole.LINK_ANALYSIS,
-            name="Link Analysis Agent",
-            description="Specialist in internal link structure and link graph optimization",
-            capabilities=[],
-            specialization=["links", "site-architecture", "crawlability", "link-equity"],
-            max_concurrent_tasks=3,
-            default_model="gpt-4o-mini",
-            fallback_models=["gpt-4o"],
-        )
-        super().__init__(profile, context, api_key)
+        super().__init__(self._PROFILE, context, api_key)
 
     def _initialize_tools(self) -> list[Any]:
         """Initialize tools (simplified for LangChain 1.0)."""
         return []
 
-
-    def _analyze_broken_links(self, issues_json: str) -> str:
-        """Analyze broken link issues."""
-        try:
-            issues = json.loads(issues_json)
-            broken_links = [
-                i for i in issues if "broken" in i.get("type", "").lower() or "404" in i.get("type", "").lower()
-            ]
-
-            analysis = {
-                "count": len(broken_links),
-                "recommendations": [
-                    "Fix or remove broken links to improve user experience",
-                    "Update links pointing to moved content",
-                    "Implement 301 redirects for permanently moved pages",
-                ],
-            }
-
-            return json.dumps(analysis, indent=2)
-
-        except Exception as e:
-            return f"Error analyzing broken links: {e}"
-
-    def _analyze_orphan_pages(self, issues_json: str) -> str:
-        """Analyze orphan page issues."""
-        try:
-            issues = json.loads(issues_json)
-            orphan_issues = [
-                i for i in issues if "orphan" in i.get("type", "").lower()
-            ]
-
-            analysis = {
-                "count": len(orphan_issues),
-                "recommendations": [
-                    "Add internal links to orphan pages from relevant content",
-                    "Include orphan pages in navigation or sitemap",
-                    "Consider if orphan pages should be kept or removed",
-                ],
-            }
-
-            return json.dumps(analysis, indent=2)
-
-        except Exception as e:
-            return f"Error analyzing orphan pages: {e}"
-
-    def _analyze_redirects(self, issues_json: str) -> str:
-        """Analyze redirect chain issues."""
-        try:
-            issues = json.loads(issues_json)
-            redirect_issues = [
-                i for i in issues if "redirect" in i.get("type", "").lower()
-            ]
-
-            analysis = {
-                "count": len(redirect_issues),
-                "recommendations": [
-                    "Reduce redirect chains to maximum 1-2 hops",
-                    "Fix redirect loops that prevent page access",
-                    "Use 301 redirects for permanent moves",
-                ],
-            }
-
-            return json.dumps(analysis, indent=2)
-
-        except Exception as e:
-            return f"Error analyzing redirects: {e}"
+    def _dedupe_issues(self, issues: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Drop repeated issues so they are not double-counted.
+
+        Issues are keyed on (url, type, detail), since one page can report
+        several broken links that differ only in detail; issues without a URL
+        fall back to their full set of fields.
+        """
+        seen: set[Any] = set()
+        unique = []
+
+        for issue in issues:
+            url = issue.get("url")
+            if url:
+                key: Any = (url, issue.get("type", ""), issue.get("detail"))
+            else:
+                key = frozenset((k, str(v)) for k, v in issue.items())
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(issue)
+
+        return unique
+
+    def _classify_issues(self, issues: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+        """
+        Bucket issues into broken/orphan/redirect groups in a single pass.
+
+        Args:
+            issues: Parsed issue dictionaries
+        """
+        buckets: dict[str, list[dict[str, Any]]] = {"broken": [], "orphan": [], "redirect": []}
+
+        for issue in issues:
+            issue_type = issue.get("type", "").lower()
+            if "broken" in issue_type or "404" in issue_type:
+                buckets["broken"].append(issue)
+            if "orphan" in issue_type:
+                buckets["orphan"].append(issue)
+            if "redirect" in issue_type:
+                buckets["redirect"].append(issue)
+
+        return buckets
 
     async def execute_task(self, task: AgentTask) -> AgentResult:
         """Execute link analysis task."""
@@ -125,7 +102,7 @@ class LinkAnalysisAgent(BaseAgent):
 
         try:
             # Extract context
-            issues = task.context.get("issues", [])
+            issues = self._dedupe_issues(task.context.get("issues", []))
             site_url = task.context.get("site_url", "unknown")
             link_graph_data = task.context.get("link_graph_data", {})
 
@@ -148,8 +125,11 @@ class LinkAnalysisAgent(BaseAgent):
             # Run analysis with chain of thought
             result_data = await self.reason_with_chain_of_thought(task, prompt, cot)
 
+            # Classify once; insights and recommendations share the buckets
+            buckets = self._classify_issues(issues)
+
             # Extract insights
-            insights = self._extract_link_insights(issues)
+            insights = self._extract_link_insights(buckets)
 
             # Create result
             result = AgentResult(
@@ -165,7 +145,7 @@ class LinkAnalysisAgent(BaseAgent):
             )
 
             # Add recommendations
-            self._add_link_recommendations(result, issues)
+            self._add_link_recommendations(result, buckets)
 
             # Update stats
             self.tasks_completed += 1
@@ -194,28 +174,26 @@ class LinkAnalysisAgent(BaseAgent):
             task.fail(str(e))
             return result
 
-    def _extract_link_insights(self, issues: list[dict[str, Any]]) -> list[str]:
+    def _extract_link_insights(self, buckets: dict[str, list[dict[str, Any]]]) -> list[str]:
         """Extract link analysis insights."""
         insights = []
 
         # Broken links
-        broken_links = [
-            i for i in issues if "broken" in i.get("type", "").lower() or "404" in i.get("type", "").lower()
-        ]
+        broken_links = buckets["broken"]
         if broken_links:
             insights.append(
                 f"Link Alert: {len(broken_links)} broken links found - fix these to improve user experience and SEO"
             )
 
         # Orphan pages
-        orphan_issues = [i for i in issues if "orphan" in i.get("type", "").lower()]
+        orphan_issues = buckets["orphan"]
         if orphan_issues:
             insights.append(
                 f"Architecture Issue: {len(orphan_issues)} orphan pages - these pages have no internal links and may not be crawled"
             )
 
         # Redirects
-        redirect_issues = [i for i in issues if "redirect" in i.get("type", "").lower()]
+        redirect_issues = buckets["redirect"]
         if redirect_issues:
             insights.append(
                 f"Found {len(redirect_issues)} redirect issues - chains and loops slow down crawling"
@@ -224,13 +202,11 @@ class LinkAnalysisAgent(BaseAgent):
         return insights
 
     def _add_link_recommendations(
-        self, result: AgentResult, issues: list[dict[str, Any]]
+        self, result: AgentResult, buckets: dict[str, list[dict[str, Any]]]
     ) -> None:
         """Add link optimization recommendations."""
         # Broken links
-        broken_links = [
-            i for i in issues if "broken" in i.get("type", "").lower() or "404" in i.get("type", "").lower()
-        ]
+        broken_links = buckets["broken"]
         if broken_links:
             result.add_recommendation(
                 title="Fix Broken Links",
@@ -242,7 +218,7 @@ class LinkAnalysisAgent(BaseAgent):
             )
 
         # Orphan pages
-        orphan_issues = [i for i in issues if "orphan" in i.get("type", "").lower()]
+        orphan_issues = buckets["orphan"]
         if orphan_issues:
             result.add_recommendation(
                 title="Connect Orphan Pages",
@@ -254,7 +230,7 @@ class LinkAnalysisAgent(BaseAgent):
             )
 
         # Redirects
-        redirect_issues = [i for i in issues if "redirect" in i.get("type", "").lower()]
+        redirect_issues = buckets["redirect"]
         if redirect_issues:
             result.add_recommendation(
                 title="Optimize Redirect Chains",
@@ -4,11 +4,19 @@ Data models for the multi-agent AI system.
 
 from __future__ import annotations
 
+import io
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ._scan import IssueScan, scan_issues
+
+# Upper-cased step type labels, filled on first use by ChainOfThought.get_summary
+_STEP_TYPE_UPPER: dict[str, str] = {}
 
 
 class AgentRole(str, Enum):
@@ -51,6 +59,14 @@ class MessageType(str, Enum):
     ERROR = "error"
 
 
+class TaskEvent(StrEnum):
+    """Task lifecycle events published while a task plan is dispatched."""
+
+    TASK_STARTED = "task_started"
+    TASK_COMPLETED = "task_completed"
+    TASK_FAILED = "task_failed"
+
+
 class AgentMessage(BaseModel):
     """Message passed between agents."""
 
@@ -66,6 +82,10 @@ class AgentMessage(BaseModel):
 class ThoughtStep(BaseModel):
     """A single step in chain-of-thought reasoning."""
 
+    # Steps are never edited after being recorded; freezing them lets pydantic skip
+    # revalidation on assignment and makes them safe to share between results.
+    model_config = ConfigDict(frozen=True)
+
     step_number: int
     type: str  # observation, reflection, planning, action, verification
     content: str
@@ -105,14 +125,18 @@ class ChainOfThought(BaseModel):
 
     def get_summary(self) -> str:
         """Get a human-readable summary of the reasoning chain."""
-        lines = [f"🧠 Chain of Thought for {self.agent_role.value}:", f"Goal: {self.goal}", ""]
+        buf = io.StringIO()
+        buf.write(f"🧠 Chain of Thought for {self.agent_role.value}:\nGoal: {self.goal}\n")
         for step in self.steps:
-            lines.append(f"{step.step_number}. [{step.type.upper()}] {step.content}")
+            label = _STEP_TYPE_UPPER.get(step.type)
+            if label is None:
+                label = _STEP_TYPE_UPPER.setdefault(step.type, step.type.upper())
+            buf.write(f"\n{step.step_number}. [{label}] {step.content}")
             if step.confidence < 1.0:
-                lines.append(f"   Confidence: {step.confidence:.2%}")
+                buf.write(f"\n   Confidence: {step.confidence:.2%}")
         if self.final_decision:
-            lines.append(f"\n✓ Final Decision: {self.final_decision}")
-        return "\n".join(lines)
+            buf.write(f"\n\n✓ Final Decision: {self.final_decision}")
+        return buf.getvalue()
 
 
 class AgentTask(BaseModel):
@@ -209,14 +233,18 @@ class AgentCapability(BaseModel):
 class AgentProfile(BaseModel):
     """Profile information for an agent."""
 
+    # Each agent class shares one profile between all its instances, so it
+    # must not be modifiable in place.
+    model_config = ConfigDict(frozen=True)
+
     role: AgentRole
     name: str
     description: str
-    capabilities: list[AgentCapability]
-    specialization: list[str]  # e.g., ["technical", "security", "performance"]
+    capabilities: tuple[AgentCapability, ...]
+    specialization: tuple[str, ...]  # e.g., ("technical", "security", "performance")
     max_concurrent_tasks: int = 3
     default_model: str = "gpt-4o-mini"
-    fallback_models: list[str] = Field(default_factory=lambda: ["gpt-4o", "claude-3-5-sonnet"])
+    fallback_models: tuple[str, ...] = ("gpt-4o", "claude-3-5-sonnet")
 
 
 class MultiAgentSession(BaseModel):
@@ -258,9 +286,62 @@ class MultiAgentSession(BaseModel):
         """Get all pending tasks."""
         return [t for t in self.tasks if t.status == TaskStatus.PENDING]
 
+    def export(self) -> dict[str, Any]:
+        """
+        Dump the session for persistence or reporting.
+
+        Unset optional fields (e.g. step supporting_data) are skipped, which
+        keeps exports of long reasoning chains small. Defaults are kept, since
+        values such as initiated_by or a 0.0 confidence are meaningful.
+        """
+        return self.model_dump(mode="python", exclude_none=True)
+
     def is_complete(self) -> bool:
         """Check if all tasks are completed."""
         return all(
             t.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]
             for t in self.tasks
         )
+
+
+@dataclass(slots=True, frozen=True)
+class AuditView:
+    """
+    Column-oriented view of the audit fields agents iterate over.
+
+    Issue types and severities are normalized once into lists parallel to
+    ``issues``, so classification loops walk plain strings and only index back
+    into the issue dicts when building task payloads.
+    """
+
+    site: str
+    health_score: float
+    pages_scanned: int
+    issues: list[dict[str, Any]]
+    types_lc: list[str]
+    severities: list[str]
+    _issue_scan: IssueScan | None = field(default=None, init=False, repr=False, compare=False)
+
+    def issue_scan(self) -> IssueScan:
+        """Classify the issues on first use; planning, summaries and insights share the result."""
+        scan = self._issue_scan
+        if scan is None:
+            scan = scan_issues(self.issues, self.types_lc, self.severities)
+            # The view is frozen; the scan is only a cache derived from its columns
+            object.__setattr__(self, "_issue_scan", scan)
+        return scan
+
+    @classmethod
+    def from_audit_data(cls, audit_data: dict[str, Any]) -> AuditView:
+        """Build a view from an audit data dict (as returned by get_audit_data)."""
+        issues = audit_data.get("issues", [])
+        return cls(
+            site=audit_data.get("site", "unknown"),
+            health_score=audit_data.get("meta", {}).get("health_score", 0),
+            pages_scanned=audit_data.get("pages_scanned", 0),
+            issues=issues,
+            # Interned so the few distinct values are shared and compare by identity
+            # in the Counter/dict lookups that consume these columns
+            types_lc=[sys.intern(issue.get("type", "unknown").lower()) for issue in issues],
+            severities=[sys.intern(issue.get("severity", "info")) for issue in issues],
+        )
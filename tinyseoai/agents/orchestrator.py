@@ -4,25 +4,131 @@ Orchestrator Agent - Central coordinator for the multi-agent system.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
-from typing import Any
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable
+from typing import Any, ClassVar
 
+from ..utils.io import dumps_compact
 from ..utils.logging import get_logger
+from ._scan import IssueScan, classify_issue_type, lowered_issue_types
 from .base import AgentContext, BaseAgent
 from .models import (
     AgentProfile,
     AgentResult,
     AgentRole,
     AgentTask,
+    AuditView,
+    TaskEvent,
     TaskPriority,
 )
-from .prompts import (
-    format_orchestrator_planning_prompt,
-)
+from .prompts import cached_prompt, format_orchestrator_planning_prompt
 
 logger = get_logger(__name__)
 
+# (minimum issue count, priority, impact) for agent deployment recommendations,
+# checked top to bottom; the last rung always matches.
+PRIORITY_LADDER: tuple[tuple[int, str, float], ...] = (
+    (5, "high", 8.0),
+    (3, "medium", 6.0),
+    (0, "low", 4.0),
+)
+
+# One specialist task per row, emitted in this order when its agent has issues:
+# (role, priority, title, description template, extra context key, extra context builder)
+TASK_SPECS: tuple[
+    tuple[AgentRole, TaskPriority, str, str, str, Callable[[dict[str, Any]], dict[str, Any]]],
+    ...,
+] = (
+    (
+        AgentRole.TECHNICAL_SEO,
+        TaskPriority.CRITICAL,
+        "Analyze Technical SEO Issues",
+        "Analyze {count} technical SEO issues including HTTPS, robots.txt, sitemaps, and security",
+        "metadata",
+        lambda audit_data: audit_data.get("meta", {}),
+    ),
+    (
+        AgentRole.CONTENT_QUALITY,
+        TaskPriority.HIGH,
+        "Analyze Content Quality Issues",
+        "Analyze {count} content quality issues including titles, meta descriptions, and headings",
+        "content_data",
+        lambda audit_data: {},
+    ),
+    (
+        AgentRole.PERFORMANCE,
+        TaskPriority.MEDIUM,
+        "Analyze Performance Issues",
+        "Analyze {count} performance issues including image optimization and render-blocking resources",
+        "performance_data",
+        lambda audit_data: {},
+    ),
+    (
+        AgentRole.LINK_ANALYSIS,
+        TaskPriority.MEDIUM,
+        "Analyze Link Structure Issues",
+        "Analyze {count} link-related issues including broken links and orphan pages",
+        "link_graph_data",
+        lambda audit_data: {},
+    ),
+)
+
+
+def _dependency_waits(tasks: list[AgentTask]) -> list[set[int]]:
+    """
+    Index sets of the tasks each task must wait for, with cycles broken.
+
+    Runs Kahn's algorithm over ``task.dependencies``. Whenever no task is
+    ready, the remaining tasks all sit on or behind a cycle, so the earliest
+    one in plan order stops waiting for its unfinished dependencies. Unknown
+    and self-referencing IDs are ignored.
+
+    Args:
+        tasks: Tasks of one plan
+
+    Returns:
+        For each task, the indexes of the tasks it waits for
+    """
+    indexes_by_id: dict[str, list[int]] = defaultdict(list)
+    for index, task in enumerate(tasks):
+        indexes_by_id[task.id].append(index)
+
+    waits = [
+        {j for dependency in task.dependencies for j in indexes_by_id.get(dependency, ()) if j != i}
+        for i, task in enumerate(tasks)
+    ]
+    pending = [set(wait) for wait in waits]
+    dependants: list[list[int]] = [[] for _ in tasks]
+    for i, wait in enumerate(waits):
+        for j in wait:
+            dependants[j].append(i)
+
+    ready = deque(i for i, wait in enumerate(pending) if not wait)
+    resolved = [False] * len(tasks)
+    for _ in tasks:
+        if not ready:
+            stuck = resolved.index(False)
+            logger.warning(
+                f"Dependency cycle in task plan: {tasks[stuck].id} no longer waits for "
+                f"{sorted(tasks[j].id for j in pending[stuck])}"
+            )
+            waits[stuck] -= pending[stuck]
+            pending[stuck].clear()
+            ready.append(stuck)
+
+        i = ready.popleft()
+        resolved[i] = True
+        for dependant in dependants[i]:
+            if i in pending[dependant]:
+                pending[dependant].remove(i)
+                if not pending[dependant]:
+                    ready.append(dependant)
+
+    return waits
+
 
 class OrchestratorAgent(BaseAgent):
     """
@@ -36,162 +142,100 @@ class OrchestratorAgent(BaseAgent):
     - Generate final comprehensive recommendations
     """
 
+    _PROFILE: ClassVar[AgentProfile] = AgentProfile(
+        role=AgentRole.ORCHESTRATOR,
+        name="Orchestrator Agent",
+        description="Central coordinator for multi-agent SEO analysis",
+        capabilities=(),
+        specialization=("coordination", "planning", "synthesis"),
+        max_concurrent_tasks=10,
+        default_model="gpt-4o",
+        fallback_models=("gpt-4o-mini", "claude-3-5-sonnet-20241022"),
+    )
+
     def __init__(self, context: AgentContext | None = None, api_key: str | None = None):
-        profile = AgentProfile(
-            role=AgentRole.ORCHESTRATOR,
-            name="Orchestrator Agent",
-            description="Central coordinator for multi-agent SEO analysis",
-            capabilities=[],
-            specialization=["coordination", "planning", "synthesis"],
-            max_concurrent_tasks=10,
-            default_model="gpt-4o",
-            fallback_models=["gpt-4o-mini", "claude-3-5-sonnet-20241022"],
-        )
-        super().__init__(profile, context, api_key)
+        super().__init__(self._PROFILE, context, api_key)
+        # View built for a context without get_audit_view, with the data it came from
+        self._context_view: tuple[dict[str, Any], AuditView] | None = None
 
     def _initialize_tools(self) -> list[Any]:
         """Initialize tools (simplified for LangChain 1.0)."""
         return []
 
+    def _summarize_audit(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Summarize audit data into severity and category statistics."""
+        scan = self._audit_view(data).issue_scan()
+
+        return {
+            "total_issues": scan.total,
+            "by_severity": scan.severity_counts,
+            "by_category": scan.by_category,
+            "health_score": data.get("meta", {}).get("health_score", 0),
+        }
+
+    def _categorize_issues(self, issues: list[dict[str, Any]]) -> dict[str, Any]:
+        """Categorize issues and map to specialist agents."""
+        agent_mapping: dict[str, list[dict[str, Any]]] = defaultdict(list)
+
+        for issue, issue_type in zip(issues, lowered_issue_types(issues), strict=True):
+            agent = classify_issue_type(issue_type) or "general"
+            agent_mapping[agent].append(issue)
+
+        return {
+            agent: {"count": len(issues_list), "sample": issues_list[:3]}
+            for agent, issues_list in agent_mapping.items()
+        }
+
+    def _build_execution_plan(self) -> dict[str, Any]:
+        """Create a structured execution plan."""
+        return {
+            "phases": [
+                {
+                    "name": "Technical Foundation",
+                    "agents": ["technical_seo"],
+                    "priority": "critical",
+                    "rationale": "Fix crawlability and indexability issues first",
+                },
+                {
+                    "name": "Content Optimization",
+                    "agents": ["content_quality"],
+                    "priority": "high",
+                    "rationale": "Optimize on-page elements for better rankings",
+                },
+                {
+                    "name": "Performance & Links",
+                    "agents": ["performance", "link_analysis"],
+                    "priority": "medium",
+                    "rationale": "Improve site speed and internal linking",
+                },
+                {
+                    "name": "Fix Generation",
+                    "agents": ["fix_generator"],
+                    "priority": "high",
+                    "rationale": "Generate implementation code for all fixes",
+                },
+            ],
+            "estimated_duration_minutes": 10,
+            "parallel_execution": True,
+        }
 
     def _analyze_audit_data(self, audit_json: str) -> str:
-        """Analyze audit data and return summary statistics."""
+        """Tool wrapper: summarize audit data given as JSON."""
         try:
-            data = json.loads(audit_json)
-            issues = data.get("issues", [])
-
-            # Count by severity
-            severity_counts = {"high": 0, "medium": 0, "low": 0, "info": 0}
-            for issue in issues:
-                severity = issue.get("severity", "info")
-                severity_counts[severity] = severity_counts.get(severity, 0) + 1
-
-            # Count by category
-            category_counts: dict[str, int] = {}
-            for issue in issues:
-                issue_type = issue.get("type", "unknown")
-                # Categorize by issue type
-                if "https" in issue_type or "ssl" in issue_type or "security" in issue_type:
-                    category = "technical_seo"
-                elif (
-                    "title" in issue_type
-                    or "meta" in issue_type
-                    or "heading" in issue_type
-                    or "content" in issue_type
-                ):
-                    category = "content"
-                elif "performance" in issue_type or "image" in issue_type or "speed" in issue_type:
-                    category = "performance"
-                elif "link" in issue_type or "redirect" in issue_type:
-                    category = "links"
-                else:
-                    category = "other"
-
-                category_counts[category] = category_counts.get(category, 0) + 1
-
-            summary = {
-                "total_issues": len(issues),
-                "by_severity": severity_counts,
-                "by_category": category_counts,
-                "health_score": data.get("meta", {}).get("health_score", 0),
-            }
-
-            return json.dumps(summary, indent=2)
-
+            return dumps_compact(self._summarize_audit(json.loads(audit_json)))
         except Exception as e:
             return f"Error analyzing audit data: {e}"
 
-    def _categorize_issues(self, issues_json: str) -> str:
-        """Categorize issues and map to specialist agents."""
+    def _categorize_issues_json(self, issues_json: str) -> str:
+        """Tool wrapper: categorize issues given as JSON."""
         try:
-            issues = json.loads(issues_json)
-
-            agent_mapping = {
-                "technical_seo": [],
-                "content_quality": [],
-                "performance": [],
-                "link_analysis": [],
-                "general": [],
-            }
-
-            for issue in issues:
-                issue_type = issue.get("type", "unknown").lower()
-
-                # Map to appropriate agent
-                if any(
-                    keyword in issue_type
-                    for keyword in ["https", "ssl", "robots", "sitemap", "canonical", "security"]
-                ):
-                    agent_mapping["technical_seo"].append(issue)
-                elif any(
-                    keyword in issue_type
-                    for keyword in ["title", "meta", "heading", "content", "duplicate", "readability"]
-                ):
-                    agent_mapping["content_quality"].append(issue)
-                elif any(
-                    keyword in issue_type
-                    for keyword in ["performance", "image", "speed", "render", "cache"]
-                ):
-                    agent_mapping["performance"].append(issue)
-                elif any(
-                    keyword in issue_type for keyword in ["link", "broken", "redirect", "orphan"]
-                ):
-                    agent_mapping["link_analysis"].append(issue)
-                else:
-                    agent_mapping["general"].append(issue)
-
-            # Create summary
-            summary = {
-                agent: {"count": len(issues_list), "sample": issues_list[:3]}
-                for agent, issues_list in agent_mapping.items()
-                if issues_list
-            }
-
-            return json.dumps(summary, indent=2)
-
+            return dumps_compact(self._categorize_issues(json.loads(issues_json)))
         except Exception as e:
             return f"Error categorizing issues: {e}"
 
     def _create_execution_plan(self, analysis_json: str) -> str:
-        """Create a structured execution plan."""
-        try:
-            json.loads(analysis_json)
-
-            plan = {
-                "phases": [
-                    {
-                        "name": "Technical Foundation",
-                        "agents": ["technical_seo"],
-                        "priority": "critical",
-                        "rationale": "Fix crawlability and indexability issues first",
-                    },
-                    {
-                        "name": "Content Optimization",
-                        "agents": ["content_quality"],
-                        "priority": "high",
-                        "rationale": "Optimize on-page elements for better rankings",
-                    },
-                    {
-                        "name": "Performance & Links",
-                        "agents": ["performance", "link_analysis"],
-                        "priority": "medium",
-                        "rationale": "Improve site speed and internal linking",
-                    },
-                    {
-                        "name": "Fix Generation",
-                        "agents": ["fix_generator"],
-                        "priority": "high",
-                        "rationale": "Generate implementation code for all fixes",
-                    },
-                ],
-                "estimated_duration_minutes": 10,
-                "parallel_execution": True,
-            }
-
-            return json.dumps(plan, indent=2)
-
-        except Exception as e:
-            return f"Error creating execution plan: {e}"
+        """Tool wrapper: return the execution plan as JSON (the analysis is not used)."""
+        return dumps_compact(self._build_execution_plan())
 
     async def execute_task(self, task: AgentTask) -> AgentResult:
         """
@@ -199,7 +243,7 @@ class OrchestratorAgent(BaseAgent):
 
         The orchestrator analyzes audit data and creates a task distribution plan.
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         task.start()
 
         # Create chain of thought
@@ -213,17 +257,28 @@ class OrchestratorAgent(BaseAgent):
                 raise ValueError("Orchestrator requires context to access audit data")
 
             audit_data = self.context.get_audit_data()
+            view = self._audit_view(audit_data)
 
             cot.add_step(
                 "observation",
-                f"Received audit data for {audit_data.get('site', 'unknown')} "
-                f"with {len(audit_data.get('issues', []))} issues",
+                f"Received audit data for {view.site} with {len(view.issues)} issues",
                 confidence=1.0,
-                supporting_data={"issue_count": len(audit_data.get("issues", []))},
+                supporting_data={"issue_count": len(view.issues)},
             )
 
-            # Analyze the audit results
-            prompt = format_orchestrator_planning_prompt(audit_data)
+            # Analyze the audit results (prompt memoized on exactly the inputs it
+            # renders, so retries on the same audit skip re-formatting; the
+            # severity column is keyed by its counts, the only part rendered)
+            prompt_key = (
+                self.profile.role.value,
+                view.site,
+                view.pages_scanned,
+                view.health_score,
+                tuple(sorted(Counter(view.severities).items())),
+            )
+            prompt = cached_prompt(
+                prompt_key, lambda: format_orchestrator_planning_prompt(audit_data)
+            )
 
             cot.add_step(
                 "planning",
@@ -231,11 +286,15 @@ class OrchestratorAgent(BaseAgent):
                 confidence=0.95,
             )
 
-            # Use LLM to create execution plan
-            result_data = await self.reason_with_chain_of_thought(task, prompt, cot)
+            # Use LLM to create execution plan; the issue scan feeding insights and
+            # recommendations runs in a worker thread behind the LLM round-trip and
+            # stays on the view for the task distribution plan
+            result_data, scan = await asyncio.gather(
+                self.reason_with_chain_of_thought(task, prompt, cot),
+                asyncio.to_thread(view.issue_scan),
+            )
 
-            # Extract insights
-            insights = self._extract_insights(audit_data, result_data)
+            insights = self._extract_insights(scan, view.health_score)
 
             # Create result
             result = AgentResult(
@@ -245,13 +304,13 @@ class OrchestratorAgent(BaseAgent):
                 data=result_data,
                 insights=insights,
                 chain_of_thought=cot,
-                execution_time_ms=(time.time() - start_time) * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
                 model_used=self.profile.default_model,
                 confidence=cot.confidence_score,
             )
 
             # Generate recommendations
-            self._add_orchestration_recommendations(result, audit_data)
+            self._add_orchestration_recommendations(result, scan)
 
             # Update stats
             self.tasks_completed += 1
@@ -274,21 +333,16 @@ class OrchestratorAgent(BaseAgent):
                 success=False,
                 data={"error": str(e)},
                 chain_of_thought=cot,
-                execution_time_ms=(time.time() - start_time) * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
             )
 
             task.fail(str(e))
             return result
 
-    def _extract_insights(
-        self, audit_data: dict[str, Any], result_data: dict[str, Any]
-    ) -> list[str]:
+    def _extract_insights(self, scan: IssueScan, health_score: float) -> list[str]:
         """Extract key insights from orchestration analysis."""
         insights = []
 
-        issues = audit_data.get("issues", [])
-        health_score = audit_data.get("meta", {}).get("health_score", 0)
-
         # Overall health insight
         if health_score < 50:
             insights.append(
@@ -300,77 +354,34 @@ class OrchestratorAgent(BaseAgent):
             )
 
         # Count high severity issues
-        high_severity = [i for i in issues if i.get("severity") == "high"]
-        if high_severity:
+        if scan.high_severity_count:
             insights.append(
-                f"Found {len(high_severity)} high-severity issues requiring immediate attention"
+                f"Found {scan.high_severity_count} high-severity issues requiring immediate attention"
             )
 
         # Check for security issues
-        security_issues = [
-            i
-            for i in issues
-            if any(
-                keyword in i.get("type", "").lower() for keyword in ["https", "ssl", "security"]
-            )
-        ]
-        if security_issues:
+        if scan.security_count:
             insights.append(
-                f"Security concerns detected: {len(security_issues)} issues affecting site trustworthiness"
+                f"Security concerns detected: {scan.security_count} issues affecting site trustworthiness"
             )
 
         # Check for indexability issues
-        indexability_issues = [
-            i
-            for i in issues
-            if any(
-                keyword in i.get("type", "").lower()
-                for keyword in ["robots", "canonical", "index"]
-            )
-        ]
-        if indexability_issues:
+        if scan.indexability_count:
             insights.append(
-                f"Indexability issues found: {len(indexability_issues)} problems may prevent proper indexing"
+                f"Indexability issues found: {scan.indexability_count} problems may prevent proper indexing"
             )
 
         return insights
 
-    def _add_orchestration_recommendations(
-        self, result: AgentResult, audit_data: dict[str, Any]
-    ) -> None:
+    def _add_orchestration_recommendations(self, result: AgentResult, scan: IssueScan) -> None:
         """Add orchestration-level recommendations."""
-        issues = audit_data.get("issues", [])
-
         # Recommend specialist agent deployment
-        agent_recommendations = {}
-
-        for issue in issues:
-            issue_type = issue.get("type", "").lower()
-
-            # Map to agents
-            if any(
-                keyword in issue_type
-                for keyword in ["https", "ssl", "robots", "sitemap", "canonical"]
-            ):
-                agent_recommendations.setdefault("technical_seo", []).append(issue)
-            elif any(keyword in issue_type for keyword in ["title", "meta", "content"]):
-                agent_recommendations.setdefault("content_quality", []).append(issue)
-            elif any(keyword in issue_type for keyword in ["performance", "image", "speed"]):
-                agent_recommendations.setdefault("performance", []).append(issue)
-            elif any(keyword in issue_type for keyword in ["link", "broken", "redirect"]):
-                agent_recommendations.setdefault("link_analysis", []).append(issue)
-
-        # Create recommendations
-        for agent, agent_issues in agent_recommendations.items():
-            if len(agent_issues) >= 5:
-                priority = "high"
-                impact = 8.0
-            elif len(agent_issues) >= 3:
-                priority = "medium"
-                impact = 6.0
-            else:
-                priority = "low"
-                impact = 4.0
+        for agent, agent_issues in scan.by_agent.items():
+            priority, impact = next(
+                (priority, impact)
+                for min_issues, priority, impact in PRIORITY_LADDER
+                if len(agent_issues) >= min_issues
+            )
 
             result.add_recommendation(
                 title=f"Deploy {agent.replace('_', ' ').title()} Agent",
@@ -382,9 +393,26 @@ class OrchestratorAgent(BaseAgent):
                 issue_count=len(agent_issues),
             )
 
-    def create_task_distribution_plan(
-        self, audit_data: dict[str, Any]
-    ) -> list[AgentTask]:
+    def _audit_view(self, audit_data: dict[str, Any]) -> AuditView:
+        """
+        Reuse one view per audit when audit_data is the context's own data.
+
+        The context's shared view is used when it offers get_audit_view;
+        otherwise the view built here is kept for the same data object.
+        """
+        if self.context is None or self.context.get_audit_data() is not audit_data:
+            return AuditView.from_audit_data(audit_data)
+
+        get_audit_view = getattr(self.context, "get_audit_view", None)
+        if get_audit_view is not None:
+            view: AuditView = get_audit_view()
+            return view
+
+        if self._context_view is None or self._context_view[0] is not audit_data:
+            self._context_view = (audit_data, AuditView.from_audit_data(audit_data))
+        return self._context_view[1]
+
+    def create_task_distribution_plan(self, audit_data: dict[str, Any]) -> list[AgentTask]:
         """
         Create a list of tasks for specialist agents based on audit results.
 
@@ -392,94 +420,102 @@ class OrchestratorAgent(BaseAgent):
             List of AgentTask objects ready for execution
         """
         tasks: list[AgentTask] = []
-        issues = audit_data.get("issues", [])
-
-        # Group issues by agent category
-        technical_issues = []
-        content_issues = []
-        performance_issues = []
-        link_issues = []
-
-        for issue in issues:
-            issue_type = issue.get("type", "").lower()
-
-            if any(
-                keyword in issue_type
-                for keyword in ["https", "ssl", "robots", "sitemap", "canonical", "security"]
-            ):
-                technical_issues.append(issue)
-            elif any(
-                keyword in issue_type
-                for keyword in ["title", "meta", "heading", "content", "duplicate"]
-            ):
-                content_issues.append(issue)
-            elif any(
-                keyword in issue_type for keyword in ["performance", "image", "speed", "render"]
-            ):
-                performance_issues.append(issue)
-            elif any(keyword in issue_type for keyword in ["link", "broken", "redirect", "orphan"]):
-                link_issues.append(issue)
+        view = self._audit_view(audit_data)
 
-        # Create tasks for each agent
-        if technical_issues:
-            tasks.append(
-                AgentTask(
-                    assigned_to=AgentRole.TECHNICAL_SEO,
-                    priority=TaskPriority.CRITICAL,
-                    title="Analyze Technical SEO Issues",
-                    description=f"Analyze {len(technical_issues)} technical SEO issues including HTTPS, robots.txt, sitemaps, and security",
-                    context={
-                        "issues": technical_issues,
-                        "site_url": audit_data.get("site"),
-                        "metadata": audit_data.get("meta", {}),
-                    },
-                )
-            )
-
-        if content_issues:
-            tasks.append(
-                AgentTask(
-                    assigned_to=AgentRole.CONTENT_QUALITY,
-                    priority=TaskPriority.HIGH,
-                    title="Analyze Content Quality Issues",
-                    description=f"Analyze {len(content_issues)} content quality issues including titles, meta descriptions, and headings",
-                    context={
-                        "issues": content_issues,
-                        "site_url": audit_data.get("site"),
-                        "content_data": {},
-                    },
-                )
-            )
+        # Group issues by agent category in a single pass
+        buckets = view.issue_scan().by_agent
 
-        if performance_issues:
-            tasks.append(
-                AgentTask(
-                    assigned_to=AgentRole.PERFORMANCE,
-                    priority=TaskPriority.MEDIUM,
-                    title="Analyze Performance Issues",
-                    description=f"Analyze {len(performance_issues)} performance issues including image optimization and render-blocking resources",
-                    context={
-                        "issues": performance_issues,
-                        "site_url": audit_data.get("site"),
-                        "performance_data": {},
-                    },
-                )
-            )
+        # Create tasks for each agent
+        for role, priority, title, description, data_key, data_for in TASK_SPECS:
+            agent_issues = buckets.get(role.value)
+            if not agent_issues:
+                continue
 
-        if link_issues:
             tasks.append(
                 AgentTask(
-                    assigned_to=AgentRole.LINK_ANALYSIS,
-                    priority=TaskPriority.MEDIUM,
-                    title="Analyze Link Structure Issues",
-                    description=f"Analyze {len(link_issues)} link-related issues including broken links and orphan pages",
+                    assigned_to=role,
+                    priority=priority,
+                    title=title,
+                    description=description.format(count=len(agent_issues)),
                     context={
-                        "issues": link_issues,
+                        "issues": agent_issues,
                         "site_url": audit_data.get("site"),
-                        "link_graph_data": {},
+                        data_key: data_for(audit_data),
                     },
                 )
             )
 
         logger.info(f"Created {len(tasks)} tasks for specialist agents")
         return tasks
+
+    async def dispatch_plan(
+        self,
+        tasks: list[AgentTask],
+        agents: dict[AgentRole, BaseAgent],
+        events: asyncio.Queue[tuple[TaskEvent, AgentTask]] | None = None,
+    ) -> list[AgentResult]:
+        """
+        Execute a task plan as a dependency graph.
+
+        Tasks start as soon as every task listed in their ``dependencies`` has
+        finished, so independent specialists run concurrently (bounded by
+        ``profile.max_concurrent_tasks``) and dependants such as fix generation
+        start the moment their inputs are ready. Dependency cycles, which a
+        model-written plan can contain, are broken before any task starts.
+
+        Args:
+            tasks: Tasks to run; dependencies refer to IDs of tasks in the same plan
+            agents: Agents keyed by role; tasks without a matching agent are skipped
+            events: Optional queue that receives (TaskEvent, task) lifecycle events
+
+        Returns:
+            Results of the tasks that ran, in plan order
+        """
+        semaphore = asyncio.Semaphore(self.profile.max_concurrent_tasks)
+        finished = [asyncio.Event() for _ in tasks]
+        waits = _dependency_waits(tasks)
+
+        def publish(event: TaskEvent, task: AgentTask) -> None:
+            if events is not None:
+                events.put_nowait((event, task))
+
+        async def run(task: AgentTask, done: asyncio.Event, wait: set[int]) -> AgentResult | None:
+            try:
+                for dependency in wait:
+                    await finished[dependency].wait()
+
+                agent = agents.get(task.assigned_to)
+                if agent is None:
+                    logger.debug(f"No agent for {task.assigned_to.value}, skipping {task.id}")
+                    return None
+
+                async with semaphore:
+                    publish(TaskEvent.TASK_STARTED, task)
+                    result = await agent.execute_task(task)
+
+                publish(TaskEvent.TASK_COMPLETED if result.success else TaskEvent.TASK_FAILED, task)
+                return result
+
+            except Exception:
+                publish(TaskEvent.TASK_FAILED, task)
+                raise
+
+            finally:
+                done.set()
+
+        outcomes = await asyncio.gather(
+            *(
+                run(task, done, wait)
+                for task, done, wait in zip(tasks, finished, waits, strict=True)
+            ),
+            return_exceptions=True,
+        )
+
+        results: list[AgentResult] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                logger.error(f"Agent task failed: {outcome}")
+            elif outcome is not None:
+                results.append(outcome)
+
+        return results
@@ -5,9 +5,11 @@ Performance Agent - Specialist in website speed and Core Web Vitals.
 from __future__ import annotations
 
 import json
+import re
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from ..utils.io import dumps_compact
 from ..utils.logging import get_logger
 from .base import AgentContext, BaseAgent
 from .models import AgentProfile, AgentResult, AgentRole, AgentTask
@@ -15,6 +17,9 @@ from .prompts import format_performance_prompt
 
 logger = get_logger(__name__)
 
+_IMAGE_RE = re.compile(r"image")
+_BLOCKING_RE = re.compile(r"render|blocking")
+
 
 class PerformanceAgent(BaseAgent):
     """
@@ -29,18 +34,19 @@ class PerformanceAgent(BaseAgent):
     - Core Web Vitals
     """
 
+    _PROFILE: ClassVar[AgentProfile] = AgentProfile(
+        role=AgentRole.PERFORMANCE,
+        name="Performance Agent",
+        description="Specialist in website speed and Core Web Vitals optimization",
+        capabilities=(),
+        specialization=("performance", "speed", "core-web-vitals", "optimization"),
+        max_concurrent_tasks=3,
+        default_model="gpt-4o-mini",
+        fallback_models=("gpt-4o",),
+    )
+
     def __init__(self, context: AgentContext | None = None, api_key: str | None = None):
-        profile = AgentProfile(
-            role=AgentRole.PERFORMANCE,
-            name="Performance Agent",
-            description="Specialist in website speed and Core Web Vitals optimization",
-            capabilities=[],
-            specialization=["performance", "speed", "core-web-vitals", "optimization"],
-            max_concurrent_tasks=3,
-            default_model="gpt-4o-mini",
-            fallback_models=["gpt-4o"],
-        )
-        super().__init__(profile, context, api_key)
+        super().__init__(self._PROFILE, context, api_key)
 
     def _initialize_tools(self) -> list[Any]:
         """Initialize tools (simplified for LangChain 1.0)."""
@@ -52,7 +58,7 @@ class PerformanceAgent(BaseAgent):
         try:
             issues = json.loads(issues_json)
             image_issues = [
-                i for i in issues if "image" in i.get("type", "").lower()
+                i for i in issues if _IMAGE_RE.search(i.get("type", "").lower())
             ]
 
             analysis = {
@@ -65,7 +71,7 @@ class PerformanceAgent(BaseAgent):
                 ],
             }
 
-            return json.dumps(analysis, indent=2)
+            return dumps_compact(analysis)
 
         except Exception as e:
             return f"Error analyzing images: {e}"
@@ -75,7 +81,7 @@ class PerformanceAgent(BaseAgent):
         try:
             issues = json.loads(issues_json)
             blocking_issues = [
-                i for i in issues if "render" in i.get("type", "").lower() or "blocking" in i.get("type", "").lower()
+                i for i in issues if _BLOCKING_RE.search(i.get("type", "").lower())
             ]
 
             analysis = {
@@ -87,14 +93,14 @@ class PerformanceAgent(BaseAgent):
                 ],
             }
 
-            return json.dumps(analysis, indent=2)
+            return dumps_compact(analysis)
 
         except Exception as e:
             return f"Error analyzing render-blocking: {e}"
 
     async def execute_task(self, task: AgentTask) -> AgentResult:
         """Execute performance analysis task."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         task.start()
 
         # Create chain of thought
@@ -127,8 +133,11 @@ class PerformanceAgent(BaseAgent):
             # Run analysis with chain of thought
             result_data = await self.reason_with_chain_of_thought(task, prompt, cot)
 
+            # Partition once; insights and recommendations share the lists
+            image_issues, blocking_issues = self._partition_perf_issues(issues)
+
             # Extract insights
-            insights = self._extract_performance_insights(issues)
+            insights = self._extract_performance_insights(image_issues, blocking_issues)
 
             # Create result
             result = AgentResult(
@@ -138,13 +147,13 @@ class PerformanceAgent(BaseAgent):
                 data=result_data,
                 insights=insights,
                 chain_of_thought=cot,
-                execution_time_ms=(time.time() - start_time) * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
                 model_used=self.profile.default_model,
                 confidence=cot.confidence_score,
             )
 
             # Add recommendations
-            self._add_performance_recommendations(result, issues)
+            self._add_performance_recommendations(result, image_issues, blocking_issues)
 
             # Update stats
             self.tasks_completed += 1
@@ -167,27 +176,48 @@ class PerformanceAgent(BaseAgent):
                 success=False,
                 data={"error": str(e)},
                 chain_of_thought=cot,
-                execution_time_ms=(time.time() - start_time) * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
             )
 
             task.fail(str(e))
             return result
 
-    def _extract_performance_insights(self, issues: list[dict[str, Any]]) -> list[str]:
+    def _partition_perf_issues(
+        self, issues: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Split issues into image and render-blocking groups in a single pass.
+
+        The groups are not exclusive: a type matching both patterns lands in both.
+
+        Returns:
+            Tuple of (image_issues, blocking_issues)
+        """
+        image_issues: list[dict[str, Any]] = []
+        blocking_issues: list[dict[str, Any]] = []
+
+        for issue in issues:
+            issue_type = issue.get("type", "").lower()
+            if _IMAGE_RE.search(issue_type):
+                image_issues.append(issue)
+            if _BLOCKING_RE.search(issue_type):
+                blocking_issues.append(issue)
+
+        return image_issues, blocking_issues
+
+    def _extract_performance_insights(
+        self, image_issues: list[dict[str, Any]], blocking_issues: list[dict[str, Any]]
+    ) -> list[str]:
         """Extract performance insights."""
         insights = []
 
         # Image insights
-        image_issues = [i for i in issues if "image" in i.get("type", "").lower()]
         if image_issues:
             insights.append(
                 f"Performance Alert: {len(image_issues)} image optimization opportunities - can significantly improve load times"
             )
 
         # Render-blocking insights
-        blocking_issues = [
-            i for i in issues if "render" in i.get("type", "").lower() or "blocking" in i.get("type", "").lower()
-        ]
         if blocking_issues:
             insights.append(
                 f"Critical: {len(blocking_issues)} render-blocking resources - deferring these can improve Core Web Vitals"
@@ -196,11 +226,13 @@ class PerformanceAgent(BaseAgent):
         return insights
 
     def _add_performance_recommendations(
-        self, result: AgentResult, issues: list[dict[str, Any]]
+        self,
+        result: AgentResult,
+        image_issues: list[dict[str, Any]],
+        blocking_issues: list[dict[str, Any]],
     ) -> None:
         """Add performance recommendations."""
         # Image optimization
-        image_issues = [i for i in issues if "image" in i.get("type", "").lower()]
         if image_issues:
             result.add_recommendation(
                 title="Optimize Images",
@@ -212,9 +244,6 @@ class PerformanceAgent(BaseAgent):
             )
 
         # Render-blocking
-        blocking_issues = [
-            i for i in issues if "render" in i.get("type", "").lower() or "blocking" in i.get("type", "").lower()
-        ]
         if blocking_issues:
             result.add_recommendation(
                 title="Defer Render-Blocking Resources",
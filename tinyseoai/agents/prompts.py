@@ -2,8 +2,13 @@
 Agent prompts library with specialized prompts for each agent role.
 """
 
+import string
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Hashable
 from typing import Any
 
+from ..utils.io import dumps_compact
+
 # ============================================================================
 # ORCHESTRATOR AGENT PROMPTS
 # ============================================================================
@@ -68,30 +73,14 @@ Your expertise includes:
 - Redirect chains and status codes
 - Security headers (CSP, HSTS, X-Frame-Options)
 
-Analyze technical issues with precision and provide specific, actionable recommendations.
-Consider both SEO best practices and web standards."""
-
-TECHNICAL_SEO_ANALYSIS_PROMPT = """Analyze the following technical SEO issues:
+Cover issues that block crawling or indexing, security problems affecting SEO, and
+crawlability gaps. Rank by crawl/index impact, then security, then implementation
+difficulty, and include code for fixes where applicable."""
 
-Site: {site_url}
+TECHNICAL_SEO_ANALYSIS_PROMPT = """Technical SEO analysis for {site_url}.
+Return JSON {{"issues":[{{"type":str,"impact":str,"fix":str}}],"quick_wins":[str]}}.
 Issues: {issues}
-
-Audit Metadata:
-{metadata}
-
-Your analysis should include:
-1. Critical technical issues that block search engines
-2. Security vulnerabilities affecting SEO
-3. Indexability problems
-4. Crawlability issues
-5. Specific fixes with code examples where applicable
-
-Prioritize issues by:
-- Impact on search engine crawling/indexing
-- Security implications
-- Implementation difficulty
-
-Provide structured recommendations."""
+Metadata: {metadata}"""
 
 # ============================================================================
 # CONTENT QUALITY AGENT PROMPTS
@@ -109,31 +98,13 @@ Your expertise includes:
 - Image alt text optimization
 - Content-length best practices
 
-Evaluate content quality from both user experience and search engine perspectives.
-Provide specific, actionable content improvements."""
-
-CONTENT_QUALITY_ANALYSIS_PROMPT = """Analyze the following content quality issues:
+For each issue explain the SEO impact and give a concrete improved example.
+Favor quick wins with high impact."""
 
-Site: {site_url}
+CONTENT_QUALITY_ANALYSIS_PROMPT = """Content quality analysis for {site_url}.
+Return JSON {{"issues":[{{"type":str,"impact":str,"fix":str}}],"quick_wins":[str]}}.
 Issues: {issues}
-
-Content Analysis:
-{content_data}
-
-Your analysis should include:
-1. Missing or poorly optimized title tags
-2. Meta description quality and length
-3. Heading structure problems
-4. Content readability issues
-5. Duplicate content concerns
-6. Image optimization opportunities
-
-For each issue:
-- Explain the SEO impact
-- Provide specific improvement examples
-- Suggest optimal content patterns
-
-Focus on quick wins with high impact."""
+Content data: {content_data}"""
 
 # ============================================================================
 # PERFORMANCE AGENT PROMPTS
@@ -151,31 +122,13 @@ Your expertise includes:
 - Core Web Vitals (LCP, FID, CLS)
 - Mobile performance optimization
 
-Analyze performance issues with focus on both SEO rankings and user experience.
-Provide technical solutions with measurable impact."""
-
-PERFORMANCE_ANALYSIS_PROMPT = """Analyze the following performance issues:
+For each fix estimate the gain, the effort (low/medium/high) and the Core Web Vitals
+affected, with code or configuration where useful. Prioritize issues affecting rankings."""
 
-Site: {site_url}
+PERFORMANCE_ANALYSIS_PROMPT = """Performance analysis for {site_url}.
+Return JSON {{"issues":[{{"type":str,"impact":str,"effort":str,"fix":str}}],"quick_wins":[str]}}.
 Issues: {issues}
-
-Performance Data:
-{performance_data}
-
-Your analysis should include:
-1. Critical render-blocking resources
-2. Image optimization opportunities
-3. Caching improvements
-4. Resource loading priorities
-5. Mobile-specific performance issues
-
-For each recommendation:
-- Quantify expected performance gains
-- Provide implementation difficulty (low/medium/high)
-- Include code examples or configuration changes
-- Note impact on Core Web Vitals
-
-Prioritize issues affecting search rankings."""
+Performance data: {performance_data}"""
 
 # ============================================================================
 # LINK ANALYSIS AGENT PROMPTS
@@ -193,31 +146,13 @@ Your expertise includes:
 - Link depth and site architecture
 - Navigation structure best practices
 
-Analyze link structures to improve site crawlability and PageRank distribution.
-Focus on site architecture that benefits both users and search engines."""
-
-LINK_ANALYSIS_PROMPT = """Analyze the following link-related issues:
+For each issue explain the crawlability and PageRank impact and give a specific
+linking fix. Prioritize by SEO impact."""
 
-Site: {site_url}
+LINK_ANALYSIS_PROMPT = """Link analysis for {site_url}.
+Return JSON {{"issues":[{{"type":str,"impact":str,"fix":str}}],"quick_wins":[str]}}.
 Issues: {issues}
-
-Link Graph Data:
-{link_graph_data}
-
-Your analysis should include:
-1. Broken links requiring immediate fixes
-2. Orphan pages lacking internal links
-3. Poor anchor text patterns
-4. Redirect chains to optimize
-5. Site architecture improvements
-
-For each issue:
-- Explain impact on crawlability and PageRank
-- Provide specific linking recommendations
-- Suggest optimal site structure improvements
-- Prioritize by SEO impact
-
-Focus on internal link optimization opportunities."""
+Link graph data: {link_graph_data}"""
 
 # ============================================================================
 # FIX GENERATOR AGENT PROMPTS
@@ -271,20 +206,78 @@ Make code copy-paste ready with proper formatting."""
 # ============================================================================
 
 
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Parse a str.format template once and return a renderer for it.
+
+    The renderer only joins the pre-split literal chunks with the formatted
+    field values, so the template text is not re-scanned on every call. Fields
+    must be plain names without conversions or format specs.
+    """
+    parts = tuple(string.Formatter().parse(template))
+    for _, field_name, format_spec, conversion in parts:
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            raise ValueError(f"Unsupported template field: {field_name!r}")
+
+    def render(**values: Any) -> str:
+        chunks: list[str] = []
+        for literal, field_name, _, _ in parts:
+            chunks.append(literal)
+            if field_name is not None:
+                chunks.append(format(values[field_name]))
+        return "".join(chunks)
+
+    return render
+
+
+_render_orchestrator_planning = _compile_template(ORCHESTRATOR_TASK_PLANNING_PROMPT)
+_render_technical_seo = _compile_template(TECHNICAL_SEO_ANALYSIS_PROMPT)
+_render_content_quality = _compile_template(CONTENT_QUALITY_ANALYSIS_PROMPT)
+_render_performance = _compile_template(PERFORMANCE_ANALYSIS_PROMPT)
+_render_link_analysis = _compile_template(LINK_ANALYSIS_PROMPT)
+_render_fix_generator = _compile_template(FIX_GENERATOR_PROMPT)
+
+PROMPT_CACHE_MAXSIZE = 128
+
+SEVERITY_ORDER = ("high", "medium", "low", "info")
+
+_prompt_cache: OrderedDict[Hashable, str] = OrderedDict()
+
+
+def cached_prompt(key: Hashable, build: Callable[[], str]) -> str:
+    """
+    Return the prompt cached under key, building it on a miss.
+
+    The cache is a bounded LRU (PROMPT_CACHE_MAXSIZE entries), so repeated tasks
+    on the same audit skip re-formatting identical prompts. Keys should be cheap
+    to build; hashing the full prompt inputs costs as much as formatting them.
+    """
+    prompt = _prompt_cache.get(key)
+    if prompt is not None:
+        _prompt_cache.move_to_end(key)
+        return prompt
+
+    prompt = build()
+    _prompt_cache[key] = prompt
+    if len(_prompt_cache) > PROMPT_CACHE_MAXSIZE:
+        _prompt_cache.popitem(last=False)
+    return prompt
+
+
 def format_orchestrator_planning_prompt(audit_data: dict[str, Any]) -> str:
     """Format the orchestrator task planning prompt with audit data."""
-    # Count issues by severity
+    # Count issues by severity; known levels first, then any others as seen
     issues = audit_data.get("issues", [])
-    severity_counts = {"high": 0, "medium": 0, "low": 0, "info": 0}
-    for issue in issues:
-        severity = issue.get("severity", "info")
-        severity_counts[severity] = severity_counts.get(severity, 0) + 1
+    severity_counts = Counter(issue.get("severity", "info") for issue in issues)
+    severities = [*SEVERITY_ORDER, *(s for s in severity_counts if s not in SEVERITY_ORDER)]
 
     issue_breakdown = "\n".join(
-        [f"- {sev.capitalize()}: {count}" for sev, count in severity_counts.items() if count > 0]
+        f"- {sev.capitalize()}: {severity_counts[sev]}"
+        for sev in severities
+        if severity_counts[sev]
     )
 
-    return ORCHESTRATOR_TASK_PLANNING_PROMPT.format(
+    return _render_orchestrator_planning(
         site_url=audit_data.get("site", "unknown"),
         pages_scanned=audit_data.get("pages_scanned", 0),
         total_issues=len(issues),
@@ -293,55 +286,73 @@ def format_orchestrator_planning_prompt(audit_data: dict[str, Any]) -> str:
     )
 
 
-def format_technical_seo_prompt(site_url: str, issues: list, metadata: dict) -> str:
+def format_technical_seo_prompt(
+    site_url: str, issues: list[dict[str, Any]], metadata: dict[str, Any]
+) -> str:
     """Format the technical SEO analysis prompt."""
-    return TECHNICAL_SEO_ANALYSIS_PROMPT.format(
+    return _render_technical_seo(
         site_url=site_url,
-        issues=issues,
-        metadata=metadata,
+        issues=dumps_compact(issues),
+        metadata=dumps_compact(metadata),
     )
 
 
 def format_content_quality_prompt(
-    site_url: str, issues: list, content_data: dict
+    site_url: str, issues: list[dict[str, Any]], content_data: dict[str, Any]
 ) -> str:
     """Format the content quality analysis prompt."""
-    return CONTENT_QUALITY_ANALYSIS_PROMPT.format(
+    return _render_content_quality(
         site_url=site_url,
-        issues=issues,
-        content_data=content_data,
+        issues=dumps_compact(issues),
+        content_data=dumps_compact(content_data),
     )
 
 
 def format_performance_prompt(
-    site_url: str, issues: list, performance_data: dict
+    site_url: str, issues: list[dict[str, Any]], performance_data: dict[str, Any]
 ) -> str:
     """Format the performance analysis prompt."""
-    return PERFORMANCE_ANALYSIS_PROMPT.format(
+    return _render_performance(
         site_url=site_url,
-        issues=issues,
-        performance_data=performance_data,
+        issues=dumps_compact(issues),
+        performance_data=dumps_compact(performance_data),
     )
 
 
 def format_link_analysis_prompt(
-    site_url: str, issues: list, link_graph_data: dict
+    site_url: str, issues: list[dict[str, Any]], link_graph_data: dict[str, Any]
 ) -> str:
     """Format the link analysis prompt."""
-    return LINK_ANALYSIS_PROMPT.format(
+    return _render_link_analysis(
         site_url=site_url,
-        issues=issues,
-        link_graph_data=link_graph_data,
+        issues=dumps_compact(issues),
+        link_graph_data=dumps_compact(link_graph_data),
     )
 
 
 def format_fix_generator_prompt(
-    site_url: str, platform: str, issues: list, context: dict
+    site_url: str, platform: str, issues: list[dict[str, Any]], context: dict[str, Any]
 ) -> str:
     """Format the fix generator prompt."""
-    return FIX_GENERATOR_PROMPT.format(
+    return _render_fix_generator(
         site_url=site_url,
         platform=platform,
-        issues=issues,
-        context=context,
+        issues=dumps_compact(issues),
+        context=dumps_compact(context),
     )
+
+
+# Standing instructions per specialist role; the task prompts above stay terse
+AGENT_SYSTEM_PROMPTS: dict[str, str] = {
+    "orchestrator": ORCHESTRATOR_SYSTEM_PROMPT,
+    "technical_seo": TECHNICAL_SEO_SYSTEM_PROMPT,
+    "content_quality": CONTENT_QUALITY_SYSTEM_PROMPT,
+    "performance": PERFORMANCE_SYSTEM_PROMPT,
+    "link_analysis": LINK_ANALYSIS_SYSTEM_PROMPT,
+    "fix_generator": FIX_GENERATOR_SYSTEM_PROMPT,
+}
+
+
+def prompt_cache_key(role: str) -> str:
+    """Stable provider prompt-cache key for an agent role."""
+    return f"tinyseoai:{role}"
@@ -4,17 +4,25 @@ Technical SEO Agent - Specialist in website technical infrastructure.
 
 from __future__ import annotations
 
-import json
+import re
 import time
-from typing import Any
+from typing import Any, ClassVar
 
 from ..utils.logging import get_logger
+from ._scan import INDEXABILITY_RE, SECURITY_RE
 from .base import AgentContext, BaseAgent
 from .models import AgentProfile, AgentResult, AgentRole, AgentTask
 from .prompts import format_technical_seo_prompt
 
 logger = get_logger(__name__)
 
+_HTTPS_RE = re.compile(r"https|ssl")
+
+
+def _https_issues(issues: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Issues whose type mentions HTTPS or SSL, for the insights and recommendations."""
+    return [issue for issue in issues if _HTTPS_RE.search(issue.get("type", "").lower())]
+
 
 class TechnicalSEOAgent(BaseAgent):
     """
@@ -30,126 +38,93 @@ class TechnicalSEOAgent(BaseAgent):
     - Indexability directives
     """
 
+    _PROFILE: ClassVar[AgentProfile] = AgentProfile(
+        role=AgentRole.TECHNICAL_SEO,
+        name="Technical SEO Agent",
+        description="Specialist in website technical infrastructure and search engine optimization",
+        capabilities=(),
+        specialization=("technical", "security", "crawlability", "indexability"),
+        max_concurrent_tasks=3,
+        default_model="gpt-4o-mini",
+        fallback_models=("gpt-4o", "claude-3-5-sonnet-20241022"),
+    )
+
     def __init__(self, context: AgentContext | None = None, api_key: str | None = None):
-        profile = AgentProfile(
-            role=AgentRole.TECHNICAL_SEO,
-            name="Technical SEO Agent",
-            description="Specialist in website technical infrastructure and search engine optimization",
-            capabilities=[],
-            specialization=["technical", "security", "crawlability", "indexability"],
-            max_concurrent_tasks=3,
-            default_model="gpt-4o-mini",
-            fallback_models=["gpt-4o", "claude-3-5-sonnet-20241022"],
-        )
-        super().__init__(profile, context, api_key)
+        super().__init__(self._PROFILE, context, api_key)
 
     def _initialize_tools(self) -> list[Any]:
         """Initialize tools (simplified for LangChain 1.0)."""
         return []
 
-
-    def _analyze_https_issues(self, issues_json: str) -> str:
+    def _analyze_https_issues(self, issues: list[dict[str, Any]]) -> dict[str, Any]:
         """Analyze HTTPS-related issues."""
-        try:
-            issues = json.loads(issues_json)
-            https_issues = [
-                i
-                for i in issues
-                if any(
-                    keyword in i.get("type", "").lower() for keyword in ["https", "ssl", "security"]
-                )
-            ]
+        https_issues = [i for i in issues if SECURITY_RE.search(i.get("type", "").lower())]
 
-            analysis = {
-                "count": len(https_issues),
-                "critical": [i for i in https_issues if i.get("severity") == "high"],
-                "recommendations": [],
-            }
+        analysis: dict[str, Any] = {
+            "count": len(https_issues),
+            "critical": [i for i in https_issues if i.get("severity") == "high"],
+            "recommendations": [],
+        }
 
-            if https_issues:
-                analysis["recommendations"].append(
-                    "Enable HTTPS site-wide to improve security and SEO rankings"
-                )
-                analysis["recommendations"].append("Ensure SSL certificate is valid and up-to-date")
-                analysis["recommendations"].append(
-                    "Implement HSTS header to enforce HTTPS connections"
-                )
+        if https_issues:
+            analysis["recommendations"] = [
+                "Enable HTTPS site-wide to improve security and SEO rankings",
+                "Ensure SSL certificate is valid and up-to-date",
+                "Implement HSTS header to enforce HTTPS connections",
+            ]
 
-            return json.dumps(analysis, indent=2)
+        return analysis
 
-        except Exception as e:
-            return f"Error analyzing HTTPS issues: {e}"
-
-    def _analyze_robots_txt(self, metadata_json: str) -> str:
+    def _analyze_robots_txt(self, metadata: dict[str, Any]) -> dict[str, Any]:
         """Analyze robots.txt configuration."""
-        try:
-            metadata = json.loads(metadata_json)
-
-            robots_exists = metadata.get("robots_txt_exists", False)
-            sitemaps_found = metadata.get("sitemaps_found", 0)
-
-            analysis = {
-                "robots_txt_exists": robots_exists,
-                "sitemaps_found": sitemaps_found,
-                "recommendations": [],
-            }
-
-            if not robots_exists:
-                analysis["recommendations"].append(
-                    "Create a robots.txt file to guide search engine crawlers"
-                )
-
-            if sitemaps_found == 0:
-                analysis["recommendations"].append(
-                    "Add XML sitemap reference to robots.txt for better crawlability"
-                )
+        robots_exists = metadata.get("robots_txt_exists", False)
+        sitemaps_found = metadata.get("sitemaps_found", 0)
+
+        analysis: dict[str, Any] = {
+            "robots_txt_exists": robots_exists,
+            "sitemaps_found": sitemaps_found,
+            "recommendations": [],
+        }
+
+        if not robots_exists:
+            analysis["recommendations"].append(
+                "Create a robots.txt file to guide search engine crawlers"
+            )
 
-            return json.dumps(analysis, indent=2)
+        if sitemaps_found == 0:
+            analysis["recommendations"].append(
+                "Add XML sitemap reference to robots.txt for better crawlability"
+            )
 
-        except Exception as e:
-            return f"Error analyzing robots.txt: {e}"
+        return analysis
 
-    def _analyze_indexability(self, issues_json: str) -> str:
+    def _analyze_indexability(self, issues: list[dict[str, Any]]) -> dict[str, Any]:
         """Analyze indexability issues."""
-        try:
-            issues = json.loads(issues_json)
-            indexability_issues = [
-                i
-                for i in issues
-                if any(
-                    keyword in i.get("type", "").lower()
-                    for keyword in ["canonical", "robots", "index", "noindex"]
-                )
-            ]
-
-            analysis = {
-                "count": len(indexability_issues),
-                "issues_by_type": {},
-                "recommendations": [],
-            }
-
-            for issue in indexability_issues:
+        issues_by_type: dict[str, int] = {}
+        count = 0
+        for issue in issues:
+            if INDEXABILITY_RE.search(issue.get("type", "").lower()):
+                count += 1
                 issue_type = issue.get("type", "unknown")
-                analysis["issues_by_type"][issue_type] = (
-                    analysis["issues_by_type"].get(issue_type, 0) + 1
-                )
-
-            if indexability_issues:
-                analysis["recommendations"].append(
-                    "Review canonical tag implementation to avoid duplicate content issues"
-                )
-                analysis["recommendations"].append(
-                    "Ensure important pages are not accidentally blocked by robots meta tags"
-                )
-
-            return json.dumps(analysis, indent=2)
+                issues_by_type[issue_type] = issues_by_type.get(issue_type, 0) + 1
+
+        analysis: dict[str, Any] = {
+            "count": count,
+            "issues_by_type": issues_by_type,
+            "recommendations": [],
+        }
+
+        if count:
+            analysis["recommendations"] = [
+                "Review canonical tag implementation to avoid duplicate content issues",
+                "Ensure important pages are not accidentally blocked by robots meta tags",
+            ]
 
-        except Exception as e:
-            return f"Error analyzing indexability: {e}"
+        return analysis
 
     async def execute_task(self, task: AgentTask) -> AgentResult:
         """Execute technical SEO analysis task."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         task.start()
 
         # Create chain of thought
@@ -162,6 +137,7 @@ class TechnicalSEOAgent(BaseAgent):
             issues = task.context.get("issues", [])
             site_url = task.context.get("site_url", "unknown")
             metadata = task.context.get("metadata", {})
+            https_issues = _https_issues(issues)
 
             cot.add_step(
                 "observation",
@@ -183,7 +159,7 @@ class TechnicalSEOAgent(BaseAgent):
             result_data = await self.reason_with_chain_of_thought(task, prompt, cot)
 
             # Extract insights
-            insights = self._extract_technical_insights(issues, metadata)
+            insights = self._extract_technical_insights(https_issues, metadata)
 
             # Create result
             result = AgentResult(
@@ -193,13 +169,13 @@ class TechnicalSEOAgent(BaseAgent):
                 data=result_data,
                 insights=insights,
                 chain_of_thought=cot,
-                execution_time_ms=(time.time() - start_time) * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
                 model_used=self.profile.default_model,
                 confidence=cot.confidence_score,
             )
 
             # Add recommendations
-            self._add_technical_recommendations(result, issues, metadata)
+            self._add_technical_recommendations(result, https_issues, metadata)
 
             # Update stats
             self.tasks_completed += 1
@@ -222,24 +198,19 @@ class TechnicalSEOAgent(BaseAgent):
                 success=False,
                 data={"error": str(e)},
                 chain_of_thought=cot,
-                execution_time_ms=(time.time() - start_time) * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
             )
 
             task.fail(str(e))
             return result
 
     def _extract_technical_insights(
-        self, issues: list[dict[str, Any]], metadata: dict[str, Any]
+        self, https_issues: list[dict[str, Any]], metadata: dict[str, Any]
     ) -> list[str]:
-        """Extract technical SEO insights."""
+        """Extract technical SEO insights from the HTTPS issues and site metadata."""
         insights = []
 
         # HTTPS insights
-        https_issues = [
-            i
-            for i in issues
-            if any(keyword in i.get("type", "").lower() for keyword in ["https", "ssl"])
-        ]
         if https_issues:
             insights.append(
                 f"Security Alert: {len(https_issues)} HTTPS/SSL issues detected - may affect rankings and user trust"
@@ -260,15 +231,13 @@ class TechnicalSEOAgent(BaseAgent):
         return insights
 
     def _add_technical_recommendations(
-        self, result: AgentResult, issues: list[dict[str, Any]], metadata: dict[str, Any]
+        self,
+        result: AgentResult,
+        https_issues: list[dict[str, Any]],
+        metadata: dict[str, Any],
     ) -> None:
-        """Add technical SEO recommendations."""
+        """Add technical SEO recommendations from the HTTPS issues and site metadata."""
         # HTTPS recommendation
-        https_issues = [
-            i
-            for i in issues
-            if any(keyword in i.get("type", "").lower() for keyword in ["https", "ssl"])
-        ]
         if https_issues:
             result.add_recommendation(
                 title="Enable HTTPS Site-Wide",
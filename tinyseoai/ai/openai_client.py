@@ -1,21 +1,31 @@
 from __future__ import annotations
 
+import copy
+import json
 import os
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
 
-from dotenv import load_dotenv
-from openai import OpenAI
 from pydantic import BaseModel
 
 from ..config import get_config
 
+if TYPE_CHECKING:
+    import httpx
+    from openai import OpenAI
+
+# Connection pool shared by concurrent agent calls; HTTP/2 lets them multiplex
+# over one TLS connection instead of paying a handshake each.
+HTTP_MAX_CONNECTIONS = 32
+
 
 class AIError(RuntimeError):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelChoice:
     """Holds resolved model ids for free/premium."""
     free: str
@@ -28,8 +38,12 @@ class AIConfig(BaseModel):
     max_output_tokens: int = 800
 
 
+@lru_cache(maxsize=1)
 def _load_api_key() -> str:
-    # Load .env once; ignore if not present
+    # Load .env once per process; ignore if not present. Missing keys raise,
+    # so they are re-checked on the next call.
+    from dotenv import load_dotenv
+
     load_dotenv()
     key = os.getenv("OPENAI_API_KEY", "").strip()
     if not key:
@@ -47,10 +61,118 @@ def resolve_models() -> ModelChoice:
     )
 
 
+def _http_limits() -> httpx.Limits:
+    import httpx
+
+    return httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_CONNECTIONS
+    )
+
+
+@lru_cache(maxsize=1)
 def get_client() -> OpenAI:
+    # Imported on first use so offline audits never pay for the SDK import
+    from openai import DefaultHttpxClient, OpenAI
+
     key = _load_api_key()
-    # The SDK reads from env automatically, but we also pass api_key for clarity
-    return OpenAI(api_key=key)
+    # The SDK reads from env automatically, but we also pass api_key for clarity.
+    # One client per process keeps the httpx pool (and TLS sessions) warm.
+    # Newer SDKs type the client against their own httpx build, which takes
+    # the same Limits fields, so the limits are passed through untyped.
+    return OpenAI(
+        api_key=key,
+        http_client=DefaultHttpxClient(http2=True, limits=cast(Any, _http_limits())),
+    )
+
+
+DEFAULT_SYSTEM = (
+    "You are a senior technical SEO assistant. "
+    "Return concise, well-structured JSON only."
+)
+
+COMPLETION_CACHE_MAXSIZE = 512
+
+# Identical (model, system, prompt, sampling) requests that opt in are answered
+# once per process; re-runs and unchanged audit sections reuse the earlier
+# completion. Clear it with clear_completion_cache().
+_completion_cache: OrderedDict[tuple[str, str, str, float, int], dict[str, Any]] = OrderedDict()
+
+
+def _resolve_request(
+    plan: str, system: str | None, max_output_tokens: int | None
+) -> tuple[str, str, int]:
+    """Resolve (model, system prompt, max tokens) for a plan."""
+    cfg = get_config()
+    model = cfg.openai_model_premium if plan == "premium" else cfg.openai_model_free
+    return model, system or DEFAULT_SYSTEM, max_output_tokens or cfg.max_output_tokens
+
+
+def _completion_kwargs(
+    model: str,
+    system: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+    cache_key: str | None = None,
+) -> dict[str, Any]:
+    """
+    Build Chat Completions arguments for a JSON-mode request.
+
+    The system prompt always comes first and unmodified; with a cache_key the
+    provider routes requests sharing that prefix to the same prompt cache. The
+    key travels in extra_body so SDK releases that predate the named argument
+    still accept the request.
+    """
+    kwargs: dict[str, Any] = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "response_format": {"type": "json_object"},
+    }
+    if cache_key:
+        kwargs["extra_body"] = {"prompt_cache_key": cache_key}
+    return kwargs
+
+
+def _parse_completion(resp: Any) -> dict[str, Any]:
+    """Extract and parse the JSON body of a chat completion."""
+    try:
+        txt = resp.choices[0].message.content
+    except (IndexError, AttributeError, KeyError) as e:
+        raise AIError(f"Could not parse OpenAI response structure: {e}") from e
+    if not txt:
+        raise AIError("OpenAI returned empty response")
+
+    try:
+        data = json.loads(txt)
+    except json.JSONDecodeError as e:
+        raise AIError(f"Model did not return valid JSON: {e}\nRaw: {txt[:400]}") from e
+    if not isinstance(data, dict):
+        raise AIError(f"Model did not return a JSON object\nRaw: {txt[:400]}")
+    return data
+
+
+def _cached_completion(key: tuple[str, str, str, float, int]) -> dict[str, Any] | None:
+    data = _completion_cache.get(key)
+    if data is not None:
+        _completion_cache.move_to_end(key)
+    return data
+
+
+def _store_completion(key: tuple[str, str, str, float, int], data: dict[str, Any]) -> None:
+    # Failures raise before reaching here, so only valid answers are cached
+    _completion_cache[key] = data
+    if len(_completion_cache) > COMPLETION_CACHE_MAXSIZE:
+        _completion_cache.popitem(last=False)
+
+
+def clear_completion_cache() -> None:
+    """Forget every completion cached by call_ai_json in this process."""
+    _completion_cache.clear()
 
 
 def call_ai_json(
@@ -59,53 +181,40 @@ def call_ai_json(
     system: str | None = None,
     temperature: float = 0.2,
     max_output_tokens: int | None = None,
+    cache_key: str | None = None,
+    use_cache: bool | None = None,
 ) -> dict[str, Any]:
     """
     Calls OpenAI Chat Completions API and returns parsed JSON.
     Uses a cheap model for 'free' plan and a stronger one for 'premium'.
+    Pass a stable cache_key for callers with a fixed system prompt so the
+    provider can serve the shared prefix from its prompt cache.
+
+    use_cache reuses an identical earlier completion from this process. It
+    defaults to on only at temperature 0: a sampled answer is expected to vary,
+    so a caller retrying after an unusable one must get a fresh completion.
 
     BUGFIX: Changed from non-existent 'responses' API to standard 'chat.completions' API.
     See: BUGFIXES.md #1
     """
-    client = get_client()
-    models = resolve_models()
-    model = models.premium if plan == "premium" else models.free
-
-    cfg = get_config()
-    out_tokens = max_output_tokens or cfg.max_output_tokens
-
-    # Use the Chat Completions API with JSON response format
-    try:
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": system
-                    or "You are a senior technical SEO assistant. "
-                       "Return concise, well-structured JSON only.",
-                },
-                {
-                    "role": "user",
-                    "content": prompt,
-                },
-            ],
-            temperature=temperature,
-            max_tokens=out_tokens,
-            response_format={"type": "json_object"},
-        )
-    except Exception as e:
-        raise AIError(f"OpenAI request failed: {e}") from e
-
-    # Extract text from the response
-    import json
-
-    try:
-        txt = resp.choices[0].message.content
-        if not txt:
-            raise AIError("OpenAI returned empty response")
-        return json.loads(txt)
-    except (IndexError, AttributeError, KeyError) as e:
-        raise AIError(f"Could not parse OpenAI response structure: {e}") from e
-    except json.JSONDecodeError as e:
-        raise AIError(f"Model did not return valid JSON: {e}\nRaw: {txt[:400] if txt else 'None'}") from e
+    model, system, out_tokens = _resolve_request(plan, system, max_output_tokens)
+    key = (model, system, prompt, temperature, out_tokens)
+    if use_cache is None:
+        use_cache = temperature == 0
+
+    data = _cached_completion(key) if use_cache else None
+    if data is None:
+        client = get_client()
+        try:
+            resp = client.chat.completions.create(
+                **_completion_kwargs(*key, cache_key=cache_key)
+            )
+        except Exception as e:
+            raise AIError(f"OpenAI request failed: {e}") from e
+        data = _parse_completion(resp)
+        if not use_cache:
+            return data
+        _store_completion(key, data)
+
+    # Callers may mutate the result; keep the cached copy pristine
+    return copy.deepcopy(data)
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from collections import Counter, defaultdict
+import os
+import tempfile
+from pathlib import Path
 from typing import Any
 
-from ..config import get_config
+from platformdirs import user_cache_dir
+
+from ..config import APP_NAME, get_config
 from ..data.models import AuditResult, Issue
-from .openai_client import call_ai_json
+from ..utils.io import dumps_compact
+from ..utils.logging import get_logger
+from .openai_client import call_ai_json, resolve_models
+
+logger = get_logger(__name__)
+
+SUMMARY_SYSTEM_PROMPT = (
+    "You are an expert technical SEO who writes concise, client-ready summaries."
+)
+SUMMARY_TEMPERATURE = 0.2
 
 
 def _compact_issues(issues: list[Issue], limit_per_type: int = 5) -> dict[str, Any]:
@@ -15,11 +29,14 @@ def _compact_issues(issues: list[Issue], limit_per_type: int = 5) -> dict[str, A
     - per-type counts
     - sample URLs (up to limit_per_type)
     """
-    counts = Counter(i.type for i in issues)
-    samples = defaultdict(list)
+    counts: dict[str, int] = {}
+    samples: dict[str, list[str]] = {}
     for i in issues:
-        if len(samples[i.type]) < limit_per_type:
-            samples[i.type].append(i.url)
+        t = i.type
+        counts[t] = counts.get(t, 0) + 1
+        urls = samples.setdefault(t, [])
+        if len(urls) < limit_per_type:
+            urls.append(i.url)
 
     return {
         "by_type_counts": counts,
@@ -57,20 +74,80 @@ Return STRICT JSON with this schema:
 }
 Only include the JSON object. No commentary.
 """
-    return instructions + "\nINPUT:\n" + json.dumps(payload, ensure_ascii=False)
+    return instructions + "\nINPUT:\n" + dumps_compact(payload, ensure_ascii=False)
+
+
+def _summary_cache_path(model: str, max_tokens: int, prompt: str) -> Path:
+    """Content-addressed location of the cached summary for one exact request."""
+    request = "\0".join(
+        (model, str(max_tokens), str(SUMMARY_TEMPERATURE), SUMMARY_SYSTEM_PROMPT, prompt)
+    )
+    key = hashlib.blake2b(request.encode("utf-8"), digest_size=20).hexdigest()
+    return Path(user_cache_dir(APP_NAME)) / "summaries" / f"{key}.json"
+
+
+def _read_cached_summary(path: Path) -> dict[str, Any] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable summary cache {path.name} ({e})")
+        return None
+    return data if isinstance(data, dict) else None
 
 
-def summarize_with_ai(result: AuditResult) -> dict[str, Any]:
+def _write_cached_summary(path: Path, data: dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp name per writer, so concurrent runs never share one
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(json.dumps(data, ensure_ascii=False))
+        try:
+            os.replace(tmp.name, path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+    except OSError as e:
+        # Caching is best-effort; the summary itself is still returned
+        logger.warning(f"Cannot write summary cache ({e})")
+
+
+def summarize_with_ai(result: AuditResult, use_cache: bool | None = None) -> dict[str, Any]:
+    """
+    Summarize an audit with the plan's model.
+
+    Summaries are cached on disk keyed by the model and the exact prompt, so
+    re-running an unchanged audit skips the LLM round-trip.
+
+    Args:
+        result: Audit to summarize
+        use_cache: Read and write the summary cache (defaults to the
+            ``cache_ai_summaries`` config setting)
+    """
     cfg = get_config()
     plan = cfg.plan  # 'free' or 'premium'
+    if use_cache is None:
+        use_cache = cfg.cache_ai_summaries
 
     prompt = build_prompt(result)
-    data = call_ai_json(
-        prompt=prompt,
-        plan=plan,
-        system="You are an expert technical SEO who writes concise, client-ready summaries.",
-        temperature=0.2,
-    )
+    models = resolve_models()
+    model = models.premium if plan == "premium" else models.free
+    cache_path = _summary_cache_path(model, cfg.max_output_tokens, prompt)
+
+    data = _read_cached_summary(cache_path) if use_cache else None
+    if data is None:
+        data = call_ai_json(
+            prompt=prompt,
+            plan=plan,
+            system=SUMMARY_SYSTEM_PROMPT,
+            temperature=SUMMARY_TEMPERATURE,
+            cache_key="tinyseoai:summary",
+        )
+        if use_cache:
+            _write_cached_summary(cache_path, data)
     # Attach plan + model info for traceability (optional)
     data["plan_used"] = plan
     return data
@@ -0,0 +1,140 @@
+"""
+Batch execution of the per-page HTML checks across worker processes.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from loguru import logger
+
+from ...data.models import Issue
+from .content import ContentAnalyzer
+from .indexability import IndexabilityChecker, check_pagination
+from .meta import MetaTagChecker
+
+PageCheck = Callable[[str, str], list[Issue]]
+
+
+def run_audit(html: str, url: str) -> list[Issue]:
+    """
+    Run the indexability, pagination and content checks for one page.
+
+    Kept at module level so worker processes can unpickle it by reference.
+    Each group is guarded separately, as in the crawl engine, so one failing
+    check does not discard the others' issues.
+
+    Args:
+        html: HTML content of the page
+        url: URL of the page
+
+    Returns:
+        List of issues found on the page
+    """
+    issues: list[Issue] = []
+
+    try:
+        issues.extend(IndexabilityChecker(html, url).check_all())
+        issues.extend(check_pagination(html, url))
+    except Exception as e:
+        logger.warning(f"Indexability checks failed for {url}: {e}")
+
+    try:
+        issues.extend(ContentAnalyzer(html, url).check_all())
+    except Exception as e:
+        logger.warning(f"Content checks failed for {url}: {e}")
+
+    return issues
+
+
+def run_meta_checks(html: str, url: str) -> list[Issue]:
+    """
+    Run every meta tag check for one page.
+
+    Args:
+        html: HTML content of the page
+        url: URL of the page
+
+    Returns:
+        List of issues found on the page
+    """
+    return MetaTagChecker(html, url).check_all()
+
+
+def _check_page(check: PageCheck, html: str, url: str) -> list[Issue]:
+    """Run ``check`` on one page, logging and skipping the page if it raises."""
+    try:
+        return check(html, url)
+    except Exception as e:
+        logger.warning(f"Batch checks failed for {url}: {e}")
+        return []
+
+
+def map_pages(
+    check: PageCheck, pages: Iterable[tuple[str, str]], workers: int | None = None
+) -> list[list[Issue]]:
+    """
+    Apply a per-page check to many pages in parallel.
+
+    Parsing and text analysis are CPU-bound and independent per page, so pages
+    are spread over a process pool. Pages go out in chunks of about a quarter
+    of each worker's share to amortize pickling. A page whose check raises is
+    logged and yields no issues instead of aborting the batch.
+
+    Args:
+        check: Module-level function taking (html, url), so workers can unpickle it
+        pages: (html, url) pairs
+        workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        Issues for each page, in input order
+    """
+    pages = list(pages)
+    workers = min(workers or os.cpu_count() or 1, len(pages))
+    run = partial(_check_page, check)
+
+    # A pool only pays off with more than one page and more than one core
+    if workers <= 1:
+        return [run(html, url) for html, url in pages]
+
+    htmls = [html for html, _url in pages]
+    urls = [url for _html, url in pages]
+    chunksize = max(1, len(pages) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run, htmls, urls, chunksize=chunksize))
+
+
+def batch_audit(pages: Iterable[tuple[str, str]], workers: int | None = None) -> list[list[Issue]]:
+    """
+    Run ``run_audit`` over many pages in parallel.
+
+    Cross-page work such as near-duplicate detection stays in the caller's
+    process.
+
+    Args:
+        pages: (html, url) pairs
+        workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        Issues for each page, in input order
+    """
+    return map_pages(run_audit, pages, workers)
+
+
+def batch_meta_audit(
+    pages: Iterable[tuple[str, str]], workers: int | None = None
+) -> list[list[Issue]]:
+    """
+    Run ``run_meta_checks`` over many pages in parallel.
+
+    Args:
+        pages: (html, url) pairs
+        workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        Issues for each page, in input order
+    """
+    return map_pages(run_meta_checks, pages, workers)
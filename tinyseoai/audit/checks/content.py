@@ -6,10 +6,172 @@ from __future__ import annotations
 import hashlib
 import re
 from collections import Counter
+from functools import cached_property
+from itertools import combinations
+from typing import Any
 
-from bs4 import BeautifulSoup
+import numpy as np
+from lxml import etree
 
 from ...data.models import Issue
+from ...utils.html import parse_html
+
+# A sentence is a run between terminators holding at least one non-space character
+_SENTENCE = re.compile(r"[^.!?]*[^.!?\s][^.!?]*")
+# Trailing/leading punctuation dropped from words before counting
+_WORD_PUNCT = ".,!?;:"
+_VOWEL_GROUP = re.compile(r"[aeiouy]+")
+# Common English stop words excluded from keyword extraction
+_STOP_WORDS = frozenset({
+    "the", "be", "to", "of", "and", "a", "in", "that", "have", "i",
+    "it", "for", "not", "on", "with", "he", "as", "you", "do", "at",
+    "this", "but", "his", "by", "from", "they", "we", "say", "her", "she",
+    "or", "an", "will", "my", "one", "all", "would", "there", "their",
+    "what", "so", "up", "out", "if", "about", "who", "get", "which", "go",
+    "me", "when", "make", "can", "like", "time", "no", "just", "him", "know",
+    "take", "people", "into", "year", "your", "good", "some", "could", "them",
+    "see", "other", "than", "then", "now", "look", "only", "come", "its", "over",
+    "think", "also", "back", "after", "use", "two", "how", "our", "work",
+    "first", "well", "way", "even", "new", "want", "because", "any", "these",
+    "give", "day", "most", "us",
+})
+
+
+def _syllables(word: str) -> int:
+    """Estimate syllables in an already lowercased, punctuation-stripped word."""
+    # Vowel groups, minus a silent trailing 'e'; every word has at least one
+    return max(1, len(_VOWEL_GROUP.findall(word)) - word.endswith("e"))
+
+
+def _count_syllables_batch(words: list[str]) -> int:
+    """
+    Total estimated syllables across words.
+
+    Normalization runs once per word; the vowel-group count runs once per
+    distinct word and is weighted by its frequency, since page text repeats
+    the same words heavily.
+    """
+    normalized = Counter(word.lower().strip(_WORD_PUNCT) for word in words)
+    return sum(count * _syllables(word) for word, count in normalized.items())
+
+
+# Elements whose text is not page content; template/script/style strings are
+# also what BeautifulSoup.get_text() leaves out
+_NON_CONTENT_TAGS = frozenset({"script", "style", "template", "nav", "header", "footer"})
+_NON_CONTENT = (
+    "ancestor::script or ancestor::style or ancestor::template"
+    " or ancestor::nav or ancestor::header or ancestor::footer"
+)
+_CONTENT_HEADINGS = etree.XPath(
+    "//*[self::h1 or self::h2 or self::h3 or self::h4 or self::h5 or self::h6]"
+    f"[not({_NON_CONTENT})]"
+)
+_HEADING_TEXT = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+
+# MinHash parameters for near-duplicate candidate search (universal hashing
+# (a*x + b) mod p over 32-bit shingle hashes, as in datasketch)
+_MINHASH_PERMS = 128
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_perm_rng = np.random.default_rng(1)
+_PERM_A = _perm_rng.integers(1, (1 << 61) - 1, size=_MINHASH_PERMS, dtype=np.uint64)
+_PERM_B = _perm_rng.integers(0, (1 << 61) - 1, size=_MINHASH_PERMS, dtype=np.uint64)
+# Minimum chance that a pair exactly at the threshold becomes an LSH candidate
+_LSH_RECALL = 0.9999
+# Odd multiplier for the polynomial shingle hash over word hashes (mod 2**64)
+_SHINGLE_BASE = np.uint64(1_000_003)
+
+
+def _rolling_shingles(word_hashes: np.ndarray, k: int) -> np.ndarray:
+    """
+    Sorted, distinct k-word shingle hashes from per-word uint64 hashes.
+
+    Every window is the polynomial sum(h[i + j] * P**(k - 1 - j)) mod 2**64
+    of its word hashes (the Rabin-Karp rolling hash), evaluated for all windows
+    at once with Horner's rule so the loop runs k times, not once per window.
+    """
+    n_windows = len(word_hashes) - k + 1
+    if n_windows <= 0:
+        return np.empty(0, dtype=np.uint64)
+
+    # uint64 arithmetic wraps mod 2**64
+    windows = np.zeros(n_windows, dtype=np.uint64)
+    for offset in range(k):
+        windows = windows * _SHINGLE_BASE + word_hashes[offset:offset + n_windows]
+    return np.unique(windows)
+
+
+def _collect_content_text(element: etree._Element, out: list[str]) -> None:
+    """
+    Append the text strings under ``element`` to ``out`` in document order.
+
+    Non-content subtrees are skipped whole, while their tails (the text right
+    after them) are kept, so the text on either side of a removed element
+    stays separate. Comments and processing instructions contribute only
+    their tails. Walks an explicit stack, so tag soup nested deeper than the
+    recursion limit is fine.
+    """
+    if element.text:
+        out.append(element.text)
+    # (child to enter or None, tail to emit once that child is done)
+    stack: list[tuple[etree._Element | None, str | None]] = [
+        (child, child.tail) for child in reversed(element)
+    ]
+    while stack:
+        child, tail = stack.pop()
+        if child is not None and isinstance(child.tag, str) and child.tag not in _NON_CONTENT_TAGS:
+            if child.text:
+                out.append(child.text)
+            stack.append((None, tail))
+            stack.extend((grandchild, grandchild.tail) for grandchild in reversed(child))
+        elif tail:
+            out.append(tail)
+
+
+def _minhash_signature(shingles: np.ndarray) -> np.ndarray:
+    """MinHash signature (_MINHASH_PERMS uint64 values) of distinct shingle hashes."""
+    if not shingles.size:
+        return np.full(_MINHASH_PERMS, _MAX_HASH, dtype=np.uint64)
+    hashes = shingles & _MAX_HASH
+    # uint64 overflow wraps, matching datasketch's permutation arithmetic
+    permuted = ((hashes[:, None] * _PERM_A + _PERM_B) % _MERSENNE_PRIME) & _MAX_HASH
+    return permuted.min(axis=0)
+
+
+def _lsh_bands(threshold: float, num_perm: int = _MINHASH_PERMS) -> tuple[int, int]:
+    """
+    Choose (bands, rows) for LSH banding at a similarity threshold.
+
+    Takes the most selective banding (most rows per band) under which a pair
+    with similarity exactly at the threshold still collides in some band with
+    probability of at least _LSH_RECALL.
+    """
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold**rows) ** bands >= _LSH_RECALL:
+            return bands, rows
+    return num_perm, 1
+
+
+def _join_others(urls: list[str], exclude: str, limit: int = 200) -> str:
+    """
+    Comma-join the URLs other than ``exclude``, truncated to ``limit`` characters.
+
+    Stops joining once the limit is reached, so a large duplicate cluster costs
+    O(limit) per page instead of re-joining the whole cluster every time.
+    """
+    parts: list[str] = []
+    length = -2  # no separator before the first part
+    for url in urls:
+        if url == exclude:
+            continue
+        parts.append(url)
+        length += len(url) + 2
+        if length >= limit:
+            break
+    return ", ".join(parts)[:limit]
 
 
 class ContentAnalyzer:
@@ -25,18 +187,26 @@ class ContentAnalyzer:
         """
         self.html = html
         self.url = url
-        self.soup = BeautifulSoup(html, "lxml")
+        self.tree = parse_html(html)
         self.text = self._extract_text()
 
-    def _extract_text(self) -> str:
-        """Extract clean text from HTML."""
-        # Remove script and style elements
-        for element in self.soup.find_all(["script", "style", "nav", "header", "footer"]):
-            element.decompose()
+        # Tokenize once; every check reads these instead of re-splitting
+        self._words = self.text.split()
+        self._word_count = len(self._words)
+        self._sentence_count = len(_SENTENCE.findall(self.text))
+
+    @cached_property
+    def _word_counter(self) -> Counter[str]:
+        """Frequencies of lowercased, punctuation-stripped words longer than three characters."""
+        return Counter(word.lower().strip(_WORD_PUNCT) for word in self._words if len(word) > 3)
 
-        # Get text
-        text = self.soup.get_text(separator=" ", strip=True)
-        return text
+    def _extract_text(self) -> str:
+        """Extract clean text from HTML, skipping scripts, styles and page chrome."""
+        if self.tree is None or self.tree.tag in _NON_CONTENT_TAGS:
+            return ""
+        strings: list[str] = []
+        _collect_content_text(self.tree, strings)
+        return " ".join(s for t in strings if (s := t.strip()))
 
     def check_all(self) -> list[Issue]:
         """
@@ -45,7 +215,7 @@ class ContentAnalyzer:
         Returns:
             List of content issues
         """
-        issues = []
+        issues: list[Issue] = []
 
         issues.extend(self.check_content_length())
         issues.extend(self.check_readability())
@@ -61,26 +231,27 @@ class ContentAnalyzer:
         Returns:
             List of content length issues
         """
-        issues = []
+        issues: list[Issue] = []
 
-        word_count = len(self.text.split())
+        word_count = self._word_count
 
-        if word_count < 300:
+        # Check the stricter bound first; every count under 100 is also under 300
+        if word_count < 100:
             issues.append(
                 Issue(
                     url=self.url,
-                    type="thin_content",
-                    severity="medium",
-                    detail=f"Page has only {word_count} words. Aim for at least 300 words.",
+                    type="very_thin_content",
+                    severity="high",
+                    detail=f"Page has only {word_count} words. Very thin content may be penalized.",
                 )
             )
-        elif word_count < 100:
+        elif word_count < 300:
             issues.append(
                 Issue(
                     url=self.url,
-                    type="very_thin_content",
-                    severity="high",
-                    detail=f"Page has only {word_count} words. Very thin content may be penalized.",
+                    type="thin_content",
+                    severity="medium",
+                    detail=f"Page has only {word_count} words. Aim for at least 300 words.",
                 )
             )
 
@@ -93,17 +264,14 @@ class ContentAnalyzer:
         Returns:
             List of readability issues
         """
-        issues = []
+        issues: list[Issue] = []
 
         # Calculate average sentence length
-        sentences = re.split(r'[.!?]+', self.text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        if not sentences:
+        if not self._sentence_count:
             return issues
 
-        words = self.text.split()
-        avg_sentence_length = len(words) / len(sentences) if sentences else 0
+        words = self._words
+        avg_sentence_length = self._word_count / self._sentence_count
 
         # Check for very long sentences
         if avg_sentence_length > 25:
@@ -118,7 +286,7 @@ class ContentAnalyzer:
             )
 
         # Calculate average word length
-        avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
+        avg_word_length = sum(len(word) for word in words) / self._word_count if words else 0
 
         if avg_word_length > 6:
             issues.append(
@@ -140,18 +308,16 @@ class ContentAnalyzer:
         Returns:
             Reading ease score (0-100, higher is easier)
         """
-        words = self.text.split()
-        sentences = re.split(r'[.!?]+', self.text)
-        sentences = [s for s in sentences if s.strip()]
+        words = self._words
 
-        if not words or not sentences:
+        if not self._word_count or not self._sentence_count:
             return 0.0
 
         # Count syllables (simplified)
-        syllable_count = sum(self._count_syllables(word) for word in words)
+        syllable_count = _count_syllables_batch(words)
 
-        total_words = len(words)
-        total_sentences = len(sentences)
+        total_words = self._word_count
+        total_sentences = self._sentence_count
 
         # Flesch Reading Ease = 206.835 - 1.015(total words/total sentences) - 84.6(total syllables/total words)
         score = (
@@ -172,24 +338,7 @@ class ContentAnalyzer:
         Returns:
             Estimated syllable count
         """
-        word = word.lower().strip(".,!?;:")
-        vowels = "aeiouy"
-
-        syllable_count = 0
-        previous_was_vowel = False
-
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllable_count += 1
-            previous_was_vowel = is_vowel
-
-        # Adjust for silent 'e'
-        if word.endswith("e"):
-            syllable_count -= 1
-
-        # Every word has at least one syllable
-        return max(1, syllable_count)
+        return _syllables(word.lower().strip(_WORD_PUNCT))
 
     def check_heading_content_ratio(self) -> list[Issue]:
         """
@@ -198,14 +347,14 @@ class ContentAnalyzer:
         Returns:
             List of heading ratio issues
         """
-        issues = []
+        issues: list[Issue] = []
 
         # Get all heading text
-        headings = self.soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
-        heading_text = " ".join(h.get_text() for h in headings)
+        headings = _CONTENT_HEADINGS(self.tree) if self.tree is not None else []
+        heading_text = " ".join("".join(_HEADING_TEXT(h)) for h in headings)
         heading_words = len(heading_text.split())
 
-        total_words = len(self.text.split())
+        total_words = self._word_count
 
         if total_words > 0:
             heading_ratio = heading_words / total_words
@@ -231,21 +380,14 @@ class ContentAnalyzer:
         Returns:
             List of keyword stuffing issues
         """
-        issues = []
+        issues: list[Issue] = []
 
-        words = [
-            word.lower().strip(".,!?;:")
-            for word in self.text.split()
-            if len(word) > 3  # Ignore very short words
-        ]
+        word_freq = self._word_counter
+        total_words = word_freq.total()
 
-        if not words:
+        if not total_words:
             return issues
 
-        # Get word frequency
-        word_freq = Counter(words)
-        total_words = len(words)
-
         # Check for overly frequent words
         for word, count in word_freq.most_common(10):
             frequency = count / total_words
@@ -274,46 +416,26 @@ class ContentAnalyzer:
         Returns:
             List of (keyword, frequency) tuples
         """
-        # Common English stop words to exclude
-        stop_words = {
-            "the", "be", "to", "of", "and", "a", "in", "that", "have", "i",
-            "it", "for", "not", "on", "with", "he", "as", "you", "do", "at",
-            "this", "but", "his", "by", "from", "they", "we", "say", "her", "she",
-            "or", "an", "will", "my", "one", "all", "would", "there", "their",
-            "what", "so", "up", "out", "if", "about", "who", "get", "which", "go",
-            "me", "when", "make", "can", "like", "time", "no", "just", "him", "know",
-            "take", "people", "into", "year", "your", "good", "some", "could", "them",
-            "see", "other", "than", "then", "now", "look", "only", "come", "its", "over",
-            "think", "also", "back", "after", "use", "two", "how", "our", "work",
-            "first", "well", "way", "even", "new", "want", "because", "any", "these",
-            "give", "day", "most", "us"
-        }
-
-        words = [
-            word.lower().strip(".,!?;:")
-            for word in self.text.split()
-            if len(word) > 3 and word.lower() not in stop_words
-        ]
+        # At most len(_STOP_WORDS) of the leading entries can be stop words
+        candidates = self._word_counter.most_common(n + len(_STOP_WORDS))
+        return [(word, count) for word, count in candidates if word not in _STOP_WORDS][:n]
 
-        word_freq = Counter(words)
-        return word_freq.most_common(n)
-
-    def get_content_metrics(self) -> dict[str, any]:
+    def get_content_metrics(self) -> dict[str, Any]:
         """
         Get comprehensive content metrics.
 
         Returns:
             Dictionary with content metrics
         """
-        words = self.text.split()
-        sentences = re.split(r'[.!?]+', self.text)
-        sentences = [s for s in sentences if s.strip()]
+        words = self._words
+        word_count = self._word_count
+        sentence_count = self._sentence_count
 
         return {
-            "word_count": len(words),
-            "sentence_count": len(sentences),
-            "avg_sentence_length": len(words) / len(sentences) if sentences else 0,
-            "avg_word_length": sum(len(w) for w in words) / len(words) if words else 0,
+            "word_count": word_count,
+            "sentence_count": sentence_count,
+            "avg_sentence_length": word_count / sentence_count if sentence_count else 0,
+            "avg_word_length": sum(len(w) for w in words) / word_count if words else 0,
             "flesch_reading_ease": self.calculate_flesch_reading_ease(),
             "top_keywords": self.extract_top_keywords(5),
         }
@@ -322,10 +444,11 @@ class ContentAnalyzer:
 class DuplicateContentDetector:
     """Detect duplicate and near-duplicate content across pages."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize duplicate content detector."""
-        self.content_hashes: dict[str, list[str]] = {}  # hash -> URLs
-        self.content_fingerprints: dict[str, set[str]] = {}  # URL -> shingles
+        self.content_hashes: dict[bytes, list[str]] = {}  # digest -> URLs
+        self.content_fingerprints: dict[str, np.ndarray] = {}  # URL -> sorted shingle hashes
+        self.signatures: dict[str, np.ndarray] = {}  # URL -> MinHash signature
 
     def add_page(self, url: str, text: str) -> None:
         """
@@ -335,35 +458,43 @@ class DuplicateContentDetector:
             url: URL of the page
             text: Text content of the page
         """
-        # Calculate exact duplicate hash
-        content_hash = hashlib.md5(text.encode()).hexdigest()
-        if content_hash not in self.content_hashes:
-            self.content_hashes[content_hash] = []
-        self.content_hashes[content_hash].append(url)
+        # Exact-duplicate bucket key; blake2b is faster than MD5 and the raw
+        # 16-byte digest skips hex formatting
+        content_hash = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        self.content_hashes.setdefault(content_hash, []).append(url)
 
         # Calculate content fingerprint (shingles) for near-duplicate detection
         shingles = self._create_shingles(text, k=5)
         self.content_fingerprints[url] = shingles
+        self.signatures[url] = _minhash_signature(shingles)
 
-    def _create_shingles(self, text: str, k: int = 5) -> set[str]:
+    def _create_shingles(self, text: str, k: int = 5) -> np.ndarray:
         """
         Create k-shingles from text for similarity comparison.
 
+        Each distinct word is hashed once (64-bit blake2b, stable across runs
+        unlike hash()), then _rolling_shingles combines the word hashes of
+        every window without building per-window strings.
+
         Args:
             text: Text to create shingles from
             k: Shingle size (number of words)
 
         Returns:
-            Set of shingles
+            Sorted array of distinct uint64 shingle hashes
         """
         words = text.lower().split()
-        shingles = set()
-
-        for i in range(len(words) - k + 1):
-            shingle = " ".join(words[i:i + k])
-            shingles.add(shingle)
+        if len(words) < k:
+            return np.empty(0, dtype=np.uint64)
 
-        return shingles
+        word_codes = {
+            word: int.from_bytes(hashlib.blake2b(word.encode(), digest_size=8).digest(), "little")
+            for word in dict.fromkeys(words)
+        }
+        word_hashes = np.fromiter(
+            (word_codes[word] for word in words), dtype=np.uint64, count=len(words)
+        )
+        return _rolling_shingles(word_hashes, k)
 
     def find_duplicates(self) -> list[Issue]:
         """
@@ -372,7 +503,7 @@ class DuplicateContentDetector:
         Returns:
             List of duplicate content issues
         """
-        issues = []
+        issues: list[Issue] = []
 
         # Find exact duplicates
         for _content_hash, urls in self.content_hashes.items():
@@ -384,7 +515,7 @@ class DuplicateContentDetector:
                             type="duplicate_content",
                             severity="high",
                             detail=f"Exact duplicate of {len(urls) - 1} other page(s): "
-                            f"{', '.join(u for u in urls if u != url)[:200]}",
+                            f"{_join_others(urls, url)}",
                         )
                     )
 
@@ -394,50 +525,92 @@ class DuplicateContentDetector:
         """
         Find near-duplicate content using Jaccard similarity.
 
+        Candidate pairs come from MinHash LSH banding, so only pages sharing a
+        band are compared; candidates whose shingle counts are too far apart to
+        reach the threshold are dropped, and the rest are confirmed with the
+        exact Jaccard similarity of their shingle sets.
+
         Args:
             threshold: Similarity threshold (0-1)
 
         Returns:
             List of near-duplicate issues
         """
-        issues = []
+        issues: list[Issue] = []
         urls = list(self.content_fingerprints.keys())
+        sizes = [self.content_fingerprints[url].size for url in urls]
+
+        for i, j in self._candidate_pairs(urls, threshold):
+            # Jaccard similarity never exceeds the ratio of the set sizes
+            smaller, larger = sorted((sizes[i], sizes[j]))
+            if larger and smaller / larger < threshold:
+                continue
+
+            url1, url2 = urls[i], urls[j]
+            similarity = self._jaccard_similarity(
+                self.content_fingerprints[url1],
+                self.content_fingerprints[url2],
+            )
 
-        # Compare all pairs
-        for i, url1 in enumerate(urls):
-            for url2 in urls[i + 1:]:
-                similarity = self._jaccard_similarity(
-                    self.content_fingerprints[url1],
-                    self.content_fingerprints[url2],
-                )
-
-                if similarity >= threshold:
-                    issues.append(
-                        Issue(
-                            url=url1,
-                            type="near_duplicate_content",
-                            severity="medium",
-                            detail=f"Near-duplicate ({similarity * 100:.1f}% similar) to: {url2}",
-                        )
+            if similarity >= threshold:
+                issues.append(
+                    Issue(
+                        url=url1,
+                        type="near_duplicate_content",
+                        severity="medium",
+                        detail=f"Near-duplicate ({similarity * 100:.1f}% similar) to: {url2}",
                     )
+                )
 
         return issues
 
-    def _jaccard_similarity(self, set1: set[str], set2: set[str]) -> float:
+    def _candidate_pairs(self, urls: list[str], threshold: float) -> list[tuple[int, int]]:
         """
-        Calculate Jaccard similarity between two sets.
+        Index pairs (i < j) of pages that may reach the similarity threshold.
+
+        Args:
+            urls: Page URLs in insertion order
+            threshold: Similarity threshold (0-1)
+
+        Returns:
+            Sorted candidate pairs of indexes into urls
+        """
+        if threshold <= 0 or len(urls) < 2:
+            return list(combinations(range(len(urls)), 2))
+
+        bands, rows = _lsh_bands(threshold)
+        matrix = np.stack([self.signatures[url] for url in urls])
+
+        candidates: set[tuple[int, int]] = set()
+        for band in range(bands):
+            block = matrix[:, band * rows:(band + 1) * rows]
+            buckets: dict[bytes, list[int]] = {}
+            for index, row in enumerate(block):
+                buckets.setdefault(row.tobytes(), []).append(index)
+            for members in buckets.values():
+                if len(members) > 1:
+                    candidates.update(combinations(members, 2))
+
+        return sorted(candidates)
+
+    def _jaccard_similarity(self, shingles1: np.ndarray, shingles2: np.ndarray) -> float:
+        """
+        Calculate Jaccard similarity between two shingle sets.
+
+        Both arrays are sorted and duplicate-free, so the intersection is a
+        native sorted merge rather than a Python set operation.
 
         Args:
-            set1: First set
-            set2: Second set
+            shingles1: First sorted array of distinct shingle hashes
+            shingles2: Second sorted array of distinct shingle hashes
 
         Returns:
             Similarity score (0-1)
         """
-        if not set1 and not set2:
+        if not shingles1.size and not shingles2.size:
             return 1.0
 
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
+        intersection = np.intersect1d(shingles1, shingles2, assume_unique=True).size
+        union = shingles1.size + shingles2.size - intersection
 
         return intersection / union if union > 0 else 0.0
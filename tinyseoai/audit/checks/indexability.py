@@ -3,11 +3,18 @@ Indexability checks including canonical tags, robots meta, and XML sitemap valid
 """
 from __future__ import annotations
 
+import io
+from functools import cached_property
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import Tag
+from lxml import etree
 
 from ...data.models import Issue
+from ...utils.html import get_soup
+
+_HTTP_PREFIXES = ("http://", "https://")
+_VALID_CHANGEFREQ = frozenset({"always", "hourly", "daily", "weekly", "monthly", "yearly", "never"})
 
 
 class IndexabilityChecker:
@@ -23,8 +30,19 @@ class IndexabilityChecker:
         """
         self.html = html
         self.url = url
-        self.soup = BeautifulSoup(html, "lxml")
+        self.soup = get_soup(html)
         self.parsed_url = urlparse(url)
+        self._url_no_slash = url.rstrip("/")
+
+    @cached_property
+    def _named_meta(self) -> dict[str, list[Tag]]:
+        """Meta tags grouped by lowercased ``name``, collected in one pass."""
+        named: dict[str, list[Tag]] = {}
+        for tag in self.soup.find_all("meta", attrs={"name": True}):
+            name = tag["name"]
+            if name and isinstance(name, str):
+                named.setdefault(name.lower(), []).append(tag)
+        return named
 
     def check_all(self) -> list[Issue]:
         """
@@ -91,7 +109,7 @@ class IndexabilityChecker:
                 canonical_url = urljoin(self.url, canonical_url)
 
                 # Check if canonical is absolute
-                if not canonical_url.startswith(("http://", "https://")):
+                if not canonical_url.startswith(_HTTP_PREFIXES):
                     issues.append(
                         Issue(
                             url=self.url,
@@ -102,10 +120,7 @@ class IndexabilityChecker:
                     )
 
                 # Check if canonical points to itself (recommended)
-                current_url_normalized = self.url.rstrip("/")
-                canonical_url_normalized = canonical_url.rstrip("/")
-
-                if current_url_normalized != canonical_url_normalized:
+                if self._url_no_slash != canonical_url.rstrip("/"):
                     issues.append(
                         Issue(
                             url=self.url,
@@ -116,10 +131,7 @@ class IndexabilityChecker:
                     )
 
                 # Check for HTTP vs HTTPS mismatch
-                current_scheme = self.parsed_url.scheme
-                canonical_scheme = urlparse(canonical_url).scheme
-
-                if current_scheme == "https" and canonical_scheme == "http":
+                if self.parsed_url.scheme == "https" and urlparse(canonical_url).scheme == "http":
                     issues.append(
                         Issue(
                             url=self.url,
@@ -140,7 +152,7 @@ class IndexabilityChecker:
         """
         issues = []
 
-        robots_tags = self.soup.find_all("meta", attrs={"name": lambda n: n and n.lower() == "robots"})
+        robots_tags = self._named_meta.get("robots", [])
 
         if len(robots_tags) > 1:
             issues.append(
@@ -237,8 +249,8 @@ class IndexabilityChecker:
         issues = []
 
         # Check for Googlebot-specific tags
-        googlebot_tag = self.soup.find("meta", attrs={"name": lambda n: n and n.lower() == "googlebot"})
-        general_robots = self.soup.find("meta", attrs={"name": lambda n: n and n.lower() == "robots"})
+        googlebot_tag = next(iter(self._named_meta.get("googlebot", [])), None)
+        general_robots = next(iter(self._named_meta.get("robots", [])), None)
 
         if googlebot_tag and general_robots:
             google_content = (googlebot_tag.get("content") or "").lower()
@@ -272,134 +284,184 @@ class IndexabilityChecker:
 class SitemapValidator:
     """Validate XML sitemap structure and content."""
 
-    def __init__(self, sitemap_xml: str, sitemap_url: str):
+    def __init__(self, sitemap_xml: str | bytes, sitemap_url: str):
         """
         Initialize sitemap validator.
 
         Args:
-            sitemap_xml: XML content of the sitemap
+            sitemap_xml: XML content of the sitemap. Prefer the raw response
+                bytes so the XML declaration's encoding is honoured; decoded
+                text is parsed as-is, whatever the declaration says.
             sitemap_url: URL of the sitemap
         """
         self.xml = sitemap_xml
         self.url = sitemap_url
-        self.soup = BeautifulSoup(sitemap_xml, "lxml-xml")
 
     def validate(self) -> list[Issue]:
         """
         Validate sitemap structure and content.
 
+        The sitemap is streamed with ``iterparse``: each ``<url>`` entry is
+        released once read, so memory stays flat even at 50,000 URLs.
+
         Returns:
             List of sitemap issues
         """
-        issues = []
-
-        # Check if it's a valid sitemap
-        if not self.soup.find("urlset") and not self.soup.find("sitemapindex"):
-            issues.append(
+        url_issues: list[Issue] = []
+        url_count = 0
+        if isinstance(self.xml, str):
+            # The text is already decoded: override any encoding declaration
+            source, encoding = self.xml.encode("utf-8"), "utf-8"
+        else:
+            source, encoding = self.xml, None
+        context = etree.iterparse(
+            io.BytesIO(source), events=("end",), tag="{*}url", recover=True, encoding=encoding
+        )
+
+        syntax_error: str | None = None
+        try:
+            for _event, url_tag in context:
+                url_count += 1
+                if url_count <= 100:  # Sample first 100 to avoid performance issues
+                    url_issues.extend(self._validate_url(url_tag))
+                # Free the entry and any already-processed siblings
+                url_tag.clear()
+                while url_tag.getprevious() is not None:
+                    del url_tag.getparent()[0]
+            root = context.root
+        except etree.XMLSyntaxError as e:
+            syntax_error = str(e)
+            root = None
+
+        # Errors lxml recovered from are logged rather than raised
+        if syntax_error is None:
+            errors = context.error_log.filter_from_errors()
+            if errors:
+                syntax_error = errors[0].message
+
+        # Check if it's a valid sitemap; URLs already read imply it was one
+        if url_count == 0 and (
+            root is None or etree.QName(root).localname not in ("urlset", "sitemapindex")
+        ):
+            return [
                 Issue(
                     url=self.url,
                     type="invalid_sitemap_format",
                     severity="high",
                     detail="Sitemap does not have valid urlset or sitemapindex root element",
                 )
-            )
-            return issues
+            ]
+
+        issues = []
 
         # Check for URL count (max 50,000 per sitemap)
-        urls = self.soup.find_all("url")
-        if len(urls) > 50000:
+        if url_count > 50000:
             issues.append(
                 Issue(
                     url=self.url,
                     type="sitemap_too_many_urls",
                     severity="high",
-                    detail=f"Sitemap contains {len(urls)} URLs (max 50,000 recommended)",
+                    detail=f"Sitemap contains {url_count} URLs (max 50,000 recommended)",
                 )
             )
 
-        # Validate individual URLs
-        for url_tag in urls[:100]:  # Sample first 100 to avoid performance issues
-            loc = url_tag.find("loc")
-            if not loc or not loc.string:
-                issues.append(
-                    Issue(
-                        url=self.url,
-                        type="sitemap_url_missing_loc",
-                        severity="high",
-                        detail="Sitemap URL entry missing <loc> element",
-                    )
+        if syntax_error is not None:
+            issues.append(
+                Issue(
+                    url=self.url,
+                    type="sitemap_syntax_error",
+                    severity="medium",
+                    detail=f"Sitemap is not well-formed XML: {syntax_error}",
                 )
-                continue
+            )
 
-            url_value = loc.string.strip()
+        issues.extend(url_issues)
+        return issues
 
-            # Check if URL is absolute
-            if not url_value.startswith(("http://", "https://")):
-                issues.append(
-                    Issue(
-                        url=self.url,
-                        type="sitemap_relative_url",
-                        severity="high",
-                        detail=f"Sitemap contains relative URL: {url_value}",
-                    )
+    def _validate_url(self, url_tag: etree._Element) -> list[Issue]:
+        """
+        Validate a single ``<url>`` entry.
+
+        Args:
+            url_tag: Parsed ``<url>`` element
+
+        Returns:
+            List of issues for this entry
+        """
+        issues = []
+
+        loc = url_tag.findtext("{*}loc")
+        if not loc:
+            issues.append(
+                Issue(
+                    url=self.url,
+                    type="sitemap_url_missing_loc",
+                    severity="high",
+                    detail="Sitemap URL entry missing <loc> element",
                 )
+            )
+            return issues
 
-            # Check for invalid characters
-            if " " in url_value:
-                issues.append(
-                    Issue(
-                        url=self.url,
-                        type="sitemap_url_has_spaces",
-                        severity="high",
-                        detail=f"Sitemap URL contains spaces: {url_value}",
-                    )
+        url_value = loc.strip()
+
+        # Check if URL is absolute
+        if not url_value.startswith(_HTTP_PREFIXES):
+            issues.append(
+                Issue(
+                    url=self.url,
+                    type="sitemap_relative_url",
+                    severity="high",
+                    detail=f"Sitemap contains relative URL: {url_value}",
                 )
+            )
 
-            # Validate priority if present
-            priority = url_tag.find("priority")
-            if priority and priority.string:
-                try:
-                    priority_val = float(priority.string)
-                    if priority_val < 0 or priority_val > 1:
-                        issues.append(
-                            Issue(
-                                url=self.url,
-                                type="sitemap_invalid_priority",
-                                severity="medium",
-                                detail=f"Priority must be between 0.0 and 1.0, got {priority_val}",
-                            )
-                        )
-                except ValueError:
+        # Check for invalid characters
+        if " " in url_value:
+            issues.append(
+                Issue(
+                    url=self.url,
+                    type="sitemap_url_has_spaces",
+                    severity="high",
+                    detail=f"Sitemap URL contains spaces: {url_value}",
+                )
+            )
+
+        # Validate priority if present
+        priority = url_tag.findtext("{*}priority")
+        if priority:
+            try:
+                priority_val = float(priority)
+                if priority_val < 0 or priority_val > 1:
                     issues.append(
                         Issue(
                             url=self.url,
                             type="sitemap_invalid_priority",
                             severity="medium",
-                            detail=f"Invalid priority value: {priority.string}",
+                            detail=f"Priority must be between 0.0 and 1.0, got {priority_val}",
                         )
                     )
+            except ValueError:
+                issues.append(
+                    Issue(
+                        url=self.url,
+                        type="sitemap_invalid_priority",
+                        severity="medium",
+                        detail=f"Invalid priority value: {priority}",
+                    )
+                )
 
-            # Validate changefreq if present
-            changefreq = url_tag.find("changefreq")
-            if changefreq and changefreq.string:
-                valid_values = [
-                    "always",
-                    "hourly",
-                    "daily",
-                    "weekly",
-                    "monthly",
-                    "yearly",
-                    "never",
-                ]
-                if changefreq.string.lower() not in valid_values:
-                    issues.append(
-                        Issue(
-                            url=self.url,
-                            type="sitemap_invalid_changefreq",
-                            severity="low",
-                            detail=f"Invalid changefreq value: {changefreq.string}",
-                        )
+        # Validate changefreq if present
+        changefreq = url_tag.findtext("{*}changefreq")
+        if changefreq:
+            if changefreq.lower() not in _VALID_CHANGEFREQ:
+                issues.append(
+                    Issue(
+                        url=self.url,
+                        type="sitemap_invalid_changefreq",
+                        severity="low",
+                        detail=f"Invalid changefreq value: {changefreq}",
                     )
+                )
 
         return issues
 
@@ -416,7 +478,7 @@ def check_pagination(html: str, url: str) -> list[Issue]:
         List of pagination issues
     """
     issues = []
-    soup = BeautifulSoup(html, "lxml")
+    soup = get_soup(html)
 
     # Check for rel="next" and rel="prev" links
     next_link = soup.find("link", rel="next")
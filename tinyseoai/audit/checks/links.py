@@ -3,23 +3,120 @@ Comprehensive link analysis including link graphs, orphan pages, and redirect ch
 """
 from __future__ import annotations
 
-from collections import defaultdict
+import heapq
+from collections.abc import Collection, Iterator, KeysView, Mapping
+from itertools import islice
+from operator import itemgetter
+from typing import Any
+from urllib.parse import urljoin, urlparse
 
 import httpx
+import numpy as np
 from loguru import logger
 
 from ...data.models import Issue
 
+# Shared stand-in for pages without anchors, so lookups allocate nothing
+_NO_ANCHORS: frozenset[str] = frozenset()
+# Anchor texts that say nothing about the link target
+_GENERIC_ANCHORS = frozenset(
+    {"click here", "read more", "learn more", "here", "this", "link", "more"}
+)
+
+
+class _AdjacencyView(Mapping[str, frozenset[str]]):
+    """
+    Live, read-only URL view of one direction of a LinkGraph's ID adjacency.
+
+    Every URL in the graph is a key. A lookup translates that URL's neighbour
+    IDs on demand (O(degree)) and returns a frozenset, so writes through the
+    view fail loudly instead of silently changing nothing.
+    """
+
+    __slots__ = ("_url_to_id", "_id_to_url", "_adjacency")
+
+    def __init__(
+        self, url_to_id: dict[str, int], id_to_url: list[str], adjacency: list[set[int]]
+    ) -> None:
+        self._url_to_id = url_to_id
+        self._id_to_url = id_to_url
+        self._adjacency = adjacency
+
+    def __getitem__(self, url: str) -> frozenset[str]:
+        urls = self._id_to_url
+        return frozenset(urls[other] for other in self._adjacency[self._url_to_id[url]])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._url_to_id)
+
+    def __len__(self) -> int:
+        return len(self._url_to_id)
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._url_to_id
+
 
 class LinkGraph:
-    """Build and analyze link graph for a website."""
+    """
+    Build and analyze link graph for a website.
+
+    URLs are interned to dense integer IDs on first sight; adjacency is kept
+    as per-ID sets of IDs, so traversals hash small ints instead of URLs.
+    """
+
+    __slots__ = (
+        "_url_to_id",
+        "_id_to_url",
+        "_adj",
+        "_radj",
+        "anchor_texts",
+        "inbound_anchors",
+        "_version",
+        "_depth_cache",
+        "_orphan_cache",
+    )
 
     def __init__(self):
         """Initialize the link graph."""
-        self.nodes: set[str] = set()
-        self.edges: dict[str, set[str]] = defaultdict(set)  # source -> targets
-        self.backlinks: dict[str, set[str]] = defaultdict(set)  # target -> sources
-        self.anchor_texts: dict[tuple[str, str], list[str]] = defaultdict(list)
+        self._url_to_id: dict[str, int] = {}
+        self._id_to_url: list[str] = []
+        self._adj: list[set[int]] = []  # source ID -> target IDs
+        self._radj: list[set[int]] = []  # target ID -> source IDs
+        self.anchor_texts: dict[tuple[str, str], list[str]] = {}
+        self.inbound_anchors: dict[str, set[str]] = {}  # target -> anchor texts
+
+        # Bumped whenever pages or links change; derived results cached
+        # against an older version are recomputed on next use
+        self._version = 0
+        # start -> (version, depths by URL, depths by ID with -1 for unreached)
+        self._depth_cache: dict[str, tuple[int, dict[str, int], np.ndarray | None]] = {}
+        self._orphan_cache: tuple[int, list[str]] | None = None
+
+    @property
+    def nodes(self) -> KeysView[str]:
+        """Live, set-like view of every URL in the graph."""
+        return self._url_to_id.keys()
+
+    @property
+    def edges(self) -> Mapping[str, frozenset[str]]:
+        """Live, read-only view of source URL -> target URLs."""
+        return _AdjacencyView(self._url_to_id, self._id_to_url, self._adj)
+
+    @property
+    def backlinks(self) -> Mapping[str, frozenset[str]]:
+        """Live, read-only view of target URL -> source URLs."""
+        return _AdjacencyView(self._url_to_id, self._id_to_url, self._radj)
+
+    def _intern(self, url: str) -> int:
+        """Return the ID for ``url``, assigning the next one if it is new."""
+        node = self._url_to_id.get(url)
+        if node is None:
+            node = self._url_to_id[url] = len(self._id_to_url)
+            self._id_to_url.append(url)
+            self._adj.append(set())
+            self._radj.append(set())
+            self._version += 1
+        return node
 
     def add_page(self, url: str) -> None:
         """
@@ -28,7 +125,7 @@ class LinkGraph:
         Args:
             url: URL of the page
         """
-        self.nodes.add(url)
+        self._intern(url)
 
     def add_link(self, source: str, target: str, anchor_text: str = "") -> None:
         """
@@ -39,13 +136,17 @@ class LinkGraph:
             target: Target URL
             anchor_text: Anchor text of the link
         """
-        self.nodes.add(source)
-        self.nodes.add(target)
-        self.edges[source].add(target)
-        self.backlinks[target].add(source)
+        source_id = self._intern(source)
+        target_id = self._intern(target)
+        targets = self._adj[source_id]
+        if target_id not in targets:
+            targets.add(target_id)
+            self._radj[target_id].add(source_id)
+            self._version += 1
 
         if anchor_text:
-            self.anchor_texts[(source, target)].append(anchor_text)
+            self.anchor_texts.setdefault((source, target), []).append(anchor_text)
+            self.inbound_anchors.setdefault(target, set()).add(anchor_text)
 
     def get_orphan_pages(self) -> list[str]:
         """
@@ -54,15 +155,40 @@ class LinkGraph:
         Returns:
             List of orphan page URLs
         """
-        orphans = []
+        if self._orphan_cache is not None and self._orphan_cache[0] == self._version:
+            return list(self._orphan_cache[1])
+
+        # A page is orphaned if it has no backlinks
+        # (except if it's the homepage/entry point)
+        orphans = [
+            url for url, sources in zip(self._id_to_url, self._radj, strict=True) if not sources
+        ]
+
+        self._orphan_cache = (self._version, orphans)
+        return list(orphans)
+
+    def iter_orphans(
+        self, limit: int | None = None, exclude: Collection[str] | None = None
+    ) -> Iterator[str]:
+        """
+        Lazily yield orphan pages in insertion order, stopping after ``limit``.
+
+        Unlike ``get_orphan_pages`` nothing is materialized, so sampling the
+        first few orphans of a large, badly linked site costs O(limit).
 
-        for node in self.nodes:
-            # A page is orphaned if it has no backlinks
-            # (except if it's the homepage/entry point)
-            if len(self.backlinks[node]) == 0:
-                orphans.append(node)
+        Args:
+            limit: Maximum number of orphans to yield (all when None)
+            exclude: URLs never reported, such as the homepage
 
-        return orphans
+        Yields:
+            Orphan page URLs
+        """
+        orphans = (
+            url
+            for url, sources in zip(self._id_to_url, self._radj, strict=True)
+            if not sources and not (exclude and url in exclude)
+        )
+        return islice(orphans, limit)
 
     def get_page_depth(self, start_url: str) -> dict[str, int]:
         """
@@ -74,35 +200,155 @@ class LinkGraph:
         Returns:
             Dictionary mapping URLs to their depth from start
         """
-        from collections import deque
+        return dict(self._depths(start_url))
 
-        depths = {start_url: 0}
-        queue = deque([start_url])
+    def _depths(self, start_url: str) -> dict[str, int]:
+        """
+        BFS depths from ``start_url``, memoized until the graph next changes.
 
-        while queue:
-            current = queue.popleft()
-            current_depth = depths[current]
+        The returned dict is shared with the cache and must not be mutated.
+        """
+        return self._bfs(start_url)[0]
 
-            for target in self.edges.get(current, set()):
-                if target not in depths:
-                    depths[target] = current_depth + 1
-                    queue.append(target)
+    def _bfs(self, start_url: str) -> tuple[dict[str, int], np.ndarray | None]:
+        """
+        Run (or reuse) the BFS from ``start_url``.
+
+        Returns depths keyed by URL in BFS order, plus the same depths as an
+        int32 array indexed by page ID (None when the start is not in the
+        graph). Both are shared with the cache and must not be mutated.
+        """
+        cached = self._depth_cache.get(start_url)
+        if cached is not None and cached[0] == self._version:
+            return cached[1], cached[2]
+
+        start = self._url_to_id.get(start_url)
+        if start is None:
+            depths = {start_url: 0}
+            depth_array = None
+        else:
+            adj = self._adj
+            depth_by_id = [-1] * len(adj)
+            depth_by_id[start] = 0
+            order = [start]
+            frontier = order[:]
+            depth = 0
+
+            # Level-synchronous: one frontier list per depth instead of a queue
+            while frontier:
+                depth += 1
+                next_frontier = []
+                for current in frontier:
+                    for target in adj[current]:
+                        if depth_by_id[target] < 0:
+                            depth_by_id[target] = depth
+                            next_frontier.append(target)
+                order.extend(next_frontier)
+                frontier = next_frontier
+
+            urls = self._id_to_url
+            depths = {urls[node]: depth_by_id[node] for node in order}
+            depth_array = np.array(depth_by_id, dtype=np.int32)
+
+        self._depth_cache[start_url] = (self._version, depths, depth_array)
+        return depths, depth_array
+
+    def get_page_depth_dobfs(
+        self, start_url: str, alpha: int = 14, beta: int = 24
+    ) -> dict[str, int]:
+        """
+        Calculate page depths with a direction-optimizing BFS.
+
+        Expands the frontier top-down while it is small, then switches to
+        bottom-up steps (each unvisited page scans its backlinks for a parent
+        in the frontier) once the frontier's out-edges exceed the unvisited
+        pages' in-edges divided by ``alpha``. It switches back when the
+        frontier shrinks below ``1/beta`` of the pages. Depths are identical
+        to ``get_page_depth``; the saving is on dense graphs where most
+        top-down edge checks hit already-visited pages.
 
-        return depths
+        Args:
+            start_url: Starting URL (usually homepage)
+            alpha: Top-down to bottom-up switching threshold
+            beta: Bottom-up to top-down switching threshold
 
-    def get_pages_beyond_depth(self, start_url: str, max_depth: int = 3) -> list[str]:
+        Returns:
+            Dictionary mapping URLs to their depth from start
+        """
+        start = self._url_to_id.get(start_url)
+        if start is None:
+            return {start_url: 0}
+
+        adj, radj = self._adj, self._radj
+        node_count = len(adj)
+        depth_by_id = [-1] * node_count
+        depth_by_id[start] = 0
+        order = [start]
+        frontier = [start]
+        unvisited = [node for node in range(node_count) if node != start]
+        unvisited_edges = sum(len(radj[node]) for node in unvisited)
+        top_down = True
+        depth = 0
+
+        while frontier:
+            if top_down:
+                frontier_edges = sum(len(adj[node]) for node in frontier)
+                top_down = frontier_edges * alpha <= unvisited_edges
+            else:
+                top_down = len(frontier) * beta < node_count
+
+            parent_depth = depth
+            depth += 1
+            next_frontier = []
+
+            if top_down:
+                for node in frontier:
+                    for target in adj[node]:
+                        if depth_by_id[target] < 0:
+                            depth_by_id[target] = depth
+                            next_frontier.append(target)
+            else:
+                unvisited = [node for node in unvisited if depth_by_id[node] < 0]
+                for node in unvisited:
+                    for source in radj[node]:
+                        if depth_by_id[source] == parent_depth:
+                            depth_by_id[node] = depth
+                            next_frontier.append(node)
+                            break
+
+            unvisited_edges -= sum(len(radj[node]) for node in next_frontier)
+            order.extend(next_frontier)
+            frontier = next_frontier
+
+        urls = self._id_to_url
+        return {urls[node]: depth_by_id[node] for node in order}
+
+    def get_pages_beyond_depth(
+        self, start_url: str, max_depth: int = 3, limit: int | None = None
+    ) -> list[str]:
         """
         Find pages that are too many clicks away from the homepage.
 
+        The comparison runs over the cached per-ID depth array, so only the
+        matching pages are translated back to URLs.
+
         Args:
             start_url: Starting URL (usually homepage)
             max_depth: Maximum acceptable depth
+            limit: Maximum number of URLs to return (all when None)
 
         Returns:
-            List of URLs beyond max depth
+            List of URLs beyond max depth, in the order pages were added
         """
-        depths = self.get_page_depth(start_url)
-        return [url for url, depth in depths.items() if depth > max_depth]
+        depths, depth_array = self._bfs(start_url)
+        if depth_array is None:
+            deep = [url for url, depth in depths.items() if depth > max_depth]
+            return deep[:limit]
+
+        # Unreached pages hold -1 and must never count as deep
+        deep_ids = np.flatnonzero(depth_array > max(max_depth, -1))[:limit]
+        urls = self._id_to_url
+        return [urls[node] for node in deep_ids.tolist()]
 
     def get_page_metrics(self, url: str) -> dict[str, int]:
         """
@@ -114,17 +360,11 @@ class LinkGraph:
         Returns:
             Dictionary with page metrics
         """
+        node = self._url_to_id.get(url)
         return {
-            "outbound_links": len(self.edges.get(url, set())),
-            "inbound_links": len(self.backlinks.get(url, set())),
-            "unique_anchor_texts": len(
-                set(
-                    anchor
-                    for (src, tgt), anchors in self.anchor_texts.items()
-                    if tgt == url
-                    for anchor in anchors
-                )
-            ),
+            "outbound_links": len(self._adj[node]) if node is not None else 0,
+            "inbound_links": len(self._radj[node]) if node is not None else 0,
+            "unique_anchor_texts": len(self.inbound_anchors.get(url, _NO_ANCHORS)),
         }
 
     def get_hub_pages(self, top_n: int = 10) -> list[tuple[str, int]]:
@@ -137,9 +377,12 @@ class LinkGraph:
         Returns:
             List of (URL, outbound_count) tuples
         """
-        hubs = [(url, len(targets)) for url, targets in self.edges.items()]
-        hubs.sort(key=lambda x: x[1], reverse=True)
-        return hubs[:top_n]
+        hubs = (
+            (url, len(targets))
+            for url, targets in zip(self._id_to_url, self._adj, strict=True)
+            if targets
+        )
+        return heapq.nlargest(top_n, hubs, key=itemgetter(1))
 
     def get_authority_pages(self, top_n: int = 10) -> list[tuple[str, int]]:
         """
@@ -151,14 +394,19 @@ class LinkGraph:
         Returns:
             List of (URL, inbound_count) tuples
         """
-        authorities = [(url, len(sources)) for url, sources in self.backlinks.items()]
-        authorities.sort(key=lambda x: x[1], reverse=True)
-        return authorities[:top_n]
+        authorities = (
+            (url, len(sources))
+            for url, sources in zip(self._id_to_url, self._radj, strict=True)
+            if sources
+        )
+        return heapq.nlargest(top_n, authorities, key=itemgetter(1))
 
 
 class LinkChecker:
     """Check links for various issues."""
 
+    __slots__ = ("base_url", "_base_netloc", "link_graph", "_start_url")
+
     def __init__(self, base_url: str):
         """
         Initialize link checker.
@@ -167,53 +415,63 @@ class LinkChecker:
             base_url: Base URL of the website
         """
         self.base_url = base_url
+        self._base_netloc = urlparse(base_url).netloc.lower()
         self.link_graph = LinkGraph()
+        self._start_url: str | None = None  # first page ingested, assumed homepage
 
-    def analyze_internal_linking(
-        self, pages_data: list[dict[str, any]]
-    ) -> list[Issue]:
+    def ingest(self, page: dict[str, Any]) -> None:
         """
-        Analyze internal linking structure.
+        Add one page and its internal links to the link graph.
+
+        Pages can be ingested as they are crawled; the graph's cached depths
+        and orphans are invalidated by the change and rebuilt on ``analyze``.
 
         Args:
-            pages_data: List of page data dictionaries with URLs and links
+            page: Page data dictionary with ``url`` and ``internal_links``
+        """
+        url = page.get("url")
+        if not url:
+            return
+        if self._start_url is None:
+            self._start_url = url
+
+        self.link_graph.add_page(url)
+
+        for link_data in page.get("internal_links", ()):
+            target = link_data.get("url")
+            if not target:
+                continue
+            anchor = link_data.get("anchor_text", "")
+            self.link_graph.add_link(url, target, anchor)
+
+    def analyze(self) -> list[Issue]:
+        """
+        Report orphan and overly deep pages for everything ingested so far.
 
         Returns:
             List of internal linking issues
         """
         issues = []
 
-        # Build link graph
-        for page in pages_data:
-            url = page.get("url")
-            internal_links = page.get("internal_links", [])
-
-            self.link_graph.add_page(url)
-
-            for link_data in internal_links:
-                target = link_data.get("url")
-                anchor = link_data.get("anchor_text", "")
-                self.link_graph.add_link(url, target, anchor)
-
-        # Find orphan pages
-        orphans = self.link_graph.get_orphan_pages()
-        if len(orphans) > 1:  # More than just the homepage
-            for orphan in orphans[:10]:  # Sample first 10
-                issues.append(
-                    Issue(
-                        url=orphan,
-                        type="orphan_page",
-                        severity="medium",
-                        detail="Page has no internal links pointing to it (orphan page)",
-                    )
+        # Find orphan pages, sampling the first 10 besides the homepage
+        exclude = {self._start_url} if self._start_url is not None else None
+        for orphan in self.link_graph.iter_orphans(limit=10, exclude=exclude):
+            issues.append(
+                Issue(
+                    url=orphan,
+                    type="orphan_page",
+                    severity="medium",
+                    detail="Page has no internal links pointing to it (orphan page)",
                 )
+            )
 
         # Find pages too deep in site structure
-        if pages_data:
-            start_url = pages_data[0].get("url")  # Assume first is homepage
-            deep_pages = self.link_graph.get_pages_beyond_depth(start_url, max_depth=3)
+        if self._start_url is not None:
+            deep_pages = self.link_graph.get_pages_beyond_depth(
+                self._start_url, max_depth=3, limit=10  # Sample first 10
+            )
 
-            for deep_page in deep_pages[:10]:  # Sample first 10
+            for deep_page in deep_pages:
                 issues.append(
                     Issue(
                         url=deep_page,
@@ -225,10 +483,29 @@ class LinkChecker:
 
         return issues
 
+    def analyze_internal_linking(
+        self, pages_data: list[dict[str, Any]]
+    ) -> list[Issue]:
+        """
+        Analyze internal linking structure.
+
+        Args:
+            pages_data: List of page data dictionaries with URLs and links
+
+        Returns:
+            List of internal linking issues
+        """
+        for page in pages_data:
+            self.ingest(page)
+        return self.analyze()
+
     def check_anchor_text(self, links: list[dict[str, str]], url: str) -> list[Issue]:
         """
         Check anchor text quality.
 
+        Empty and generic anchors are reported once per page (and per generic
+        phrase) with an occurrence count, rather than once per link.
+
         Args:
             links: List of link dictionaries
             url: URL of the page containing the links
@@ -237,6 +514,9 @@ class LinkChecker:
             List of anchor text issues
         """
         issues = []
+        empty_targets: list[str] = []
+        generic_hits: dict[str, list[str]] = {}  # lowercased anchor -> link targets
+        generic_labels: dict[str, str] = {}  # lowercased anchor -> first spelling seen
 
         for link in links:
             anchor = link.get("anchor_text", "").strip()
@@ -244,34 +524,13 @@ class LinkChecker:
 
             # Check for empty anchor text
             if not anchor:
-                issues.append(
-                    Issue(
-                        url=url,
-                        type="empty_anchor_text",
-                        severity="low",
-                        detail=f"Link to {target} has no anchor text",
-                    )
-                )
+                empty_targets.append(target)
 
             # Check for generic anchor text
-            generic_anchors = [
-                "click here",
-                "read more",
-                "learn more",
-                "here",
-                "this",
-                "link",
-                "more",
-            ]
-            if anchor.lower() in generic_anchors:
-                issues.append(
-                    Issue(
-                        url=url,
-                        type="generic_anchor_text",
-                        severity="low",
-                        detail=f"Generic anchor text '{anchor}' on link to {target}",
-                    )
-                )
+            key = anchor.lower()
+            if key in _GENERIC_ANCHORS:
+                generic_hits.setdefault(key, []).append(target)
+                generic_labels.setdefault(key, anchor)
 
             # Check for over-optimized anchor text (all caps)
             if anchor.isupper() and len(anchor) > 3:
@@ -284,10 +543,35 @@ class LinkChecker:
                     )
                 )
 
+        if empty_targets:
+            if len(empty_targets) == 1:
+                detail = f"Link to {empty_targets[0]} has no anchor text"
+            else:
+                detail = (
+                    f"{len(empty_targets)} links have no anchor text "
+                    f"(examples: {', '.join(empty_targets[:3])})"
+                )
+            issues.append(
+                Issue(url=url, type="empty_anchor_text", severity="low", detail=detail)
+            )
+
+        for key, targets in generic_hits.items():
+            label = generic_labels[key]
+            if len(targets) == 1:
+                detail = f"Generic anchor text '{label}' on link to {targets[0]}"
+            else:
+                detail = (
+                    f"Generic anchor text '{label}' used {len(targets)} times on page "
+                    f"(examples: {', '.join(targets[:3])})"
+                )
+            issues.append(
+                Issue(url=url, type="generic_anchor_text", severity="low", detail=detail)
+            )
+
         return issues
 
     def check_link_attributes(
-        self, links: list[dict[str, any]], url: str
+        self, links: list[dict[str, Any]], url: str
     ) -> list[Issue]:
         """
         Check link attributes like rel, target, etc.
@@ -306,8 +590,9 @@ class LinkChecker:
             target = link.get("target")
             href = link.get("url", "")
 
-            # Check external links for nofollow
-            if not href.startswith(self.base_url):
+            # Check external links for nofollow; relative links have no netloc
+            netloc = urlparse(href).netloc.lower()
+            if netloc and netloc != self._base_netloc:
                 if "nofollow" not in rel:
                     # This is informational - not always an issue
                     pass  # External links don't always need nofollow
@@ -341,7 +626,8 @@ async def check_redirect_chains(
         List of redirect issues
     """
     issues = []
-    visited = []
+    visited = []  # (url, status) in hop order, for reporting
+    visited_urls: set[str] = set()  # same URLs, for O(1) loop detection
 
     try:
         # Manually follow redirects to track the chain
@@ -349,10 +635,14 @@ async def check_redirect_chains(
         redirect_count = 0
 
         while redirect_count < max_redirects:
-            response = await client.get(
-                current_url, follow_redirects=False, timeout=10.0
-            )
+            # HEAD skips downloading bodies we never read. Servers that mishandle
+            # it answer with assorted errors (400, 403, 405, 501...), so any
+            # error status is confirmed with GET before it is trusted.
+            response = await client.head(current_url, follow_redirects=False, timeout=10.0)
+            if response.status_code >= 400:
+                response = await client.get(current_url, follow_redirects=False, timeout=10.0)
             visited.append((current_url, response.status_code))
+            visited_urls.add(current_url)
 
             if response.status_code in (301, 302, 303, 307, 308):
                 redirect_count += 1
@@ -370,12 +660,10 @@ async def check_redirect_chains(
                     break
 
                 # Make location absolute
-                from urllib.parse import urljoin
-
                 next_url = urljoin(current_url, location)
 
                 # Check for redirect loop
-                if next_url in [v[0] for v in visited]:
+                if next_url in visited_urls:
                     issues.append(
                         Issue(
                             url=url,
@@ -422,7 +710,7 @@ async def check_redirect_chains(
     return issues
 
 
-def analyze_link_distribution(pages_data: list[dict[str, any]]) -> dict[str, any]:
+def analyze_link_distribution(pages_data: list[dict[str, Any]]) -> dict[str, Any]:
     """
     Analyze the distribution of internal links across pages.
 
@@ -435,14 +723,17 @@ def analyze_link_distribution(pages_data: list[dict[str, any]]) -> dict[str, any
     if not pages_data:
         return {}
 
-    outbound_counts = [len(page.get("internal_links", [])) for page in pages_data]
+    outbound_counts = np.fromiter(
+        (len(page.get("internal_links", ())) for page in pages_data),
+        dtype=np.int32,
+        count=len(pages_data),
+    )
 
+    # Reductions run in C; results are cast back to Python numbers for JSON
     return {
         "total_pages": len(pages_data),
-        "avg_internal_links": sum(outbound_counts) / len(outbound_counts)
-        if outbound_counts
-        else 0,
-        "max_internal_links": max(outbound_counts) if outbound_counts else 0,
-        "min_internal_links": min(outbound_counts) if outbound_counts else 0,
-        "pages_with_no_internal_links": sum(1 for count in outbound_counts if count == 0),
+        "avg_internal_links": int(outbound_counts.sum()) / outbound_counts.size,
+        "max_internal_links": int(outbound_counts.max()),
+        "min_internal_links": int(outbound_counts.min()),
+        "pages_with_no_internal_links": int(np.count_nonzero(outbound_counts == 0)),
     }
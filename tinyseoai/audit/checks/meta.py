@@ -1,16 +1,40 @@
 """
 Meta tag validation including Open Graph, Twitter Cards, and other social meta tags.
 """
+
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
+import re
+from collections.abc import Mapping
+from typing import Any
 
 from ...data.models import Issue
+from ...utils.html import parse_html
+
+# Recommended viewport settings, found in one scan of the lowercased content
+_VIEWPORT_RE = re.compile(r"width=device-width|initial-scale=1")
+
+
+def _has_rel(attrs: Mapping[str, str], value: str) -> bool:
+    """Whether a link's rel attribute is, or contains the token, ``value``."""
+    rel = attrs.get("rel") or ""
+    return rel == value or value in rel.split()
 
 
 class MetaTagChecker:
     """Check and validate meta tags for SEO and social sharing."""
 
+    __slots__ = (
+        "html",
+        "url",
+        "tree",
+        "_metas",
+        "_meta_by_property",
+        "_meta_by_name",
+        "_links",
+        "_html_attrs",
+    )
+
     def __init__(self, html: str, url: str):
         """
         Initialize the meta tag checker.
@@ -21,7 +45,38 @@ class MetaTagChecker:
         """
         self.html = html
         self.url = url
-        self.soup = BeautifulSoup(html, "lxml")
+        self.tree = parse_html(html)
+        self._index_tags()
+
+    def _index_tags(self) -> None:
+        """
+        Collect <meta>, <link> and <html> attributes in a single traversal.
+
+        Checks then use dict lookups instead of each re-walking the tree. Keyed
+        lookups keep the first tag in document order.
+        """
+        self._metas: list[Mapping[str, str]] = []
+        self._meta_by_property: dict[str, Mapping[str, str]] = {}
+        self._meta_by_name: dict[str, Mapping[str, str]] = {}
+        self._links: list[tuple[str, Mapping[str, str]]] = []  # (lowercased rel, attrs)
+        self._html_attrs: Mapping[str, str] = {}
+
+        if self.tree is None:
+            return
+
+        for tag in self.tree.iter("meta", "link"):
+            attrs = tag.attrib
+            if tag.tag == "meta":
+                self._metas.append(attrs)
+                if (prop := attrs.get("property")) is not None:
+                    self._meta_by_property.setdefault(prop, attrs)
+                if (name := attrs.get("name")) is not None:
+                    self._meta_by_name.setdefault(name, attrs)
+            else:
+                self._links.append(((attrs.get("rel") or "").lower(), attrs))
+
+        if self.tree.tag == "html":
+            self._html_attrs = self.tree.attrib
 
     def check_all(self) -> list[Issue]:
         """
@@ -51,11 +106,11 @@ class MetaTagChecker:
         issues = []
 
         # These are checked in the main crawler, but we can add validation
-        charset = self.soup.find("meta", attrs={"charset": True})
+        charset = any(attrs.get("charset") is not None for attrs in self._metas)
         if not charset:
             # Check for http-equiv charset
-            http_equiv_charset = self.soup.find(
-                "meta", attrs={"http-equiv": "Content-Type"}
+            http_equiv_charset = any(
+                attrs.get("http-equiv") == "Content-Type" for attrs in self._metas
             )
             if not http_equiv_charset:
                 issues.append(
@@ -78,6 +133,11 @@ class MetaTagChecker:
         """
         issues = []
 
+        # Every og:* tag (first occurrence), collected once for all checks below
+        og = {
+            prop: attrs for prop, attrs in self._meta_by_property.items() if prop.startswith("og:")
+        }
+
         # Required OG tags
         required_og_tags = {
             "og:title": "Open Graph title",
@@ -94,7 +154,7 @@ class MetaTagChecker:
 
         # Check required tags
         for property_name, display_name in required_og_tags.items():
-            og_tag = self.soup.find("meta", property=property_name)
+            og_tag = og.get(property_name)
             if not og_tag or not og_tag.get("content"):
                 issues.append(
                     Issue(
@@ -107,7 +167,7 @@ class MetaTagChecker:
 
         # Check recommended tags
         for property_name, display_name in recommended_og_tags.items():
-            og_tag = self.soup.find("meta", property=property_name)
+            og_tag = og.get(property_name)
             if not og_tag or not og_tag.get("content"):
                 issues.append(
                     Issue(
@@ -119,9 +179,8 @@ class MetaTagChecker:
                 )
 
         # Validate OG image
-        og_image = self.soup.find("meta", property="og:image")
-        if og_image and og_image.get("content"):
-            image_url = og_image.get("content")
+        og_image = og.get("og:image")
+        if og_image and (image_url := og_image.get("content")):
 
             # Check if image URL is absolute
             if not image_url.startswith(("http://", "https://")):
@@ -135,10 +194,7 @@ class MetaTagChecker:
                 )
 
             # Check for OG image dimensions
-            og_image_width = self.soup.find("meta", property="og:image:width")
-            og_image_height = self.soup.find("meta", property="og:image:height")
-
-            if not og_image_width or not og_image_height:
+            if "og:image:width" not in og or "og:image:height" not in og:
                 issues.append(
                     Issue(
                         url=self.url,
@@ -159,7 +215,12 @@ class MetaTagChecker:
         """
         issues = []
 
-        twitter_card = self.soup.find("meta", attrs={"name": "twitter:card"})
+        # Every twitter:* tag by name (first occurrence)
+        tw = {
+            name: attrs for name, attrs in self._meta_by_name.items() if name.startswith("twitter:")
+        }
+
+        twitter_card = tw.get("twitter:card")
 
         if not twitter_card or not twitter_card.get("content"):
             issues.append(
@@ -194,10 +255,8 @@ class MetaTagChecker:
 
             # Check for recommended Twitter tags based on card type
             if card_type in ["summary", "summary_large_image"]:
-                twitter_title = self.soup.find("meta", attrs={"name": "twitter:title"})
-                twitter_description = self.soup.find(
-                    "meta", attrs={"name": "twitter:description"}
-                )
+                twitter_title = tw.get("twitter:title")
+                twitter_description = tw.get("twitter:description")
 
                 if not twitter_title or not twitter_title.get("content"):
                     # Twitter falls back to OG tags, but explicit is better
@@ -222,9 +281,7 @@ class MetaTagChecker:
                     )
 
                 if card_type == "summary_large_image":
-                    twitter_image = self.soup.find(
-                        "meta", attrs={"name": "twitter:image"}
-                    )
+                    twitter_image = tw.get("twitter:image")
                     if not twitter_image or not twitter_image.get("content"):
                         issues.append(
                             Issue(
@@ -236,7 +293,7 @@ class MetaTagChecker:
                         )
 
         # Check for Twitter site/creator
-        twitter_site = self.soup.find("meta", attrs={"name": "twitter:site"})
+        twitter_site = tw.get("twitter:site")
         if not twitter_site or not twitter_site.get("content"):
             issues.append(
                 Issue(
@@ -263,14 +320,12 @@ class MetaTagChecker:
         favicon_found = False
 
         # Standard link rel="icon"
-        icon_link = self.soup.find("link", rel=lambda r: r and "icon" in r.lower())
+        icon_link = any("icon" in rel for rel, _attrs in self._links)
         if icon_link:
             favicon_found = True
 
         # Apple touch icon
-        apple_icon = self.soup.find(
-            "link", rel=lambda r: r and "apple-touch-icon" in r.lower()
-        )
+        apple_icon = any("apple-touch-icon" in rel for rel, _attrs in self._links)
 
         if not favicon_found:
             issues.append(
@@ -303,9 +358,7 @@ class MetaTagChecker:
         """
         issues = []
 
-        html_tag = self.soup.find("html")
-
-        if not html_tag or not html_tag.get("lang"):
+        if not self._html_attrs.get("lang"):
             issues.append(
                 Issue(
                     url=self.url,
@@ -317,13 +370,15 @@ class MetaTagChecker:
             )
 
         # Check for hreflang tags (for international sites)
-        hreflang_tags = self.soup.find_all("link", rel="alternate", hreflang=True)
+        hreflang_tags = [
+            attrs
+            for _rel, attrs in self._links
+            if attrs.get("hreflang") is not None and _has_rel(attrs, "alternate")
+        ]
 
         if len(hreflang_tags) > 0:
             # If using hreflang, should have x-default
-            has_x_default = any(
-                tag.get("hreflang") == "x-default" for tag in hreflang_tags
-            )
+            has_x_default = any(tag.get("hreflang") == "x-default" for tag in hreflang_tags)
 
             if not has_x_default:
                 issues.append(
@@ -346,7 +401,7 @@ class MetaTagChecker:
         """
         issues = []
 
-        viewport = self.soup.find("meta", attrs={"name": "viewport"})
+        viewport = self._meta_by_name.get("viewport")
 
         if not viewport or not viewport.get("content"):
             issues.append(
@@ -358,10 +413,10 @@ class MetaTagChecker:
                 )
             )
         else:
-            content = viewport.get("content", "").lower()
+            settings = set(_VIEWPORT_RE.findall(viewport.get("content", "").lower()))
 
             # Check for recommended viewport settings
-            if "width=device-width" not in content:
+            if "width=device-width" not in settings:
                 issues.append(
                     Issue(
                         url=self.url,
@@ -371,7 +426,7 @@ class MetaTagChecker:
                     )
                 )
 
-            if "initial-scale=1" not in content:
+            if "initial-scale=1" not in settings:
                 issues.append(
                     Issue(
                         url=self.url,
@@ -383,21 +438,28 @@ class MetaTagChecker:
 
         return issues
 
-    def get_meta_summary(self) -> dict[str, any]:
+    def get_meta_summary(self) -> dict[str, Any]:
         """
         Get a summary of all meta tags found.
 
         Returns:
             Dictionary with meta tag summary
         """
+        og_tags_count = sum(
+            1 for attrs in self._metas if (attrs.get("property") or "").startswith("og:")
+        )
+        twitter_tags_count = sum(
+            1 for attrs in self._metas if (attrs.get("name") or "").startswith("twitter:")
+        )
+
         summary = {
-            "has_og_tags": bool(self.soup.find("meta", property=lambda p: p and p.startswith("og:"))),
-            "has_twitter_cards": bool(self.soup.find("meta", attrs={"name": lambda n: n and n.startswith("twitter:")})),
-            "has_favicon": bool(self.soup.find("link", rel=lambda r: r and "icon" in r.lower())),
-            "has_viewport": bool(self.soup.find("meta", attrs={"name": "viewport"})),
-            "has_lang": bool(self.soup.find("html", lang=True)),
-            "og_tags_count": len(self.soup.find_all("meta", property=lambda p: p and p.startswith("og:"))),
-            "twitter_tags_count": len(self.soup.find_all("meta", attrs={"name": lambda n: n and n.startswith("twitter:")})),
+            "has_og_tags": og_tags_count > 0,
+            "has_twitter_cards": twitter_tags_count > 0,
+            "has_favicon": any("icon" in rel for rel, _attrs in self._links),
+            "has_viewport": "viewport" in self._meta_by_name,
+            "has_lang": self._html_attrs.get("lang") is not None,
+            "og_tags_count": og_tags_count,
+            "twitter_tags_count": twitter_tags_count,
         }
 
         return summary
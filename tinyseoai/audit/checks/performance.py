@@ -4,11 +4,29 @@ Performance checks for page speed optimization and Core Web Vitals indicators.
 from __future__ import annotations
 
 import re
+from functools import cached_property
+from typing import Any
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import Tag
 
 from ...data.models import Issue
+from ...utils.html import get_soup
+
+# Resource tags the checks inspect, gathered in one traversal of the soup
+_RESOURCE_TAGS = ("img", "link", "script")
+_MODERN_IMAGE_RE = re.compile(r"\.(?:webp|avif)")
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _has_rel(tag: Tag, value: str) -> bool:
+    """Match ``find_all(rel=value)``: any rel token, or the joined value, equals it."""
+    rel = tag.attrs.get("rel")
+    if not rel:
+        return False
+    if isinstance(rel, str):
+        return rel == value
+    return value in rel or " ".join(rel) == value
 
 
 class PerformanceChecker:
@@ -25,9 +43,27 @@ class PerformanceChecker:
         """
         self.html = html
         self.url = url
-        self.soup = BeautifulSoup(html, "lxml")
+        self.soup = get_soup(html)  # shared with the page's other checkers; read-only
         self.headers = response_headers or {}
 
+    @cached_property
+    def _resources(self) -> dict[str, list[Tag]]:
+        """<img>, <link> and <script> tags by name, in document order."""
+        resources: dict[str, list[Tag]] = {name: [] for name in _RESOURCE_TAGS}
+        for tag in self.soup.find_all(_RESOURCE_TAGS):
+            resources[tag.name].append(tag)
+        return resources
+
+    @cached_property
+    def _stylesheets(self) -> list[Tag]:
+        """<link rel="stylesheet"> tags."""
+        return [link for link in self._resources["link"] if _has_rel(link, "stylesheet")]
+
+    @cached_property
+    def _external_scripts(self) -> list[Tag]:
+        """<script src> tags."""
+        return [script for script in self._resources["script"] if "src" in script.attrs]
+
     def check_all(self) -> list[Issue]:
         """
         Run all performance checks.
@@ -55,27 +91,26 @@ class PerformanceChecker:
         """
         issues = []
 
-        images = self.soup.find_all("img")
-
         # Check for images without width/height (causes layout shift)
         images_without_dimensions = 0
         images_without_lazy_loading = 0
         images_without_modern_format = 0
 
-        for img in images:
-            src = img.get("src", "")
+        for img in self._resources["img"]:
+            attrs = img.attrs
+            src = attrs.get("src", "")
 
             # Check for dimensions
-            if not img.get("width") or not img.get("height"):
+            if not attrs.get("width") or not attrs.get("height"):
                 images_without_dimensions += 1
 
-            # Check for lazy loading
-            loading = img.get("loading", "").lower()
-            if loading != "lazy" and not img.get("data-src"):  # data-src indicates JS lazy loading
+            # Check for lazy loading (data-src indicates JS lazy loading)
+            loading = str(attrs.get("loading", "")).lower()
+            if loading != "lazy" and not attrs.get("data-src"):
                 images_without_lazy_loading += 1
 
             # Check for modern image formats
-            if src and not any(ext in src.lower() for ext in [".webp", ".avif"]):
+            if src and not _MODERN_IMAGE_RE.search(str(src).lower()):
                 images_without_modern_format += 1
 
         if images_without_dimensions > 0:
@@ -123,11 +158,10 @@ class PerformanceChecker:
         issues = []
 
         # Check CSS
-        css_links = self.soup.find_all("link", rel="stylesheet")
         blocking_css = 0
 
-        for link in css_links:
-            media = link.get("media", "all")
+        for link in self._stylesheets:
+            media = link.attrs.get("media", "all")
             # CSS is render-blocking unless it has media query
             if media == "all" or not media:
                 blocking_css += 1
@@ -143,16 +177,17 @@ class PerformanceChecker:
                 )
             )
 
-        # Check JavaScript
-        scripts = self.soup.find_all("script", src=True)
+        # Check JavaScript; only scripts in <head> block rendering, so search
+        # that subtree instead of walking up from every script
+        head = self.soup.head
+        head_scripts = head.find_all("script", src=True) if head is not None else []
         blocking_scripts = 0
 
-        for script in scripts:
+        for script in head_scripts:
             # Scripts are render-blocking unless they have async or defer
-            if not script.get("async") and not script.get("defer"):
-                # Check if it's in <head>
-                if script.find_parent("head"):
-                    blocking_scripts += 1
+            attrs = script.attrs
+            if not attrs.get("async") and not attrs.get("defer"):
+                blocking_scripts += 1
 
         if blocking_scripts > 0:
             issues.append(
@@ -242,7 +277,7 @@ class PerformanceChecker:
                 )
 
             # Check for short cache duration
-            max_age_match = re.search(r"max-age=(\d+)", cache_control)
+            max_age_match = _MAX_AGE_RE.search(cache_control)
             if max_age_match:
                 max_age = int(max_age_match.group(1))
                 if max_age < 3600:  # Less than 1 hour
@@ -302,8 +337,8 @@ class PerformanceChecker:
             )
 
         # Count external resources
-        external_css = len(self.soup.find_all("link", rel="stylesheet"))
-        external_js = len(self.soup.find_all("script", src=True))
+        external_css = len(self._stylesheets)
+        external_js = len(self._external_scripts)
 
         if external_css > 5:
             issues.append(
@@ -342,14 +377,14 @@ class PerformanceChecker:
 
         for tag in self.soup.find_all(["link", "script", "img"], src=True):
             src = tag.get("src") or tag.get("href", "")
-            if src.startswith("http"):
+            if isinstance(src, str) and src.startswith("http"):
                 domain = urlparse(src).netloc
                 if domain and domain != urlparse(self.url).netloc:
                     external_domains.add(domain)
 
         # Check for preconnect hints
         preconnects = self.soup.find_all("link", rel="preconnect")
-        preconnect_domains = {urlparse(link.get("href", "")).netloc for link in preconnects}
+        preconnect_domains = {urlparse(str(link.get("href", ""))).netloc for link in preconnects}
 
         # Find domains that could benefit from preconnect
         missing_preconnect = external_domains - preconnect_domains
@@ -368,7 +403,7 @@ class PerformanceChecker:
 
         return issues
 
-    def get_performance_metrics(self) -> dict[str, any]:
+    def get_performance_metrics(self) -> dict[str, Any]:
         """
         Get performance-related metrics.
 
@@ -3,6 +3,7 @@ Security checks for HTTPS, headers, and SSL validation.
 """
 from __future__ import annotations
 
+import re
 from urllib.parse import urlparse
 
 import httpx
@@ -10,6 +11,9 @@ from loguru import logger
 
 from ...data.models import Issue
 
+# HTTP URLs in common resource attributes, i.e. mixed content on HTTPS pages
+_HTTP_URL_RE = re.compile(r'(?:src|href|data|action)=["\']http://[^"\']+["\']', re.IGNORECASE)
+
 
 class SecurityChecker:
     """Perform security-related SEO checks."""
@@ -194,14 +198,7 @@ class SecurityChecker:
             return issues  # Only relevant for HTTPS sites
 
         # Check for HTTP resources in HTML
-        import re
-
-        # Pattern to find HTTP URLs in common attributes
-        http_pattern = re.compile(
-            r'(?:src|href|data|action)=["\']http://[^"\']+["\']', re.IGNORECASE
-        )
-
-        matches = http_pattern.findall(html)
+        matches = _HTTP_URL_RE.findall(html)
 
         if matches:
             # Sample a few for the detail
@@ -7,10 +7,13 @@ import re
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
 
+from ..utils.html import get_soup
 from ..utils.url import normalize_url
 
+# Matches a meta name of "robots" in any case
+_ROBOTS_RE = re.compile(r"^robots$", re.I)
+
 
 async def fetch_page(
     client: httpx.AsyncClient, url: str
@@ -63,7 +66,7 @@ def extract_links(html: str, base: str) -> set[str]:
     Returns:
         Set of normalized absolute URLs
     """
-    soup = BeautifulSoup(html, "lxml")
+    soup = get_soup(html)
     links: set[str] = set()
 
     for anchor in soup.find_all("a", href=True):
@@ -90,7 +93,7 @@ def extract_meta(html: str) -> tuple[str | None, str | None, bool]:
     Returns:
         Tuple of (title, meta_description, noindex_flag)
     """
-    soup = BeautifulSoup(html, "lxml")
+    soup = get_soup(html)
 
     # Extract title
     title = None
@@ -105,7 +108,7 @@ def extract_meta(html: str) -> tuple[str | None, str | None, bool]:
 
     # Check for noindex directive
     noindex = False
-    robots_tag = soup.find("meta", attrs={"name": re.compile(r"^robots$", re.I)})
+    robots_tag = soup.find("meta", attrs={"name": _ROBOTS_RE})
     if robots_tag and robots_tag.get("content"):
         content = robots_tag["content"].lower()
         if "noindex" in content:
@@ -8,9 +8,9 @@ from datetime import datetime
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 
 from ..data.models import AuditResult, Issue
+from ..utils.html import get_soup
 from ..utils.url import normalize_url, same_host
 from .crawler import extract_links, extract_meta, fetch_page
 
@@ -121,7 +121,7 @@ async def audit_site(seed_url: str, max_pages: int = DEFAULT_MAX_PAGES) -> Audit
 
                 # Image alt checks (missing or empty)
                 try:
-                    soup = BeautifulSoup(html, "lxml")
+                    soup = get_soup(html)
                     for img in soup.find_all("img"):
                         alt = (img.get("alt") or "").strip()
                         src = (img.get("src") or "").strip()
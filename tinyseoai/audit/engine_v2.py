@@ -398,22 +398,17 @@ async def _run_post_crawl_checks(
         # Link graph analysis
         link_checker = LinkChecker(seed_url)
 
-        # Build page data for link analysis
-        pages_data = []
+        # Feed each page's links into the graph as they are extracted
         for page in pages:
             if page.html:
                 parser = HTMLParser(page.html, page.url)
                 page.internal_links = parser.content_parser.extract_internal_links(seed_url)
                 page.external_links = parser.content_parser.extract_external_links(seed_url)
 
-                pages_data.append({
-                    "url": page.url,
-                    "internal_links": page.internal_links,
-                    "external_links": page.external_links,
-                })
+                link_checker.ingest({"url": page.url, "internal_links": page.internal_links})
 
         # Analyze internal linking
-        link_issues = link_checker.analyze_internal_linking(pages_data)
+        link_issues = link_checker.analyze()
         issues.extend(link_issues)
 
     except Exception as e:
@@ -373,6 +373,8 @@ def config(
     """
     cfg = get_config()
     if plan:
+        # get_config() is shared for the process; save an edited copy
+        cfg = cfg.model_copy()
         cfg.plan = plan
         save_config(cfg)
     if show or plan:
@@ -398,6 +400,9 @@ def doctor():
 def explain(
     json_report: Path = typer.Argument(..., help="Path to a previous summary.json"),
     out: Path = typer.Option(None, "--out", "-o", help="Output file (default: alongside input)"),
+    cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse a cached summary of an unchanged report"
+    ),
 ):
     """
     Use OpenAI to produce an executive summary & recommended actions
@@ -416,7 +421,7 @@ def explain(
         raise typer.Exit(code=2)
 
     try:
-        ai = summarize_with_ai(result)
+        ai = summarize_with_ai(result, use_cache=cache)
     except Exception as e:
         console.print(f"[red]AI summary failed:[/] {e}")
         raise typer.Exit(code=1)
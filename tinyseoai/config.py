@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -30,6 +31,7 @@ class AppConfig(BaseModel):
     openai_model_free: str = "gpt-4o-mini"
     openai_model_premium: str = "gpt-5"
     max_output_tokens: int = 800
+    cache_ai_summaries: bool = True  # reuse on-disk summaries of unchanged audits
     brand: BrandConfig = Field(default_factory=BrandConfig)
 
     # AI Agent API Keys (loaded from .env file or environment variables)
@@ -55,10 +57,16 @@ def _cfg_path() -> Path:
     return cfg_dir / "config.json"
 
 
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
     """
     Load application configuration from disk or create default.
 
+    The result is cached and shared for the process; treat it as read-only and
+    call .model_copy() before changing it. save_config() invalidates the cache,
+    and get_config.cache_clear() forces a reload after the file or environment
+    changes mid-process.
+
     BUGFIX: Improved exception handling and logging.
     See: BUGFIXES.md #4
     """
@@ -105,6 +113,7 @@ def save_config(cfg: AppConfig) -> None:
         os.close(fd)
         # Atomic rename (POSIX guarantees atomicity)
         os.replace(temp_path, p)
+        get_config.cache_clear()
     except Exception:
         # Clean up temp file on error
         try:
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+# Checkers parse one page at a time, so only the current page (plus a few
+# interleaved crawl tasks) needs its tree kept alive; whole trees are large
+SOUP_CACHE_MAXSIZE = 4
+
+# huge_tree raises libxml2's nesting limit from 256 to 2048 levels; past the
+# limit it stops building the tree and drops the rest of the page
+_HTML_PARSER = lxml.html.HTMLParser(huge_tree=True)
+# Decodes the UTF-8 bytes parse_html falls back to, overriding any declared encoding
+_UTF8_PARSER = lxml.html.HTMLParser(encoding="utf-8", huge_tree=True)
+_DEPTH_ERROR = "Excessive depth in document"
+
+
+@lru_cache(maxsize=SOUP_CACHE_MAXSIZE)
+def get_soup(html: str) -> BeautifulSoup:
+    """
+    Parse HTML with lxml once and share the tree between read-only checkers.
+
+    Checks on the same page (indexability, pagination, ...) receive the same
+    BeautifulSoup object, so callers must not modify it (no decompose/extract);
+    take a private BeautifulSoup(html, "lxml") when mutation is needed.
+
+    Args:
+        html: HTML content of the page
+
+    Returns:
+        Parsed document, cached for the most recent SOUP_CACHE_MAXSIZE pages
+    """
+    return BeautifulSoup(html, "lxml")
+
+
+def parse_html(html: str) -> lxml.html.HtmlElement | None:
+    """
+    Parse HTML into an lxml document for checks that walk the tree directly.
+
+    lxml rejects str input that starts with an XML declaration naming an
+    encoding (common on XHTML pages), so such pages are re-parsed as UTF-8
+    bytes. Pages nested deeper than libxml2 builds trees for (unclosed
+    <font>/<div> soup) are rebuilt from parser events, like BeautifulSoup
+    does, so no content is lost. The result is private to the caller and
+    never cached.
+
+    Args:
+        html: HTML content of the page
+
+    Returns:
+        Root <html> element, or None when there is no document
+    """
+    if not html.strip():
+        return None
+    try:
+        try:
+            return _parse_document(html, _HTML_PARSER)
+        except ValueError:
+            return _parse_document(html.encode("utf-8"), _UTF8_PARSER, encoding="utf-8")
+    except etree.ParserError:
+        return None
+
+
+def _parse_document(
+    html: str | bytes, parser: lxml.html.HTMLParser, encoding: str | None = None
+) -> lxml.html.HtmlElement:
+    """Parse with ``parser``, re-parsing through a TreeBuilder if the tree was cut short."""
+    root = lxml.html.document_fromstring(html, parser=parser)
+    if not any(error.message.startswith(_DEPTH_ERROR) for error in parser.error_log):
+        return root
+    # The depth limit only applies to libxml2's own tree; building from SAX
+    # events has none, at the cost of a Python call per tag
+    builder = etree.TreeBuilder(parser=_HTML_PARSER)
+    return lxml.html.document_fromstring(
+        html, parser=lxml.html.HTMLParser(encoding=encoding, target=builder)
+    )
@@ -2,11 +2,23 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
 
 
 def ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
+
 def write_json(path: Path, data) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(data, indent=2))
+
+
+def dumps_compact(data: Any, *, ensure_ascii: bool = True) -> str:
+    """
+    Serialize to JSON without whitespace; for payloads consumed by code or LLMs.
+
+    Values JSON cannot represent (datetimes, enums, ...) are written as str().
+    Pass ensure_ascii=False to keep non-ASCII text as-is instead of escaping it.
+    """
+    return json.dumps(data, ensure_ascii=ensure_ascii, separators=(",", ":"), default=str)